@@ -0,0 +1,103 @@
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import torch
+from transformers import pipeline
+
+from src import logger
+from src.pipeline.data_preprocessing_components.component_sources import (
+    OnnxRelevanceClassifier,
+    RelevanceClassifierRegistry,
+    TorchRelevanceClassifier,
+)
+from src.pipeline.data_preprocessing_components.data_preprocessing_component import DataPreprocessingComponent
+from src.pipeline.data_preprocessing_components.interfaces import IRelevanceClassifier
+
+_POSITIONS = ["Python-разработчик", "Data Engineer", "ML Engineer", "Backend developer", "Аналитик данных"]
+_TITLES = [
+    "Python-разработчик",
+    "Senior Python developer",
+    "Разработчик",
+    "Инженер данных",
+    "Data Scientist",
+    "Бухгалтер",
+    "Менеджер по продажам",
+    "Ведущий инженер-программист Python/Django, микросервисы, высоконагруженные системы",
+    "Водитель",
+    "Аналитик",
+    "Backend-разработчик (Go, Python)",
+    "Специалист по машинному обучению и компьютерному зрению",
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Скорость zero-shot классификации: построчно и пакетами")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="Размеры выборки")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument(
+        "--baseline-rows", type=int, default=500, help="Сколько строк прогнать построчно - весь объём слишком долгий"
+    )
+    parser.add_argument("--threshold", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--backends", nargs="+", default=["torch"], choices=["torch", "onnx", "onnx-int8"], help="Сравниваемые бэкенды"
+    )
+    parser.add_argument("--onnx-dir", type=Path, default=Path("model_sources/onnx/deberta-v3-xsmall-zeroshot"))
+    parser.add_argument("--snapshots-dir", type=Path, default=Path("model_sources/huggingface"))
+    return parser.parse_args()
+
+
+def build_pairs(rows: int, seed: int) -> Tuple[List[str], List[str]]:
+    rnd = random.Random(seed)
+    return [rnd.choice(_TITLES) for _ in range(rows)], [rnd.choice(_POSITIONS) for _ in range(rows)]
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model_name = DataPreprocessingComponent._CLASSIFIER_MODEL_NAME
+
+    model_path = RelevanceClassifierRegistry.get_local_snapshot(model_name, args.snapshots_dir)
+    baseline_pipeline = pipeline("zero-shot-classification", model=str(model_path), device=device)
+    classifiers: Dict[str, IRelevanceClassifier] = {}
+    for backend in args.backends:
+        if backend == "torch":
+            classifiers[backend] = TorchRelevanceClassifier(model_name, model_path, args.batch_size, device)
+        else:
+            classifiers[backend] = OnnxRelevanceClassifier(
+                model_name, model_path, args.batch_size, args.onnx_dir, quantize=backend == "onnx-int8"
+            )
+
+    texts, labels = build_pairs(args.baseline_rows, args.seed)
+    started = time.perf_counter()
+    baseline_scores = np.array(
+        [
+            baseline_pipeline(text, candidate_labels=[label], multi_label=False)["scores"][0]
+            for text, label in zip(texts, labels)
+        ]
+    )
+    baseline_rows_per_second = len(texts) / (time.perf_counter() - started)
+    logger.info(f"Построчно (до) | строк: {len(texts)} | строк/с: {baseline_rows_per_second:.1f}")
+
+    for backend, classifier in classifiers.items():
+        batched_scores = classifier.score(texts, labels)
+        max_difference = float(np.max(np.abs(batched_scores - baseline_scores)))
+        agreement = float(np.mean((batched_scores >= args.threshold) == (baseline_scores >= args.threshold)))
+        logger.info(
+            f"{backend} | расхождение оценок с построчным: до {max_difference:.2e}, совпадение маски: {agreement:.2%}"
+        )
+
+    for rows in args.rows:
+        texts, labels = build_pairs(rows, args.seed)
+        for backend, classifier in classifiers.items():
+            started = time.perf_counter()
+            classifier.score(texts, labels)
+            rows_per_second = rows / (time.perf_counter() - started)
+            logger.info(
+                f"{backend}, пакетами по {args.batch_size} | строк: {rows} | строк/с: {rows_per_second:.1f} | "
+                f"ускорение: {rows_per_second / baseline_rows_per_second:.1f}x"
+            )
@@ -0,0 +1,206 @@
+import argparse
+import resource
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import src.pipeline.data_extracting_components.get_data_from_superjob as superjob
+from src import logger
+from src.benchmarks.in_memory_data_controller import InMemoryDataController
+from src.benchmarks.superjob_stub_server import SuperjobStubServer
+from src.configuration.config_loaders import PipelineConfigLoader
+from src.entities.pipeline import PipelineConfiguration
+from src.entities.pipeline.component_properties import ExtractionStepProperties
+from src.enums import DatasetName
+from src.pipeline.data_extracting_components import DataExtractingComponent, ISourceConnector, SuperjobConnector
+from src.pipeline.data_extracting_components.component_sources import (
+    AdaptiveRateLimiter,
+    ExtractionTelemetry,
+    HttpResponse,
+    HttpTransport,
+)
+from src.utils.artifact_publication import LocalLogger
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон DataExtractingComponent на локальной заглушке")
+    parser.add_argument("--positions", nargs="+", default=["Data Engineer", "Data Scientist"], help="Позиции")
+    parser.add_argument("--pages", type=int, default=5, help="Страниц выдачи у каждой позиции")
+    parser.add_argument("--resumes-per-page", type=int, default=20, help="Резюме на странице выдачи")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Задержка ответа заглушки, мс")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Доля ответов заглушки с ошибкой")
+    parser.add_argument("--error-status", type=int, default=503, help="Код ответа с ошибкой")
+    parser.add_argument("--recorded-pages-dir", type=Path, default=None, help="Директория с записанными страницами")
+    parser.add_argument("--max-in-flight", type=int, default=16, help="Лимит одновременных запросов")
+    parser.add_argument("--max-per-host", type=int, default=8, help="Лимит одновременных запросов к хосту")
+    parser.add_argument("--parse-workers", type=int, default=None, help="Процессов разбора (по умолчанию - ядра)")
+    parser.add_argument("--listing-only", action="store_true", help="Брать данные из карточек выдачи")
+    parser.add_argument("--no-rate-limit", action="store_true", help="Отключить адаптивный ограничитель запросов")
+    return parser.parse_args()
+
+
+class _RecordingHttpTransport(HttpTransport):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._latencies_lock = threading.Lock()
+        self.latencies: List[float] = []
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        started = time.perf_counter()
+        response = super().get(url, headers)
+        with self._latencies_lock:
+            self.latencies.append(time.perf_counter() - started)
+
+        return response
+
+
+class _InstrumentedSuperjobConnector(SuperjobConnector):
+    http_transport: Optional[_RecordingHttpTransport] = None
+
+    def _create_http_transport(self) -> HttpTransport:
+        step_parameters = self._step_parameters
+        rate_limiter = (
+            AdaptiveRateLimiter(step_parameters.rate_limit, step_parameters.max_requests_per_host)
+            if step_parameters.rate_limit.enabled
+            else None
+        )
+        self.http_transport = _RecordingHttpTransport(
+            step_parameters.http_transport, rate_limiter=rate_limiter, telemetry=self._telemetry
+        )
+        return self.http_transport
+
+
+class _InstrumentedDataExtractingComponent(DataExtractingComponent):
+    connector: Optional[_InstrumentedSuperjobConnector] = None
+
+    def _create_connector(
+        self,
+        source: str,
+        step_parameters: ExtractionStepProperties,
+        telemetry: Optional[ExtractionTelemetry],
+    ) -> ISourceConnector:
+        self.connector = _InstrumentedSuperjobConnector(
+            step_parameters, self._get_datasets_dir(), self._get_parse_workers(step_parameters), telemetry
+        )
+        return self.connector
+
+
+@contextmanager
+def measure_parse_cpu() -> Iterator[Dict[str, float]]:
+    """
+    Подменяет разбор страниц поиска на время прогона и суммирует CPU-время потоков, в которых он выполнялся.
+    Страницы резюме разбираются в пуле процессов, их CPU-время берётся из getrusage завершившихся дочерних процессов.
+    """
+    totals = {"pages": 0.0, "cpu_seconds": 0.0, "pool_cpu_seconds": 0.0}
+    totals_lock = threading.Lock()
+    originals = {name: getattr(superjob, name) for name in ("parse_resume_cards",)}
+
+    def measured(parse: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args, **kwargs) -> Any:
+            started = time.thread_time()
+            try:
+                return parse(*args, **kwargs)
+            finally:
+                elapsed = time.thread_time() - started
+                with totals_lock:
+                    totals["pages"] += 1
+                    totals["cpu_seconds"] += elapsed
+
+        return wrapper
+
+    children_started = resource.getrusage(resource.RUSAGE_CHILDREN)
+    for name, parse in originals.items():
+        setattr(superjob, name, measured(parse))
+    try:
+        yield totals
+    finally:
+        for name, parse in originals.items():
+            setattr(superjob, name, parse)
+
+        children_finished = resource.getrusage(resource.RUSAGE_CHILDREN)
+        totals["pool_cpu_seconds"] = (
+            children_finished.ru_utime
+            - children_started.ru_utime
+            + children_finished.ru_stime
+            - children_started.ru_stime
+        )
+
+
+def percentile(values: List[float], share: float) -> float:
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+def build_config(args: argparse.Namespace, server: SuperjobStubServer) -> PipelineConfiguration:
+    config = PipelineConfigLoader().get_config()
+    step_parameters = config.components.extraction_step_properties
+    if step_parameters is None:
+        raise ValueError("В конфигурации нет параметров шага извлечения")
+
+    step_parameters.positions_to_extract = args.positions
+    step_parameters.search_url = server.search_base_url
+    step_parameters.resume_base_url = server.resume_base_url
+    step_parameters.default_pages_count = args.pages
+    step_parameters.pages_count_by_position = {}
+    step_parameters.max_in_flight_requests = args.max_in_flight
+    step_parameters.max_requests_per_host = args.max_per_host
+    step_parameters.parse_workers = args.parse_workers
+    step_parameters.http_cache.enabled = False
+    step_parameters.checkpoint.enabled = False
+    step_parameters.rate_limit.enabled = not args.no_rate_limit
+    step_parameters.listing.enabled = args.listing_only
+
+    return config
+
+
+def run_load_test(args: argparse.Namespace) -> Dict[str, Any]:
+    with (
+        SuperjobStubServer(
+            latency=args.latency_ms / 1000,
+            resumes_per_page=args.resumes_per_page,
+            pages_count=args.pages,
+            recorded_pages_dir=args.recorded_pages_dir,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+        ) as server,
+        tempfile.TemporaryDirectory() as temp_dir,
+    ):
+        config = build_config(args, server)
+        data_controller = InMemoryDataController(config, Path(temp_dir) / "src")
+        component = _InstrumentedDataExtractingComponent(config, data_controller, LocalLogger())
+
+        with measure_parse_cpu() as parse_totals:
+            started = time.perf_counter()
+            process_started = time.process_time()
+            component.get_data()
+            elapsed = time.perf_counter() - started
+            process_cpu = time.process_time() - process_started
+
+        resumes_count = data_controller.datasets[DatasetName.SOURCE_DATA.value].shape[0]
+        http_transport = component.connector.http_transport if component.connector is not None else None
+        latencies = http_transport.latencies if http_transport is not None else []
+        return {
+            "resumes": resumes_count,
+            "seconds": round(elapsed, 3),
+            "resumes_per_second": round(resumes_count / elapsed, 2) if elapsed else 0.0,
+            "server_requests": server.requests_count,
+            "server_errors": server.errors_count,
+            "fetch_p50_ms": round(percentile(latencies, 0.5) * 1000, 1),
+            "fetch_p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+            "search_parse_cpu_ms_per_page": (
+                round(parse_totals["cpu_seconds"] / parse_totals["pages"] * 1000, 3) if parse_totals["pages"] else 0.0
+            ),
+            "parse_pool_cpu_seconds": round(parse_totals["pool_cpu_seconds"], 3),
+            "main_process_cpu_seconds": round(process_cpu, 3),
+        }
+
+
+if __name__ == "__main__":
+    summary = run_load_test(parse_args())
+    logger.info(" | ".join(f"{key}: {value}" for key, value in summary.items()))
@@ -0,0 +1,56 @@
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src import logger
+from src.benchmarks.superjob_stub_server import SuperjobStubServer
+from src.pipeline.data_extracting_components.get_data_from_superjob import (
+    get_data_from_resume_by_url,
+    get_data_from_resumes_by_urls,
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Пропускная способность загрузки резюме на локальной заглушке")
+    parser.add_argument("--resumes", type=int, default=200, help="Количество загружаемых резюме")
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="Задержка ответа заглушки, мс")
+    parser.add_argument("--max-in-flight", type=int, default=16, help="Лимит одновременных запросов")
+    parser.add_argument("--max-per-host", type=int, default=8, help="Лимит одновременных запросов к хосту")
+    parser.add_argument("--recorded-pages-dir", type=Path, default=None, help="Директория с записанными страницами")
+    return parser.parse_args()
+
+
+def run_sequential(urls: List[str]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    results = [get_data_from_resume_by_url(url) for url in urls]
+    return _summarize("sequential", results, time.perf_counter() - started)
+
+
+def run_concurrent(urls: List[str], max_in_flight: int, max_per_host: int) -> Dict[str, Any]:
+    started = time.perf_counter()
+    results = get_data_from_resumes_by_urls(urls, max_in_flight, max_per_host)
+    return _summarize(f"async x{max_in_flight}/{max_per_host}", results, time.perf_counter() - started)
+
+
+def _summarize(name: str, results: List[Any], elapsed: float) -> Dict[str, Any]:
+    succeeded = sum(1 for result in results if isinstance(result, dict) and result)
+    return {
+        "mode": name,
+        "resumes": succeeded,
+        "seconds": round(elapsed, 3),
+        "resumes_per_second": round(succeeded / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    with SuperjobStubServer(latency=args.latency_ms / 1000, recorded_pages_dir=args.recorded_pages_dir) as server:
+        resume_urls = [server.resume_url(resume_id) for resume_id in range(args.resumes)]
+
+        for summary in (
+            run_sequential(resume_urls),
+            run_concurrent(resume_urls, args.max_in_flight, args.max_per_host),
+        ):
+            logger.info(" | ".join(f"{key}: {value}" for key, value in summary.items()))
@@ -0,0 +1,61 @@
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+from src.data_controlling.interfaces import IDataController
+from src.entities.pipeline import DataProperties, PipelineConfiguration
+from src.enums import DatasetName
+from src.utils.exceptions import ServiceError
+
+
+class InMemoryDataController(IDataController):
+    """
+    Контроллер данных для нагрузочных прогонов: датасеты хранятся в памяти процесса,
+    служебные файлы шагов пишутся во временную директорию project_root.
+    """
+
+    _DATASET_EXTRACTING_DATE_COLUMN_NAME = "pipeline_load_date"
+
+    def __init__(self, config: PipelineConfiguration, project_root: Path):
+        self._config = config
+        self._project_root = project_root
+        self.datasets: Dict[str, pd.DataFrame] = {}
+
+    @property
+    def project_root(self) -> Path:
+        return self._project_root
+
+    @property
+    def dataset_extracting_date_column_name(self) -> str:
+        return self._DATASET_EXTRACTING_DATE_COLUMN_NAME
+
+    def get_dataset(self, dataset_name: DatasetName) -> pd.DataFrame:
+        dataset = self.datasets.get(dataset_name.value)
+        if dataset is None:
+            raise FileNotFoundError(f"Датасет {dataset_name} не сохранён")
+
+        return dataset.copy()
+
+    def save_dataset(self, dataset: pd.DataFrame, dataset_name: DatasetName) -> None:
+        self.datasets[dataset_name.value] = dataset.reset_index(drop=True)
+
+    def append_dataset(self, dataset: pd.DataFrame, dataset_name: DatasetName) -> None:
+        saved_dataset = self.datasets.get(dataset_name.value)
+        if saved_dataset is None:
+            self.save_dataset(dataset, dataset_name)
+            return
+
+        self.datasets[dataset_name.value] = pd.concat([saved_dataset, dataset], ignore_index=True)
+
+    def publish_appended_dataset(self, dataset_name: DatasetName) -> None:
+        """
+        Дописанные строки сразу находятся в памяти, публиковать нечего.
+        """
+
+    def get_dataset_parameters(self, dataset_name: DatasetName) -> DataProperties:
+        dataset_parameters = self._config.dataset.get(dataset_name.value)
+        if dataset_parameters is None:
+            raise ServiceError(f"Не найдены параметры датасета с именем {dataset_name}")
+
+        return dataset_parameters
@@ -0,0 +1,153 @@
+import argparse
+import random
+import re
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Union
+
+import pandas as pd
+from pandas._libs.missing import NAType
+
+from src import logger
+from src.utils.text_normalization import (
+    MONTHS,
+    normalize_age,
+    normalize_salary,
+    parse_date,
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Построчная и векторная нормализация ЗП и возраста, разбор дат")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Число строк в каждом столбце")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def extract_salary_baseline(salary: str) -> Union[int, NAType]:
+    try:
+        return int(re.sub(r"[^\d]", "", salary))
+    except Exception:
+        return pd.NA
+
+
+def extract_age_baseline(age: str) -> Union[int, NAType]:
+    try:
+        return int(re.findall(r"\d{2} г", age)[0].split()[0])
+    except Exception:
+        return pd.NA
+
+
+def str_date_to_datetime_baseline(date: str) -> datetime:
+    if "вчера" in date:
+        return datetime.now() - timedelta(days=1)
+
+    month = 0
+    for month_str, number in MONTHS.items():
+        if month_str in date:
+            month = number
+
+    if not month:
+        return datetime.now()
+
+    try:
+        day = re.findall(r"\d{1,2} ", date)[0].strip()
+        year_found = re.findall(r"20\d{2}", date)
+        year = year_found[0] if year_found else 2024
+        return datetime(year=int(year), month=int(month), day=int(day))
+    except Exception:
+        return datetime(year=1970, month=1, day=1)
+
+
+def build_columns(rows: int, seed: int) -> Dict[str, pd.Series]:
+    rnd = random.Random(seed)
+    months = list(MONTHS)
+
+    def salary() -> str:
+        low = rnd.randrange(30, 400) * 1000
+        amount = f"{low:,}".replace(",", "\xa0")
+        high = f"{low + rnd.randrange(10, 100) * 1000:,}".replace(",", "\xa0")
+        return rnd.choice(
+            [
+                f"{amount}\xa0₽",
+                f"от {amount}\xa0₽",
+                f"до {high}\xa0₽",
+                f"от {amount} до {high}\xa0₽",
+                f"{amount} — {high} руб.",
+                "По договорённости",
+            ]
+        )
+
+    def age() -> str:
+        years = rnd.randrange(18, 70)
+        return rnd.choice([f"{years}\xa0лет", f"{years} года", f"{years} год, родился 1 мая 1990", ""])
+
+    def date() -> str:
+        return rnd.choice(
+            [
+                f"{rnd.randrange(1, 29)} {rnd.choice(months)}",
+                f"{rnd.randrange(1, 29)} {rnd.choice(months)} {rnd.randrange(2015, 2026)}",
+                "сегодня",
+                f"вчера в {rnd.randrange(0, 24)}:{rnd.randrange(0, 60):02d}",
+                f"{rnd.randrange(1, 59)} минут назад",
+            ]
+        )
+
+    return {
+        "salary": pd.Series([salary() for _ in range(rows)], dtype=object),
+        "age": pd.Series([age() for _ in range(rows)], dtype=object),
+        "date": pd.Series([date() for _ in range(rows)], dtype=object),
+    }
+
+
+def measure(name: str, normalize: Callable[[], Any], rows: int) -> Dict[str, Any]:
+    started = time.perf_counter()
+    result = normalize()
+    elapsed = time.perf_counter() - started
+    return {
+        "name": name,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed) if elapsed else 0,
+        "result": result,
+    }
+
+
+def log_comparison(field: str, summaries: List[Dict[str, Any]]) -> None:
+    reference = summaries[0]["seconds"]
+    for summary in summaries:
+        speedup = reference / summary["seconds"] if summary["seconds"] else 0
+        logger.info(
+            f"{field} | {summary['name']} | {summary['seconds']} с | "
+            f"строк/с: {summary['rows_per_second']} | ускорение: {speedup:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    columns = build_columns(args.rows, args.seed)
+    now = datetime.now()
+
+    log_comparison(
+        "ЗП",
+        [
+            measure("apply + re.sub (до)", lambda: columns["salary"].apply(extract_salary_baseline), args.rows),
+            measure("factorize + NumPy", lambda: normalize_salary(columns["salary"]), args.rows),
+        ],
+    )
+    log_comparison(
+        "Возраст",
+        [
+            measure("apply + re.findall (до)", lambda: columns["age"].apply(extract_age_baseline), args.rows),
+            measure("factorize + NumPy", lambda: normalize_age(columns["age"]), args.rows),
+        ],
+    )
+
+    log_comparison(
+        "Дата",
+        [
+            measure(
+                "apply + словарь месяцев (до)", lambda: columns["date"].apply(str_date_to_datetime_baseline), args.rows
+            ),
+            measure("apply + parse_date", lambda: columns["date"].apply(parse_date, now=now), args.rows),
+        ],
+    )
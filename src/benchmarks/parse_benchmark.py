@@ -0,0 +1,146 @@
+import argparse
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from bs4 import BeautifulSoup
+
+from src import logger
+from src.benchmarks.superjob_page_fixtures import (
+    load_recorded_pages,
+    render_resume_page,
+    render_search_page,
+    resume_updated_date,
+)
+from src.pipeline.data_extracting_components.component_sources import SelectorTableParser
+from src.pipeline.data_extracting_components.get_data_from_superjob import (
+    RESUME_PAGE_CONTAINERS,
+    RESUME_PAGE_FIELDS,
+    SEARCH_PAGE_CONTAINERS,
+    SEARCH_PAGE_FIELDS,
+    parse_resume_page,
+    parse_resume_urls,
+    str_date_to_datetime,
+)
+from src.utils.exceptions import ServiceError
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="CPU-время разбора страниц superjob до и после оптимизации")
+    parser.add_argument("--pages", type=int, default=200, help="Размер синтетического корпуса")
+    parser.add_argument("--recorded-pages-dir", type=Path, default=None, help="Директория с записанными страницами")
+    return parser.parse_args()
+
+
+def parse_resume_page_baseline(html: str) -> Dict[str, Any]:
+    """
+    Исходный разбор: полное дерево bs4 и отдельный поиск от корня для каждого поля.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    def find_text(name: str, class_: str, parent: Any = soup) -> str:
+        element = parent.find(name, class_=class_) if parent is not None else None
+        return element.get_text().strip() if element is not None else ""
+
+    updating_dates = soup.find("div", class_="e1UIb").find_all("span", class_="_1vAof _38Lv- _3fAzh _3L1uo")
+    age = soup.find("span", class_="DzbIT s24Iy _1yskz _3Bzp6 lkr9c Qpqo3 _1vBD3 cq8in")
+    salary = soup.find("span", class_="_3OBe9 _38Lv- _2eJfc")
+    working_conditions = soup.find("div", class_="Xkibi").find("div", class_="J+R2u").get_text().split(",")[1:]
+    skills_list = soup.find("ul", class_="_8jaXR _1nNwC _2P41q bn_Xt _1kYH3")
+    skills = [tag.get_text().strip() for tag in skills_list.find_all("li", class_="_19Wau")] if skills_list else []
+    employment_block = soup.find("div", class_="vK4Mq _2NPzg _1-86a _3umqY _2w28p Kwuox")
+    experience_block = soup.find("div", class_="Ed+Mf")
+    education_block = soup.find("div", class_="f-test-block-account_balance")
+
+    return {
+        "Дата обновления резюме": str_date_to_datetime(updating_dates[1].text.strip()),
+        "Возраст": age.text.strip().replace("\xa0", " ") if age is not None else "-1",
+        "ЗП": salary.text.strip().replace("\xa0", " ") if salary is not None else "По договорённости",
+        "Желаемая должность": find_text("h1", "VB8-V -Hv1l Qpqo3 _2m2xE"),
+        "Город": soup.find("div", class_="J+R2u").get_text().split(",")[0].strip(),
+        "Условия работы": ",".join(working_conditions).strip().replace("\xa0", " "),
+        "Занятость": find_text("span", "lkr9c Qpqo3 _1vBD3 B7FnQ", employment_block).replace("\xa0", " "),
+        "Навыки": ", ".join(skill for skill in skills if skill != "Показать еще"),
+        "Последнее/текущее место работы": find_text("span", "lkr9c Qpqo3 _31H4p B7FnQ _3YZZG", experience_block),
+        "Последняя/текущая должность": find_text("h3", "_1g0P1 Qpqo3 _1vBD3 B7FnQ _3YZZG", experience_block),
+        "Образование и ВУЗ": find_text("h3", "_1g0P1 Qpqo3 _1vBD3 B7FnQ _3YZZG", education_block),
+    }
+
+
+def parse_resume_urls_baseline(html: str) -> List[str]:
+    soup = BeautifulSoup(html, "html.parser")
+    result = []
+    for div in soup.find_all("div", class_="f-test-search-result-item"):
+        anchor = div.find("a", class_="EruXX")
+        if anchor is not None and anchor.get("href").startswith("/resume"):
+            result.append(rf"https://www.superjob.ru/{anchor.get('href')}")
+
+    return result
+
+
+def measure(name: str, parse: Callable[[str], Any], corpus: List[str]) -> Dict[str, Any]:
+    started = time.process_time()
+    results = [parse(html) for html in corpus]
+    elapsed = time.process_time() - started
+    return {
+        "parser": name,
+        "pages": len(corpus),
+        "cpu_ms_per_page": round(elapsed / len(corpus) * 1000, 3),
+        "results": results,
+    }
+
+
+def build_corpus(pages: int, recorded_pages_dir: Path | None) -> Dict[str, List[str]]:
+    if recorded_pages_dir is not None:
+        return {
+            "resume": load_recorded_pages(recorded_pages_dir, "resume_*.html"),
+            "search": load_recorded_pages(recorded_pages_dir, "search_*.html"),
+        }
+
+    today = date.today()
+    return {
+        "resume": [render_resume_page(page, resume_updated_date(page, today)) for page in range(pages)],
+        "search": [render_search_page(list(range(page * 20, page * 20 + 20))) for page in range(pages)],
+    }
+
+
+def available_backends() -> List[str]:
+    backends = []
+    for backend in ("selectolax", "lxml", "html.parser"):
+        try:
+            SelectorTableParser({}, {}, backend=backend)
+        except (ImportError, ServiceError):
+            continue
+        backends.append(backend)
+
+    return backends
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    corpus = build_corpus(args.pages, args.recorded_pages_dir)
+
+    for page_type, baseline, parse_page, containers, fields in (
+        ("resume", parse_resume_page_baseline, parse_resume_page, RESUME_PAGE_CONTAINERS, RESUME_PAGE_FIELDS),
+        ("search", parse_resume_urls_baseline, parse_resume_urls, SEARCH_PAGE_CONTAINERS, SEARCH_PAGE_FIELDS),
+    ):
+        pages = corpus[page_type]
+        if not pages:
+            continue
+
+        reference = measure("bs4 full tree (до)", baseline, pages)
+        summaries = [reference]
+        for backend in available_backends():
+            parser = SelectorTableParser(containers, fields, backend=backend)
+            summary = measure(f"selector table / {backend}", lambda html: parse_page(html, parser), pages)
+            if summary["results"] != reference["results"]:
+                logger.error(f"Результаты {summary['parser']} расходятся с исходным разбором")
+            summaries.append(summary)
+
+        for summary in summaries:
+            speedup = reference["cpu_ms_per_page"] / summary["cpu_ms_per_page"] if summary["cpu_ms_per_page"] else 0
+            logger.info(
+                f"{page_type} | {summary['parser']} | страниц: {summary['pages']} | "
+                f"CPU мс/страница: {summary['cpu_ms_per_page']} | ускорение: {speedup:.1f}x"
+            )
@@ -0,0 +1,126 @@
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+_MONTHS = [
+    "января",
+    "февраля",
+    "марта",
+    "апреля",
+    "мая",
+    "июня",
+    "июля",
+    "августа",
+    "сентября",
+    "октября",
+    "ноября",
+    "декабря",
+]
+_POSITIONS = ["Python-разработчик", "Data Engineer", "ML Engineer", "Backend developer", "Аналитик данных"]
+_CITIES = ["Москва", "Санкт-Петербург", "Казань", "Новосибирск", "Екатеринбург"]
+_SKILLS = ["Python", "SQL", "Git", "Docker", "Linux", "PostgreSQL", "Pandas", "Kafka", "Airflow", "Spark"]
+_COMPANIES = ["ООО Ромашка", "АО Вектор", "Яндекс", "Сбер", "Тинькофф"]
+_UNIVERSITIES = ["МГУ им. М. В. Ломоносова", "ИТМО", "МФТИ", "НИУ ВШЭ", "СПбГУ"]
+
+_SEARCH_ITEM_TEMPLATE = """
+<div class="f-test-search-result-item">
+  <div class="_2J-3z"><a class="EruXX" href="/resume/{slug}-{resume_id}.html">{position}</a></div>
+  <span class="_3OBe9">{salary}</span>
+  <span class="f-test-text-resume-age">{age}</span>
+  <span class="f-test-text-resume-city">{city}</span>
+  {updated}
+</div>
+"""
+
+_RESUME_TEMPLATE = """<!DOCTYPE html>
+<html lang="ru">
+<head><meta charset="utf-8"><title>{position}</title><script>{padding}</script></head>
+<body>
+<div class="Xkibi">
+  <h1 class="VB8-V -Hv1l Qpqo3 _2m2xE">{position}</h1>
+  <span class="_3OBe9 _38Lv- _2eJfc">{salary}</span>
+  <span class="DzbIT s24Iy _1yskz _3Bzp6 lkr9c Qpqo3 _1vBD3 cq8in">{age}</span>
+  <div class="J+R2u">{city}, {conditions}</div>
+</div>
+<div class="e1UIb">
+  <span class="_1vAof _38Lv- _3fAzh _3L1uo">Резюме обновлено</span>
+  <span class="_1vAof _38Lv- _3fAzh _3L1uo">{updated}</span>
+</div>
+<div class="vK4Mq _2NPzg _1-86a _3umqY _2w28p Kwuox">
+  <span class="lkr9c Qpqo3 _1vBD3 B7FnQ">{employment}</span>
+</div>
+<ul class="_8jaXR _1nNwC _2P41q bn_Xt _1kYH3">{skills}<li class="_19Wau">Показать еще</li></ul>
+<div class="Ed+Mf">
+  <h3 class="_1g0P1 Qpqo3 _1vBD3 B7FnQ _3YZZG">{last_position}</h3>
+  <span class="lkr9c Qpqo3 _31H4p B7FnQ _3YZZG">{company}</span>
+</div>
+<div class="f-test-block-account_balance">
+  <h3 class="_1g0P1 Qpqo3 _1vBD3 B7FnQ _3YZZG">{university}</h3>
+</div>
+{filler}
+</body>
+</html>
+"""
+
+
+def format_russian_date(value: date) -> str:
+    return f"{value.day} {_MONTHS[value.month - 1]} {value.year}"
+
+
+def render_search_page(resume_ids: List[int], updated_dates: Optional[List[date]] = None) -> str:
+    rnd = random.Random(resume_ids[0] if resume_ids else 0)
+    items = [
+        _SEARCH_ITEM_TEMPLATE.format(
+            slug="python-razrabotchik",
+            resume_id=resume_id,
+            position=rnd.choice(_POSITIONS),
+            salary=f"{rnd.randrange(50, 400) * 1000:,}".replace(",", "\xa0") + "\xa0₽",
+            age=f"{rnd.randrange(20, 60)}\xa0лет",
+            city=rnd.choice(_CITIES),
+            updated=(
+                f'<span class="f-test-text-resume-update-date">{format_russian_date(updated_dates[index])}</span>'
+                if updated_dates is not None
+                else ""
+            ),
+        )
+        for index, resume_id in enumerate(resume_ids)
+    ]
+    return f'<!DOCTYPE html><html lang="ru"><body><div class="search">{"".join(items)}</div></body></html>'
+
+
+def render_resume_page(resume_id: int, updated: date, padding_kb: int = 64) -> str:
+    rnd = random.Random(resume_id)
+    skills = "".join(f'<li class="_19Wau">{skill}</li>' for skill in rnd.sample(_SKILLS, rnd.randrange(2, 8)))
+    filler = "".join(
+        f'<div class="_{index % 97}x"><p class="q{index}">Описание опыта {index}</p></div>'
+        for index in range(padding_kb * 4)
+    )
+    return _RESUME_TEMPLATE.format(
+        position=rnd.choice(_POSITIONS),
+        salary=f"{rnd.randrange(50, 400) * 1000:,}".replace(",", "\xa0") + "\xa0₽",
+        age=f"{rnd.randrange(20, 60)}\xa0лет",
+        city=rnd.choice(_CITIES),
+        conditions="не готов к переезду, не готов к командировкам",
+        updated=format_russian_date(updated),
+        employment="Полный рабочий день",
+        skills=skills,
+        last_position=rnd.choice(_POSITIONS),
+        company=rnd.choice(_COMPANIES),
+        university=rnd.choice(_UNIVERSITIES),
+        filler=filler,
+        padding="var x = 1;" * (padding_kb * 20),
+    )
+
+
+def load_recorded_pages(pages_dir: Path, pattern: str) -> List[str]:
+    """
+    :param pages_dir: Директория с сохранёнными страницами superjob.
+    :param pattern: Шаблон имён файлов, например resume_*.html.
+    :return: Содержимое найденных страниц в порядке имён файлов.
+    """
+    return [path.read_text(encoding="utf-8") for path in sorted(pages_dir.glob(pattern))]
+
+
+def resume_updated_date(resume_id: int, newest: date, resumes_per_day: int = 50) -> date:
+    return newest - timedelta(days=resume_id // resumes_per_day)
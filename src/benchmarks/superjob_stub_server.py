@@ -0,0 +1,177 @@
+import random
+import re
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from src.benchmarks.superjob_page_fixtures import (
+    load_recorded_pages,
+    render_resume_page,
+    render_search_page,
+    resume_updated_date,
+)
+
+
+class SuperjobStubServer:
+    """
+    Локальный HTTP-сервер, отдающий страницы поиска и резюме в разметке superjob.
+    Страницы берутся из директории с записанными ответами (search_*.html, resume_*.html)
+    либо генерируются синтетически. Доля error_rate запросов завершается кодом error_status.
+    """
+
+    _RESUME_PATH_PATTERN = re.compile(r"^/+resume/[\w-]*?(\d+)\.html$")
+    _SEARCH_PATH = "/resume/search_resume.html"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        resumes_per_page: int = 20,
+        pages_count: int = 1,
+        recorded_pages_dir: Optional[Path] = None,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency
+        self.resumes_per_page = resumes_per_page
+        self.pages_count = pages_count
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.newest_update_date = date.today()
+
+        self._random = random.Random(seed)
+
+        self._recorded_search_pages: List[str] = []
+        self._recorded_resume_pages: List[str] = []
+        if recorded_pages_dir is not None:
+            self._recorded_search_pages = load_recorded_pages(recorded_pages_dir, "search_*.html")
+            self._recorded_resume_pages = load_recorded_pages(recorded_pages_dir, "resume_*.html")
+
+        self._requests_count = 0
+        self._errors_count = 0
+        self._requests_lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), self._create_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def requests_count(self) -> int:
+        return self._requests_count
+
+    @property
+    def errors_count(self) -> int:
+        return self._errors_count
+
+    @property
+    def search_base_url(self) -> str:
+        return f"{self.base_url}{self._SEARCH_PATH}"
+
+    @property
+    def resume_base_url(self) -> str:
+        return f"{self.base_url}/"
+
+    def search_url(self, position: str) -> str:
+        return f"{self.search_base_url}?keywords[0][keys]={position}&sbmit=1"
+
+    def resume_url(self, resume_id: int) -> str:
+        return f"{self.base_url}/resume/python-razrabotchik-{resume_id}.html"
+
+    def start(self) -> "SuperjobStubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "SuperjobStubServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def should_fail(self) -> bool:
+        with self._requests_lock:
+            self._requests_count += 1
+            is_failed = self._random.random() < self.error_rate
+            if is_failed:
+                self._errors_count += 1
+
+        return is_failed
+
+    def render(self, path: str, query: str) -> Optional[str]:
+        if path == self._SEARCH_PATH:
+            page = int(parse_qs(query).get("page", ["0"])[0])
+            return self._render_search_page(page)
+
+        match = self._RESUME_PATH_PATTERN.match(path)
+        if match is None:
+            return None
+
+        return self._render_resume_page(int(match.group(1)))
+
+    def _render_search_page(self, page: int) -> str:
+        if page >= self.pages_count:
+            return render_search_page([])
+
+        if self._recorded_search_pages:
+            return self._recorded_search_pages[page % len(self._recorded_search_pages)]
+
+        first_id = page * self.resumes_per_page
+        resume_ids = list(range(first_id, first_id + self.resumes_per_page))
+        updated_dates = [resume_updated_date(resume_id, self.newest_update_date) for resume_id in resume_ids]
+        return render_search_page(resume_ids, updated_dates)
+
+    def _render_resume_page(self, resume_id: int) -> str:
+        if self._recorded_resume_pages:
+            return self._recorded_resume_pages[resume_id % len(self._recorded_resume_pages)]
+
+        return render_resume_page(resume_id, resume_updated_date(resume_id, self.newest_update_date))
+
+    def _create_handler(self) -> type:
+        stub_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                if stub_server.latency:
+                    time.sleep(stub_server.latency)
+
+                if stub_server.should_fail():
+                    self.send_error(stub_server.error_status)
+                    return
+
+                url = urlsplit(self.path)
+                body = stub_server.render(url.path, url.query)
+                if body is None:
+                    self.send_error(404)
+                    return
+
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args) -> None:
+                return
+
+        return Handler
@@ -39,6 +39,14 @@ class DataController(IDataController):
         dataset_parameters = self.get_dataset_parameters(dataset_name)
         self._file_manager.save_dataset(dataset, dataset_parameters)
 
+    def append_dataset(self, dataset: pd.DataFrame, dataset_name: DatasetName) -> None:
+        dataset_parameters = self.get_dataset_parameters(dataset_name)
+        self._file_manager.append_dataset(dataset, dataset_parameters)
+
+    def publish_appended_dataset(self, dataset_name: DatasetName) -> None:
+        dataset_parameters = self.get_dataset_parameters(dataset_name)
+        self._file_manager.publish_appended_dataset(dataset_parameters)
+
     def get_dataset_parameters(self, dataset_name: DatasetName) -> DataProperties:
         dataset_parameters = self._config.dataset.get(dataset_name.value)
         if dataset_parameters is None:
@@ -40,6 +40,22 @@ class IDataController(ABC):
         :param dataset_name:
         """
 
+    @abstractmethod
+    def append_dataset(self, dataset: pd.DataFrame, dataset_name: DatasetName) -> None:
+        """
+        Дописывает строки в конец датасета, не загружая уже сохранённые данные.
+        :param dataset: Новые строки с той же схемой, что и у сохранённого датасета.
+        :param dataset_name: Название датасета в системе.
+        """
+
+    @abstractmethod
+    def publish_appended_dataset(self, dataset_name: DatasetName) -> None:
+        """
+        Публикует строки, дописанные append_dataset за запуск. До публикации они видны в get_dataset,
+        но хранилище может держать их локально: вызывается один раз, когда все части запуска записаны.
+        :param dataset_name: Название датасета в системе.
+        """
+
     @abstractmethod
     def get_dataset_parameters(self, dataset_name: DatasetName) -> DataProperties:
         """
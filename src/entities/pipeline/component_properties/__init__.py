@@ -1,11 +1,37 @@
+from .checkpoint_properties import CheckpointProperties
+from .classifier_backend_properties import ClassifierBackendProperties
+from .crawl_budget_properties import CrawlBudgetProperties
 from .data_plot_creation_step_properties import DataPlotCreationStepProperties
 from .data_validating_step_properties import DataValidatingStepProperties
+from .embedding_prefilter_properties import EmbeddingPrefilterProperties
 from .extraction_step_properties import ExtractionStepProperties
+from .frontier_properties import FrontierProperties
+from .http_cache_properties import HttpCacheProperties
+from .http_transport_properties import HttpTransportProperties
+from .listing_properties import ListingProperties
 from .preprocessing_step_properties import PreprocessingStepProperties
+from .rate_limit_properties import RateLimitProperties
+from .raw_archive_properties import RawArchiveProperties
+from .score_cache_properties import ScoreCacheProperties
+from .seen_index_properties import SeenIndexProperties
+from .telemetry_properties import TelemetryProperties
 
 __all__ = [
+    "CheckpointProperties",
+    "ClassifierBackendProperties",
+    "CrawlBudgetProperties",
+    "EmbeddingPrefilterProperties",
     "ExtractionStepProperties",
+    "FrontierProperties",
+    "HttpCacheProperties",
+    "HttpTransportProperties",
+    "ListingProperties",
     "PreprocessingStepProperties",
+    "RateLimitProperties",
+    "RawArchiveProperties",
+    "ScoreCacheProperties",
+    "SeenIndexProperties",
+    "TelemetryProperties",
     "DataValidatingStepProperties",
     "DataPlotCreationStepProperties",
 ]
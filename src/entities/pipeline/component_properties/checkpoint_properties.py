@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class CheckpointProperties(BaseModel):
+    enabled: bool = True
+    journal_path: str = "interim/extraction_journal.jsonl"
+    resume_batch_size: int = 200
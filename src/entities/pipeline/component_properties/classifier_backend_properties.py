@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class ClassifierBackendProperties(BaseModel):
+    backend: str = "torch"
+    snapshot_directory: str = "huggingface"
+    onnx_directory: str = "onnx/deberta-v3-xsmall-zeroshot"
+    quantize_int8: bool = True
+    intra_op_threads: int = 0
+    guard_sample_size: int = 200
+    guard_min_agreement: float = 0.98
+    guard_max_score_difference: float = 0.05
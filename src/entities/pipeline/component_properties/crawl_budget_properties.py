@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class CrawlBudgetProperties(BaseModel):
+    enabled: bool = False
+    request_budget: int = 2000
+    min_pages_per_position: int = 1
+    unknown_position_yield: float = 20.0
+    staleness_weight: float = 1.0
+    max_staleness_factor: float = 8.0
+    yield_smoothing: float = 0.3
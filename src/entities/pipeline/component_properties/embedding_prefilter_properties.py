@@ -0,0 +1,12 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class EmbeddingPrefilterProperties(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+
+    enabled: bool = False
+    model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    batch_size: int = 64
+    lower_similarity: float = 0.25
+    upper_similarity: float = 0.6
+    agreement_sample_size: int = 200
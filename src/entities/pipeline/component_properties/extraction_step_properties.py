@@ -1,7 +1,41 @@
-from typing import List
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
+from src.entities.pipeline.component_properties.checkpoint_properties import CheckpointProperties
+from src.entities.pipeline.component_properties.crawl_budget_properties import CrawlBudgetProperties
+from src.entities.pipeline.component_properties.frontier_properties import FrontierProperties
+from src.entities.pipeline.component_properties.http_cache_properties import HttpCacheProperties
+from src.entities.pipeline.component_properties.http_transport_properties import HttpTransportProperties
+from src.entities.pipeline.component_properties.listing_properties import ListingProperties
+from src.entities.pipeline.component_properties.rate_limit_properties import RateLimitProperties
+from src.entities.pipeline.component_properties.raw_archive_properties import RawArchiveProperties
+from src.entities.pipeline.component_properties.seen_index_properties import SeenIndexProperties
+from src.entities.pipeline.component_properties.telemetry_properties import TelemetryProperties
+
 
 class ExtractionStepProperties(BaseModel):
     positions_to_extract: List[str]
+    sources: List[str] = ["superjob"]
+    search_url: str = "https://russia.superjob.ru/resume/search_resume.html"
+    resume_base_url: str = "https://www.superjob.ru/"
+    default_pages_count: int = 1
+    pages_count_by_position: Dict[str, int] = {}
+    prefetch_pages: int = 4
+    binary_search_min_pages: int = 16
+    max_in_flight_requests: int = 16
+    max_requests_per_host: int = 8
+    parse_workers: Optional[int] = None
+    parse_queue_size: int = 64
+    write_chunk_rows: int = 5000
+    state_path: str = "interim/extraction_state.json"
+    http_transport: HttpTransportProperties = HttpTransportProperties()
+    http_cache: HttpCacheProperties = HttpCacheProperties()
+    rate_limit: RateLimitProperties = RateLimitProperties()
+    checkpoint: CheckpointProperties = CheckpointProperties()
+    seen_index: SeenIndexProperties = SeenIndexProperties()
+    raw_archive: RawArchiveProperties = RawArchiveProperties()
+    listing: ListingProperties = ListingProperties()
+    crawl_budget: CrawlBudgetProperties = CrawlBudgetProperties()
+    telemetry: TelemetryProperties = TelemetryProperties()
+    frontier: FrontierProperties = FrontierProperties()
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class FrontierProperties(BaseModel):
+    enabled: bool = False
+    path: str = "interim/crawl_frontier.sqlite"
+    lease_seconds: float = 300.0
+    max_attempts: int = 3
+    lease_batch_size: int = 32
+    poll_seconds: float = 1.0
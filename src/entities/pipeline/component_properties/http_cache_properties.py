@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class HttpCacheProperties(BaseModel):
+    enabled: bool = True
+    directory: str = "interim/http_cache"
+    max_size_mb: int = 2048
+    ttl_hours: float = 24.0
+    offline: bool = False
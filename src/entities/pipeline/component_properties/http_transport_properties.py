@@ -0,0 +1,13 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class HttpTransportProperties(BaseModel):
+    pool_connections: int = 4
+    pool_maxsize: int = 16
+    timeout: float = 10.0
+    max_retries: int = 4
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: List[int] = [429, 500, 502, 503, 504]
@@ -0,0 +1,14 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class ListingProperties(BaseModel):
+    enabled: bool = False
+    required_fields: List[str] = [
+        "Дата обновления резюме",
+        "Возраст",
+        "ЗП",
+        "Желаемая должность",
+        "Город",
+    ]
@@ -1,5 +1,13 @@
 from pydantic import BaseModel
 
+from src.entities.pipeline.component_properties.classifier_backend_properties import ClassifierBackendProperties
+from src.entities.pipeline.component_properties.embedding_prefilter_properties import EmbeddingPrefilterProperties
+from src.entities.pipeline.component_properties.score_cache_properties import ScoreCacheProperties
+
 
 class PreprocessingStepProperties(BaseModel):
     unmatching_jobs_threshold: float
+    classification_batch_size: int = 32
+    classifier_backend: ClassifierBackendProperties = ClassifierBackendProperties()
+    score_cache: ScoreCacheProperties = ScoreCacheProperties()
+    embedding_prefilter: EmbeddingPrefilterProperties = EmbeddingPrefilterProperties()
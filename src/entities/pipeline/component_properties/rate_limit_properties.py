@@ -0,0 +1,20 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class RateLimitProperties(BaseModel):
+    enabled: bool = True
+    initial_requests_per_second: float = 4.0
+    min_requests_per_second: float = 0.5
+    max_requests_per_second: float = 32.0
+    rate_increase: float = 1.0
+    burst: int = 4
+    initial_concurrency: int = 2
+    min_concurrency: int = 1
+    additive_increase: float = 1.0
+    multiplicative_decrease: float = 0.5
+    decrease_cooldown: float = 1.0
+    latency_spike_factor: float = 3.0
+    latency_smoothing: float = 0.2
+    throttle_statuses: List[int] = [429, 503]
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class RawArchiveProperties(BaseModel):
+    enabled: bool = False
+    directory: str = "interim/raw_html"
+    segment_max_mb: int = 256
+    compression_level: int = 9
+    reparse: bool = False
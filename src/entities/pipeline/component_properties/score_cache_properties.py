@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class ScoreCacheProperties(BaseModel):
+    enabled: bool = True
+    path: str = "interim/relevance_scores.sqlite"
+    lru_size: int = 100_000
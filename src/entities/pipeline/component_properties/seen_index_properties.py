@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class SeenIndexProperties(BaseModel):
+    enabled: bool = True
+    directory: str = "interim/seen_resumes"
+    expected_resumes: int = 1_000_000
+    false_positive_rate: float = 0.01
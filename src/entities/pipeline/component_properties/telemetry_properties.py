@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class TelemetryProperties(BaseModel):
+    enabled: bool = True
+    report_path: str = "reports/extraction_telemetry.json"
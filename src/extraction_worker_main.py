@@ -0,0 +1,34 @@
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.configuration.config_loaders import PipelineConfigLoader
+from src.pipeline.data_extracting_components import SuperjobConnector
+from src.utils.exceptions import ServiceError
+
+DATASETS_DIR = Path(__file__).parents[1].resolve() / "datasets"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Воркер очереди работ обхода шага извлечения данных")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=300.0,
+        help="Завершить работу, если новых задач нет столько секунд",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    step_parameters = PipelineConfigLoader().get_config().components.extraction_step_properties
+    if step_parameters is None or not step_parameters.frontier.enabled:
+        raise ServiceError("Очередь работ обхода выключена в параметрах шага извлечения данных")
+
+    parse_workers = step_parameters.parse_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        SuperjobConnector(step_parameters, DATASETS_DIR, parse_workers).run_frontier_worker(executor, args.idle_timeout)
@@ -1,4 +1,5 @@
 from .data_extracting_component import DataExtractingComponent
-from .interfaces import IDataExtractingComponent
+from .interfaces import IDataExtractingComponent, ISourceConnector
+from .superjob_connector import SuperjobConnector
 
-__all__ = ["DataExtractingComponent", "IDataExtractingComponent"]
+__all__ = ["DataExtractingComponent", "IDataExtractingComponent", "ISourceConnector", "SuperjobConnector"]
@@ -0,0 +1,51 @@
+from .adaptive_rate_limiter import AdaptiveRateLimiter
+from .bloom_filter import BloomFilter
+from .crawl_budget_scheduler import CrawlBudgetScheduler
+from .columnar_chunk_writer import ColumnarChunkWriter
+from .concurrent_resume_fetcher import ConcurrentResumeFetcher
+from .extraction_journal import ExtractionJournal, RowKey
+from .extraction_telemetry import ExtractionTelemetry, LogHistogram
+from .extraction_state_store import ExtractionStateStore, PositionWatermark, PositionYield
+from .http_response_cache import CachedResponse, HttpResponseCache
+from .http_transport import HttpResponse, HttpTransport
+from .raw_html_archive import ArchivedPage, RawHtmlArchive
+from .search_page_crawler import SearchPageCrawler
+from .seen_resume_filter import SeenResumeFilter
+from .seen_resume_index import SeenResumeIndex
+from .source_extraction import ResumeBatchSink, SourceExtraction
+from .sqlite_crawl_frontier import FrontierTask, SqliteCrawlFrontier
+from .staged_page_fetcher import StagedPageFetcher
+from .superjob_page_parser import ContainerSelector, FieldSelector, MatchedElement, SelectorTableParser
+
+__all__ = [
+    "AdaptiveRateLimiter",
+    "BloomFilter",
+    "CachedResponse",
+    "ColumnarChunkWriter",
+    "ConcurrentResumeFetcher",
+    "CrawlBudgetScheduler",
+    "ExtractionJournal",
+    "ExtractionStateStore",
+    "ExtractionTelemetry",
+    "LogHistogram",
+    "PositionWatermark",
+    "PositionYield",
+    "RowKey",
+    "HttpResponseCache",
+    "HttpResponse",
+    "HttpTransport",
+    "ArchivedPage",
+    "RawHtmlArchive",
+    "SearchPageCrawler",
+    "SeenResumeFilter",
+    "SeenResumeIndex",
+    "ResumeBatchSink",
+    "SourceExtraction",
+    "FrontierTask",
+    "SqliteCrawlFrontier",
+    "StagedPageFetcher",
+    "ContainerSelector",
+    "FieldSelector",
+    "MatchedElement",
+    "SelectorTableParser",
+]
@@ -0,0 +1,157 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from src import logger
+from src.entities.pipeline.component_properties import RateLimitProperties
+
+
+class _HostLimit:
+    def __init__(self, properties: RateLimitProperties, max_concurrency: int):
+        self._properties = properties
+        self._max_concurrency = max_concurrency
+
+        self.rate = properties.initial_requests_per_second
+        self.concurrency_limit = float(min(properties.initial_concurrency, max_concurrency))
+        self.in_flight = 0
+
+        self.tokens = float(properties.burst)
+        self.tokens_updated_at = time.monotonic()
+
+        self.latency_ewma: Optional[float] = None
+        self.healthy_responses = 0
+        self.last_decrease_at = 0.0
+
+        self.requests_count = 0
+        self.throttled_count = 0
+        self.decreases_count = 0
+
+    def reserve_token(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(
+            float(self._properties.burst),
+            self.tokens + (now - self.tokens_updated_at) * self.rate,
+        )
+        self.tokens_updated_at = now
+        self.tokens -= 1
+
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def register_response(self, latency: float, status_code: Optional[int]) -> None:
+        self.requests_count += 1
+        is_throttled = status_code is None or status_code in self._properties.throttle_statuses
+        is_latency_spike = (
+            self.latency_ewma is not None and latency > self.latency_ewma * self._properties.latency_spike_factor
+        )
+
+        if is_throttled:
+            self.throttled_count += 1
+
+        if is_throttled or is_latency_spike:
+            self._decrease()
+        else:
+            self._increase()
+
+        smoothing = self._properties.latency_smoothing
+        self.latency_ewma = latency if self.latency_ewma is None else (
+            smoothing * latency + (1 - smoothing) * self.latency_ewma
+        )
+
+    def _increase(self) -> None:
+        self.healthy_responses += 1
+        if self.healthy_responses < self.concurrency_limit:
+            return
+
+        self.healthy_responses = 0
+        self.concurrency_limit = min(
+            float(self._max_concurrency),
+            self.concurrency_limit + self._properties.additive_increase,
+        )
+        self.rate = min(
+            self._properties.max_requests_per_second,
+            self.rate + self._properties.rate_increase,
+        )
+
+    def _decrease(self) -> None:
+        self.healthy_responses = 0
+        now = time.monotonic()
+        if now - self.last_decrease_at < self._properties.decrease_cooldown:
+            return
+
+        self.last_decrease_at = now
+        self.decreases_count += 1
+        self.concurrency_limit = max(
+            float(self._properties.min_concurrency),
+            self.concurrency_limit * self._properties.multiplicative_decrease,
+        )
+        self.rate = max(
+            self._properties.min_requests_per_second,
+            self.rate * self._properties.multiplicative_decrease,
+        )
+
+
+class AdaptiveRateLimiter:
+    """
+    Потокобезопасный ограничитель запросов к каждому хосту: token bucket задаёт темп,
+    AIMD-регулятор - число одновременных запросов. Пока ответы быстрые и без ошибок,
+    темп и лимит растут аддитивно; на 429/503, сетевые ошибки и всплески задержки
+    они уменьшаются мультипликативно (не чаще раза в decrease_cooldown секунд).
+    """
+
+    def __init__(self, properties: RateLimitProperties, max_concurrency: int):
+        self._properties = properties
+        self._max_concurrency = max_concurrency
+
+        self._condition = threading.Condition()
+        self._hosts: Dict[str, _HostLimit] = {}
+
+    def acquire(self, host: str) -> None:
+        with self._condition:
+            host_limit = self._get_host_limit(host)
+            self._condition.wait_for(lambda: host_limit.in_flight < int(host_limit.concurrency_limit))
+            host_limit.in_flight += 1
+            delay = host_limit.reserve_token()
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def release(self, host: str, latency: float, status_code: Optional[int]) -> None:
+        """
+        :param host: Хост запроса.
+        :param latency: Длительность запроса в секундах.
+        :param status_code: Код ответа, None - если запрос завершился сетевой ошибкой.
+        """
+        with self._condition:
+            host_limit = self._get_host_limit(host)
+            previous_limit = int(host_limit.concurrency_limit)
+            host_limit.in_flight -= 1
+            host_limit.register_response(latency, status_code)
+            if int(host_limit.concurrency_limit) < previous_limit:
+                logger.debug(
+                    f"Снижен лимит запросов к {host}: {int(host_limit.concurrency_limit)} одновременно, "
+                    f"{host_limit.rate:.2f} в секунду"
+                )
+            self._condition.notify_all()
+
+    @property
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        with self._condition:
+            return {
+                host: {
+                    "requests_per_second": round(host_limit.rate, 3),
+                    "concurrency_limit": int(host_limit.concurrency_limit),
+                    "latency_ewma_ms": round((host_limit.latency_ewma or 0.0) * 1000, 1),
+                    "requests": host_limit.requests_count,
+                    "throttled": host_limit.throttled_count,
+                    "decreases": host_limit.decreases_count,
+                }
+                for host, host_limit in self._hosts.items()
+            }
+
+    def _get_host_limit(self, host: str) -> _HostLimit:
+        host_limit = self._hosts.get(host)
+        if host_limit is None:
+            host_limit = _HostLimit(self._properties, self._max_concurrency)
+            self._hosts[host] = host_limit
+
+        return host_limit
@@ -0,0 +1,71 @@
+import hashlib
+import math
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+class BloomFilter:
+    """
+    Фильтр Блума на bytearray: отрицательный ответ точен, положительный требует
+    проверки по точному индексу. Позиции битов получаются двойным хешированием blake2b.
+    """
+
+    _HEADER = struct.Struct("<QIQ")
+
+    def __init__(self, size_bits: int, hash_count: int, items_count: int = 0, bits: Optional[bytearray] = None):
+        self.size_bits = size_bits
+        self.hash_count = hash_count
+        self.items_count = items_count
+        self._bits = bits if bits is not None else bytearray((size_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, expected_items: int, false_positive_rate: float) -> "BloomFilter":
+        expected_items = max(expected_items, 1)
+        size_bits = math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2)
+        hash_count = max(1, round(size_bits / expected_items * math.log(2)))
+        return cls(size_bits, hash_count)
+
+    @classmethod
+    def load(cls, path: Path) -> "BloomFilter":
+        content = path.read_bytes()
+        size_bits, hash_count, items_count = cls._HEADER.unpack_from(content)
+        bits = bytearray(content[cls._HEADER.size:])
+        if len(bits) != (size_bits + 7) // 8:
+            raise ValueError(f"Размер фильтра Блума {path} не совпадает с заголовком")
+
+        return cls(size_bits, hash_count, items_count, bits)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as fout:
+            fout.write(self._HEADER.pack(self.size_bits, self.hash_count, self.items_count))
+            fout.write(self._bits)
+        os.replace(temp_path, path)
+
+    def add(self, key: str) -> bool:
+        """
+        :return: True, если установлен хотя бы один новый бит; повторно добавленный ключ не учитывается в items_count.
+        """
+        is_new = False
+        for position in self._get_positions(key):
+            mask = 1 << (position & 7)
+            if not self._bits[position >> 3] & mask:
+                self._bits[position >> 3] |= mask
+                is_new = True
+
+        if is_new:
+            self.items_count += 1
+        return is_new
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._get_positions(key))
+
+    def _get_positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first_hash, second_hash = struct.unpack("<QQ", digest)
+        for index in range(self.hash_count):
+            yield (first_hash + index * second_hash) % self.size_bits
@@ -0,0 +1,58 @@
+from typing import Any, Callable, Dict, List, Mapping, Sequence
+
+import pandas as pd
+
+from src.utils.exceptions import ServiceError
+
+
+class ColumnarChunkWriter:
+    """
+    Накапливает записи фиксированной схемы по колонкам и передаёт их в flush_chunk
+    частями не более chunk_rows строк, так что в памяти находится только текущая часть.
+    Отсутствующие в записи поля заполняются None, лишние поля считаются ошибкой схемы.
+    """
+
+    def __init__(self, columns: Sequence[str], chunk_rows: int, flush_chunk: Callable[[pd.DataFrame], None]):
+        if chunk_rows < 1:
+            raise ServiceError("Размер части выгрузки должен быть положительным")
+
+        self._columns = list(columns)
+        self._chunk_rows = chunk_rows
+        self._flush_chunk = flush_chunk
+
+        self._buffer: Dict[str, List[Any]] = {column: [] for column in self._columns}
+        self._buffered_rows = 0
+
+        self.rows_written = 0
+        self.chunks_written = 0
+
+    def append(self, record: Mapping[str, Any]) -> None:
+        unknown_fields = record.keys() - self._buffer.keys()
+        if unknown_fields:
+            raise ServiceError(f"Поля {sorted(unknown_fields)} отсутствуют в схеме выгрузки")
+
+        for column, values in self._buffer.items():
+            values.append(record.get(column))
+
+        self._buffered_rows += 1
+        if self._buffered_rows >= self._chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffered_rows:
+            return
+
+        chunk = pd.DataFrame(self._buffer, columns=self._columns)
+        self._buffer = {column: [] for column in self._columns}
+        self._buffered_rows = 0
+
+        self._flush_chunk(chunk)
+        self.rows_written += chunk.shape[0]
+        self.chunks_written += 1
+
+    def __enter__(self) -> "ColumnarChunkWriter":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.flush()
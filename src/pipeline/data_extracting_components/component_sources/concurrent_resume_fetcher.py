@@ -0,0 +1,56 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Generic, List, Sequence, TypeVar, Union
+from urllib.parse import urlsplit
+
+from src.utils.exceptions import ServiceError
+
+FetchResult = TypeVar("FetchResult")
+
+
+class ConcurrentResumeFetcher(Generic[FetchResult]):
+    """
+    Конкурентно выполняет блокирующую функцию загрузки для набора URL в пуле потоков.
+    Общее число запросов в полёте ограничено размером пула max_in_flight_requests,
+    число одновременных запросов к одному хосту - семафором хоста на max_requests_per_host.
+    """
+
+    def __init__(
+        self,
+        fetch_function: Callable[[str], FetchResult],
+        max_in_flight_requests: int,
+        max_requests_per_host: int,
+    ):
+        if max_in_flight_requests < 1 or max_requests_per_host < 1:
+            raise ServiceError("Ограничения конкурентности загрузки должны быть положительными")
+
+        self._fetch_function = fetch_function
+        self._max_in_flight_requests = max_in_flight_requests
+        self._max_requests_per_host = max_requests_per_host
+
+    def fetch_all(self, urls: Sequence[str]) -> List[Union[FetchResult, BaseException]]:
+        """
+        :param urls: Список URL для загрузки.
+        :return: Результаты в порядке входных URL, вместо упавших загрузок - исключения.
+        """
+        if not urls:
+            return []
+
+        host_semaphores = {
+            host: threading.BoundedSemaphore(self._max_requests_per_host)
+            for host in {urlsplit(url).netloc for url in urls}
+        }
+
+        def fetch(url: str) -> FetchResult:
+            with host_semaphores[urlsplit(url).netloc]:
+                return self._fetch_function(url)
+
+        with ThreadPoolExecutor(max_workers=min(self._max_in_flight_requests, len(urls))) as executor:
+            futures = [executor.submit(fetch, url) for url in urls]
+
+        results: List[Union[FetchResult, BaseException]] = []
+        for future in futures:
+            error = future.exception()
+            results.append(error if error is not None else future.result())
+
+        return results
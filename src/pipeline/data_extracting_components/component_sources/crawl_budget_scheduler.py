@@ -0,0 +1,99 @@
+import math
+from datetime import datetime
+from typing import Dict, Optional
+
+from src.entities.pipeline.component_properties import CrawlBudgetProperties
+from src.pipeline.data_extracting_components.component_sources.extraction_state_store import PositionYield
+
+
+class CrawlBudgetScheduler:
+    """
+    Распределяет бюджет запросов запуска между позициями. Приоритет позиции - ожидаемое число новых резюме
+    на страницу выдачи (сглаженное по прошлым запускам), умноженное на множитель давности последнего обхода.
+    Страница стоит одного запроса выдачи и ожидаемого числа запросов новых резюме.
+    Сначала каждая позиция в порядке приоритета получает min_pages_per_position страниц,
+    остаток делится пропорционально приоритету, недоиспользованные запросы раздаются по одной странице.
+    Позиции, на которые бюджета не хватило, в этом запуске не обходятся и к следующему становятся приоритетнее.
+    """
+
+    _MIN_EXPECTED_YIELD = 0.1
+    _SECONDS_PER_DAY = 86400
+
+    def __init__(self, properties: CrawlBudgetProperties):
+        self._properties = properties
+
+    def allocate(
+        self,
+        max_pages_by_position: Dict[str, int],
+        yields: Dict[str, PositionYield],
+        now: datetime,
+    ) -> Dict[str, int]:
+        """
+        :param max_pages_by_position: Максимальное число страниц выдачи каждой позиции.
+        :param yields: Статистика прошлых обходов позиций.
+        :param now: Время запуска.
+        :return: Число страниц для каждой позиции в порядке убывания приоритета, 0 - позиция пропускается.
+        """
+        priorities = {
+            position: self.get_priority(yields.get(position), now) for position in max_pages_by_position
+        }
+        costs = {position: self.get_page_cost(yields.get(position)) for position in max_pages_by_position}
+        ordered_positions = sorted(max_pages_by_position, key=lambda position: priorities[position], reverse=True)
+
+        budget = float(self._properties.request_budget)
+        pages = {position: 0 for position in ordered_positions}
+        for position in ordered_positions:
+            min_pages = min(self._properties.min_pages_per_position, max_pages_by_position[position])
+            if min_pages * costs[position] <= budget:
+                pages[position] = min_pages
+                budget -= min_pages * costs[position]
+
+        funded_positions = [position for position in ordered_positions if pages[position] > 0]
+        total_priority = sum(priorities[position] for position in funded_positions)
+        proportional_budget = budget
+        for position in funded_positions:
+            share = proportional_budget * priorities[position] / total_priority
+            extra_pages = min(
+                math.floor(share / costs[position]),
+                max_pages_by_position[position] - pages[position],
+            )
+            pages[position] += extra_pages
+            budget -= extra_pages * costs[position]
+
+        for position in funded_positions:
+            if pages[position] < max_pages_by_position[position] and costs[position] <= budget:
+                pages[position] += 1
+                budget -= costs[position]
+
+        return pages
+
+    def get_priority(self, position_yield: Optional[PositionYield], now: datetime) -> float:
+        if position_yield is None:
+            return self._properties.unknown_position_yield * self._properties.max_staleness_factor
+
+        staleness_days = max((now - position_yield.last_crawled_at).total_seconds(), 0) / self._SECONDS_PER_DAY
+        staleness_factor = min(
+            1 + self._properties.staleness_weight * staleness_days,
+            self._properties.max_staleness_factor,
+        )
+        return max(position_yield.new_resumes_per_page, self._MIN_EXPECTED_YIELD) * staleness_factor
+
+    def get_page_cost(self, position_yield: Optional[PositionYield]) -> float:
+        if position_yield is None:
+            return 1 + self._properties.unknown_position_yield
+
+        return 1 + position_yield.new_resumes_per_page
+
+    def update_yield(
+        self,
+        previous: Optional[PositionYield],
+        pages_crawled: int,
+        new_resumes: int,
+        crawled_at: datetime,
+    ) -> PositionYield:
+        observed = new_resumes / pages_crawled
+        if previous is None:
+            return PositionYield(observed, crawled_at)
+
+        smoothing = self._properties.yield_smoothing
+        return PositionYield(smoothing * observed + (1 - smoothing) * previous.new_resumes_per_page, crawled_at)
@@ -0,0 +1,179 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, TextIO, Tuple
+
+from src import logger
+from src.pipeline.data_extracting_components.component_sources import json_codec
+
+RowKey = Tuple[str, ...]
+
+
+class ExtractionJournal:
+    """
+    Журнал контрольных точек шага извлечения в формате JSONL: каждая запись дописывается
+    и сбрасывается на диск (fsync) до того, как выполнение продолжится.
+    Журнал незавершённого запуска восстанавливается при следующем старте: загруженные страницы поиска,
+    обойденные позиции и разобранные резюме повторно не обрабатываются, а записанные в SOURCE_DATA строки
+    узнаются по ключу строки, так что при повторе они не дописываются, даже если попадут в другие части.
+    Недописанная из-за сбоя последняя строка отбрасывается.
+    Без journal_path журнал ведётся только в памяти и ничего не восстанавливает.
+    """
+
+    def __init__(self, journal_path: Optional[Path] = None):
+        self._journal_path = journal_path
+
+        self.run_parameters: Optional[Dict[str, Any]] = None
+        self.search_pages: Dict[str, List[Dict[str, Any]]] = {}
+        self.position_resume_urls: Dict[str, List[str]] = {}
+        self.position_pages: Dict[str, int] = {}
+        self.resumes: Dict[str, Dict[str, Any]] = {}
+        self._next_chunk_id = 0
+        self.committed_rows: Set[RowKey] = set()
+        self._started_chunks: Dict[int, List[RowKey]] = {}
+
+        self._file: Optional[TextIO] = None
+        if journal_path is not None:
+            journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._restore(journal_path)
+            self._file = open(journal_path, "a", encoding="utf-8")
+
+    @property
+    def is_restored(self) -> bool:
+        return self.run_parameters is not None
+
+    def start_run(
+        self,
+        extraction_date: datetime,
+        watermarks: Dict[str, Dict[str, datetime]],
+    ) -> Tuple[datetime, Dict[str, Dict[str, datetime]]]:
+        """
+        :param watermarks: Водяные знаки позиций каждого источника.
+        :return: Дата выгрузки и водяные знаки; при восстановлении - значения прерванного запуска,
+            чтобы повторно сформированные части совпали с уже записанными.
+        """
+        if self.run_parameters is None:
+            self.run_parameters = {"extraction_date": extraction_date, "watermarks": watermarks}
+            self._write([{"type": "run_started", **self.run_parameters}])
+
+        return self.run_parameters["extraction_date"], self.run_parameters["watermarks"]
+
+    def record_search_pages(self, pages: Iterable[Tuple[str, List[Dict[str, Any]]]]) -> None:
+        entries = []
+        for url, cards in pages:
+            self.search_pages[url] = cards
+            entries.append({"type": "search_page_fetched", "url": url, "cards": cards})
+
+        self._write(entries)
+
+    def record_position(self, position: str, resume_urls: List[str], pages_count: int) -> None:
+        self.position_resume_urls[position] = resume_urls
+        self.position_pages[position] = pages_count
+        self._write(
+            [{"type": "position_crawled", "position": position, "resume_urls": resume_urls, "pages": pages_count}]
+        )
+
+    def record_resumes(self, resumes: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        entries = []
+        for url, info in resumes:
+            self.resumes[url] = info
+            entries.append({"type": "resume_parsed", "url": url, "info": info})
+
+        self._write(entries)
+
+    def persist_resumes(self, resumes: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Загруженные резюме пишутся только в файл: строки по ним сразу уходят в SOURCE_DATA, и в памяти
+        запуска они не нужны. При восстановлении они читаются из файла в resumes, как и записанные record_resumes.
+        """
+        self._write([{"type": "resume_parsed", "url": url, "info": info} for url, info in resumes])
+
+    @property
+    def uncommitted_rows(self) -> Set[RowKey]:
+        """
+        :return: Ключи строк частей, запись которых начата, но не подтверждена: они могли попасть в SOURCE_DATA.
+        """
+        return {row for rows in self._started_chunks.values() for row in rows}
+
+    def record_chunk_started(self, rows: List[RowKey]) -> int:
+        """
+        :return: Номер части в журнале, который передаётся в record_chunk_committed.
+        """
+        chunk_id = self._next_chunk_id
+        self._next_chunk_id += 1
+        self._started_chunks[chunk_id] = rows
+        self._write([{"type": "chunk_started", "chunk": chunk_id, "rows": rows}])
+        return chunk_id
+
+    def record_chunk_committed(self, chunk_id: int) -> None:
+        self.committed_rows.update(self._started_chunks.pop(chunk_id))
+        self._write([{"type": "chunk_committed", "chunk": chunk_id}])
+
+    def complete(self) -> None:
+        """
+        Запуск завершён, все части записаны: журнал удаляется, следующий запуск начнётся с нуля.
+        """
+        self.close()
+        if self._journal_path is not None:
+            self._journal_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, entries: List[Dict[str, Any]]) -> None:
+        if self._file is None or not entries:
+            return
+
+        lines = [json_codec.dumps(entry) + "\n" for entry in entries]
+        self._file.write("".join(lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _restore(self, journal_path: Path) -> None:
+        if not journal_path.exists():
+            return
+
+        content = journal_path.read_bytes()
+        if content and not content.endswith(b"\n"):
+            content = content[: content.rfind(b"\n") + 1]
+            with open(journal_path, "r+b") as fout:
+                fout.truncate(len(content))
+            logger.warning(f"Отброшена недописанная запись журнала извлечения {journal_path}")
+
+        for line in content.decode("utf-8").split("\n"):
+            if not line:
+                continue
+
+            try:
+                entry = json_codec.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Пропущена повреждённая запись журнала извлечения {journal_path}")
+                continue
+
+            self._apply(entry)
+
+        if self.run_parameters is not None:
+            logger.info(
+                f"Восстановлен журнал извлечения: позиций {len(self.position_resume_urls)}, "
+                f"резюме {len(self.resumes)}, записанных строк {len(self.committed_rows)}"
+            )
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        entry_type = entry.pop("type")
+        if entry_type == "run_started":
+            self.run_parameters = entry
+        elif entry_type == "search_page_fetched":
+            self.search_pages[entry["url"]] = entry["cards"]
+        elif entry_type == "position_crawled":
+            self.position_resume_urls[entry["position"]] = entry["resume_urls"]
+            self.position_pages[entry["position"]] = entry["pages"]
+        elif entry_type == "resume_parsed":
+            self.resumes[entry["url"]] = entry["info"]
+        elif entry_type == "chunk_started":
+            self._started_chunks[entry["chunk"]] = [tuple(row) for row in entry["rows"]]
+            self._next_chunk_id = max(self._next_chunk_id, entry["chunk"] + 1)
+        elif entry_type == "chunk_committed":
+            self.committed_rows.update(self._started_chunks.pop(entry["chunk"], []))
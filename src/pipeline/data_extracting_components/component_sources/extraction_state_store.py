@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils.exceptions import ServiceError
+
+
+@dataclass
+class PositionWatermark:
+    last_update_date: datetime
+    last_resume_url: str
+
+
+@dataclass
+class PositionYield:
+    new_resumes_per_page: float
+    last_crawled_at: datetime
+
+
+class ExtractionStateStore:
+    """
+    Небольшой JSON-файл состояния шага извлечения: для каждого источника и позиции - дата обновления
+    и ссылка самого свежего выгруженного резюме, а также сглаженное число новых резюме
+    на страницу выдачи и время последнего обхода. Читается целиком при старте,
+    перезаписывается атомарно (временный файл + os.replace) по завершении шага.
+    """
+
+    _VERSION = 1
+
+    def __init__(self, state_path: Path):
+        self._state_path = state_path
+
+    @property
+    def exists(self) -> bool:
+        return self._state_path.is_file()
+
+    def load(self) -> Dict[str, Dict[str, PositionWatermark]]:
+        """
+        :return: Водяные знаки позиций каждого источника.
+        """
+        if not self.exists:
+            return {}
+
+        try:
+            return {
+                source: {
+                    position: PositionWatermark(
+                        last_update_date=datetime.fromisoformat(watermark["last_update_date"]),
+                        last_resume_url=watermark["last_resume_url"],
+                    )
+                    for position, watermark in source_state["positions"].items()
+                }
+                for source, source_state in self._read_state().items()
+            }
+        except (ValueError, KeyError, TypeError) as e:
+            raise ServiceError(f"Повреждён файл состояния извлечения {self._state_path}: {e}") from e
+
+    def load_yields(self) -> Dict[str, Dict[str, PositionYield]]:
+        """
+        :return: Статистика обхода позиций каждого источника.
+        """
+        if not self.exists:
+            return {}
+
+        try:
+            return {
+                source: {
+                    position: PositionYield(
+                        new_resumes_per_page=float(position_yield["new_resumes_per_page"]),
+                        last_crawled_at=datetime.fromisoformat(position_yield["last_crawled_at"]),
+                    )
+                    for position, position_yield in source_state["yields"].items()
+                }
+                for source, source_state in self._read_state().items()
+            }
+        except (ValueError, KeyError, TypeError) as e:
+            raise ServiceError(f"Повреждён файл состояния извлечения {self._state_path}: {e}") from e
+
+    def save(
+        self,
+        watermarks: Dict[str, Dict[str, PositionWatermark]],
+        yields: Optional[Dict[str, Dict[str, PositionYield]]] = None,
+    ) -> None:
+        """
+        :param watermarks: Водяные знаки позиций каждого источника.
+        :param yields: Статистика обхода позиций каждого источника; если не передана, сохраняется записанная ранее.
+        """
+        if yields is None:
+            yields = self.load_yields()
+
+        state: Dict[str, Any] = {
+            "version": self._VERSION,
+            "sources": {
+                source: {
+                    "positions": {
+                        position: {
+                            "last_update_date": watermark.last_update_date.isoformat(),
+                            "last_resume_url": watermark.last_resume_url,
+                        }
+                        for position, watermark in sorted(watermarks.get(source, {}).items())
+                    },
+                    "yields": {
+                        position: {
+                            "new_resumes_per_page": round(position_yield.new_resumes_per_page, 4),
+                            "last_crawled_at": position_yield.last_crawled_at.isoformat(),
+                        }
+                        for position, position_yield in sorted(yields.get(source, {}).items())
+                    },
+                }
+                for source in sorted(watermarks.keys() | yields.keys())
+            },
+        }
+
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self._state_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as fout:
+                json.dump(state, fout, ensure_ascii=False, indent=2)
+                fout.flush()
+                os.fsync(fout.fileno())
+            os.replace(temp_path, self._state_path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def _read_state(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: Состояние каждого источника.
+        """
+        state: Dict[str, Any] = json.loads(self._state_path.read_text(encoding="utf-8"))
+        version = state.get("version")
+        if version != self._VERSION:
+            raise ServiceError(f"Неизвестная версия файла состояния извлечения {self._state_path}: {version}")
+
+        sources: Dict[str, Dict[str, Any]] = state["sources"]
+        return sources
@@ -0,0 +1,190 @@
+import json
+import math
+import os
+import tempfile
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+
+class LogHistogram:
+    """
+    Гистограмма в духе HDR: значения раскладываются по степеням двойки, каждая степень делится
+    на sub_buckets равных корзин, поэтому относительная погрешность перцентилей не больше 1 / sub_buckets
+    при памяти, логарифмической по диапазону значений. Значения меньше 1 попадают в нулевую корзину.
+    """
+
+    _PERCENTILES = (0.5, 0.9, 0.99, 0.999)
+
+    def __init__(self, sub_buckets: int = 32):
+        self._sub_buckets = sub_buckets
+        self._counts: Counter[int] = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self._counts[self._get_bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def get_percentile(self, share: float) -> float:
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(share * self.count))
+        seen = 0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if seen >= rank:
+                return min(self._get_upper_bound(bucket), self.max)
+
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        summary = {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "min": round(self.min, 3) if self.count else 0.0,
+            "max": round(self.max, 3),
+        }
+        for share in self._PERCENTILES:
+            summary[f"p{share * 100:g}"] = round(self.get_percentile(share), 3)
+
+        return summary
+
+    def _get_bucket(self, value: float) -> int:
+        if value < 1:
+            return 0
+
+        exponent = math.floor(math.log2(value))
+        sub_bucket = math.floor((value / 2.0**exponent - 1) * self._sub_buckets)
+        return 1 + exponent * self._sub_buckets + min(sub_bucket, self._sub_buckets - 1)
+
+    def _get_upper_bound(self, bucket: int) -> float:
+        if bucket == 0:
+            return 1.0
+
+        exponent, sub_bucket = divmod(bucket - 1, self._sub_buckets)
+        return float(2**exponent * (1 + (sub_bucket + 1) / self._sub_buckets))
+
+
+class ExtractionTelemetry:
+    """
+    Потокобезопасный сборщик телеметрии шага извлечения: длительность, размер ответа, код и число повторов
+    каждого запроса, ожидание в ограничителе запросов, время разбора страниц и отдельных полей резюме,
+    доля пустых полей. Времена хранятся в миллисекундах (поля - в микросекундах), размеры - в байтах.
+    """
+
+    _ERROR_STATUS = "error"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._request_latency_ms = LogHistogram()
+        self._response_bytes = LogHistogram()
+        self._throttle_wait_ms = LogHistogram()
+        self._page_parse_ms = LogHistogram()
+        self._statuses: Counter[str] = Counter()
+        self._retries: Counter[int] = Counter()
+        self._cached_responses = 0
+        self._parse_errors = 0
+        self._field_us: Dict[str, LogHistogram] = {}
+        self._field_empty: Counter[str] = Counter()
+        self._field_pages = 0
+
+    def record_request(
+        self,
+        latency: float,
+        response_bytes: int,
+        status_code: Optional[int],
+        retries: int,
+        from_cache: bool = False,
+    ) -> None:
+        """
+        :param latency: Полное время запроса в секундах, включая повторы и ожидание ограничителя.
+        :param status_code: Код итогового ответа, None - запрос завершился исключением.
+        """
+        with self._lock:
+            self._request_latency_ms.record(latency * 1000)
+            self._response_bytes.record(response_bytes)
+            self._statuses[str(status_code) if status_code is not None else self._ERROR_STATUS] += 1
+            self._retries[retries] += 1
+            self._cached_responses += from_cache
+
+    def record_throttle_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._throttle_wait_ms.record(seconds * 1000)
+
+    def record_page_parse(self, seconds: float, field_seconds: Dict[str, float], empty_fields: Iterable[str]) -> None:
+        with self._lock:
+            self._page_parse_ms.record(seconds * 1000)
+            self._field_pages += 1
+            for field, elapsed in field_seconds.items():
+                self._field_us.setdefault(field, LogHistogram()).record(elapsed * 1_000_000)
+            self._field_empty.update(empty_fields)
+
+    def record_parse_error(self, seconds: float) -> None:
+        with self._lock:
+            self._page_parse_ms.record(seconds * 1000)
+            self._parse_errors += 1
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            field_pages = max(self._field_pages, 1)
+            return {
+                "requests": {
+                    "latency_ms": self._request_latency_ms.to_dict(),
+                    "response_bytes": self._response_bytes.to_dict(),
+                    "throttle_wait_ms": self._throttle_wait_ms.to_dict(),
+                    "statuses": dict(sorted(self._statuses.items())),
+                    "retries": {str(retries): count for retries, count in sorted(self._retries.items())},
+                    "from_cache": self._cached_responses,
+                },
+                "parsing": {
+                    "page_parse_ms": self._page_parse_ms.to_dict(),
+                    "parse_errors": self._parse_errors,
+                    "parsed_pages": self._field_pages,
+                },
+                "fields": {
+                    field: {
+                        "extract_us": histogram.to_dict(),
+                        "empty_rate": round(self._field_empty[field] / field_pages, 4),
+                    }
+                    for field, histogram in sorted(self._field_us.items())
+                },
+            }
+
+    def get_published_tables(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: Плоские таблицы для ILogger.publish_dictionary_values.
+        """
+        summary = self.summary()
+        requests = summary["requests"]
+        tables: Dict[str, Dict[str, Any]] = {
+            "Телеметрия: длительность запросов, мс": requests["latency_ms"],
+            "Телеметрия: ожидание ограничителя, мс": requests["throttle_wait_ms"],
+            "Телеметрия: размер ответов, байт": requests["response_bytes"],
+            "Телеметрия: коды ответов": requests["statuses"] or {"-": 0},
+            "Телеметрия: число повторов": requests["retries"] or {"-": 0},
+            "Телеметрия: разбор страниц, мс": summary["parsing"]["page_parse_ms"],
+        }
+
+        fields: Dict[str, Dict[str, Any]] = summary["fields"]
+        if fields:
+            tables["Телеметрия: доля пустых полей"] = {field: values["empty_rate"] for field, values in fields.items()}
+            tables["Телеметрия: разбор полей, мкс p99"] = {
+                field: values["extract_us"]["p99"] for field, values in fields.items()
+            }
+
+        return tables
+
+    def save(self, report_path: Path) -> None:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=report_path.parent, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as fout:
+            json.dump(self.summary(), fout, ensure_ascii=False, indent=2)
+        os.replace(temp_path, report_path)
@@ -0,0 +1,229 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    @property
+    def has_validators(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+
+class HttpResponseCache:
+    """
+    Дисковый кэш HTTP-ответов: тела хранятся по sha256 содержимого,
+    индекс URL -> (тело, ETag, Last-Modified) - в SQLite.
+    Размер ограничен вытеснением давно не использованных записей (LRU): суммарный размер тел ведётся
+    в памяти, поэтому запись без переполнения не сканирует индекс. Время обращения при попаданиях
+    копится в памяти и записывается в индекс пачками по _TOUCH_BATCH_SIZE, перед вытеснением и при закрытии.
+    """
+
+    _INDEX_FILE_NAME = "index.sqlite"
+    _BLOBS_DIR_NAME = "blobs"
+    _TOUCH_BATCH_SIZE = 256
+    _EVICTION_BATCH_SIZE = 64
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int, ttl_seconds: float):
+        self._cache_dir = cache_dir
+        self._blobs_dir = cache_dir / self._BLOBS_DIR_NAME
+        self._blobs_dir.mkdir(parents=True, exist_ok=True)
+
+        self._max_size_bytes = max_size_bytes
+        self._ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(cache_dir / self._INDEX_FILE_NAME, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "url TEXT PRIMARY KEY, body_hash TEXT NOT NULL, size INTEGER NOT NULL, "
+            "etag TEXT, last_modified TEXT, stored_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS entries_body_hash ON entries (body_hash)")
+        self._connection.commit()
+        self._total_size: int = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        # url -> (время обращения, обновлено ли время сохранения)
+        self._pending_touches: Dict[str, Tuple[float, bool]] = {}
+
+        self._statistics = {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0, "evicted": 0}
+
+    @property
+    def statistics(self) -> Dict[str, float]:
+        with self._lock:
+            total_size = self._total_size
+            statistics: Dict[str, float] = dict(self._statistics)
+
+        requests_count = statistics["hits"] + statistics["revalidated"] + statistics["misses"]
+        statistics["hit_rate"] = (
+            round((statistics["hits"] + statistics["revalidated"]) / requests_count, 4) if requests_count else 0.0
+        )
+        statistics["size_mb"] = round(total_size / 2**20, 2)
+        return statistics
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body_hash, etag, last_modified, stored_at FROM entries WHERE url = ?",
+                (url,),
+            ).fetchone()
+            pending_touch = self._pending_touches.get(url)
+
+        if row is None:
+            return None
+
+        body_hash, etag, last_modified, stored_at = row
+        if pending_touch is not None and pending_touch[1]:
+            stored_at = pending_touch[0]
+        try:
+            text = self._get_blob_path(body_hash).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        return CachedResponse(url, text, etag, last_modified, stored_at)
+
+    def is_fresh(self, cached: CachedResponse) -> bool:
+        """
+        Ответ без валидаторов считается свежим в пределах TTL,
+        ответ с ETag/Last-Modified всегда перепроверяется условным запросом.
+        """
+        return not cached.has_validators and time.time() - cached.stored_at < self._ttl_seconds
+
+    def get_conditional_headers(self, cached: CachedResponse) -> Dict[str, str]:
+        headers = {}
+        if cached.etag is not None:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified is not None:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        return headers
+
+    def register_hit(self, url: str) -> None:
+        self._touch(url, "hits", refresh_stored_at=False)
+
+    def register_revalidation(self, url: str) -> None:
+        self._touch(url, "revalidated", refresh_stored_at=True)
+
+    def register_miss(self) -> None:
+        with self._lock:
+            self._statistics["misses"] += 1
+
+    def store(self, url: str, text: str, headers: Dict[str, str]) -> None:
+        body = text.encode("utf-8")
+        body_hash = hashlib.sha256(body).hexdigest()
+        blob_path = self._get_blob_path(body_hash)
+        if not blob_path.exists():
+            self._write_blob(blob_path, body)
+
+        now = time.time()
+        normalized_headers = {key.lower(): value for key, value in headers.items()}
+        with self._lock:
+            self._pending_touches.pop(url, None)
+            previous = self._connection.execute("SELECT body_hash, size FROM entries WHERE url = ?", (url,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    body_hash,
+                    len(body),
+                    normalized_headers.get("etag"),
+                    normalized_headers.get("last-modified"),
+                    now,
+                    now,
+                ),
+            )
+            self._connection.commit()
+            self._statistics["stored"] += 1
+            self._total_size += len(body) - (previous[1] if previous is not None else 0)
+
+            if previous is not None and previous[0] != body_hash:
+                self._remove_unreferenced_blob(previous[0])
+
+            if self._total_size > self._max_size_bytes:
+                self._evict()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._connection.close()
+
+    def _touch(self, url: str, counter: str, refresh_stored_at: bool) -> None:
+        with self._lock:
+            previous = self._pending_touches.get(url)
+            refresh_stored_at = refresh_stored_at or (previous is not None and previous[1])
+            self._pending_touches[url] = (time.time(), refresh_stored_at)
+            self._statistics[counter] += 1
+            if len(self._pending_touches) >= self._TOUCH_BATCH_SIZE:
+                self._flush_touches()
+
+    def _flush_touches(self) -> None:
+        if not self._pending_touches:
+            return
+
+        self._connection.executemany(
+            "UPDATE entries SET last_access = ?, stored_at = CASE WHEN ? THEN ? ELSE stored_at END WHERE url = ?",
+            [
+                (last_access, refresh_stored_at, last_access, url)
+                for url, (last_access, refresh_stored_at) in self._pending_touches.items()
+            ],
+        )
+        self._connection.commit()
+        self._pending_touches.clear()
+
+    def _evict(self) -> None:
+        """
+        Удаляет самые давние по обращению записи пачками по индексу last_access, пока размер не уложится в лимит.
+        """
+        self._flush_touches()
+        while self._total_size > self._max_size_bytes:
+            rows = self._connection.execute(
+                "SELECT url, body_hash, size FROM entries ORDER BY last_access LIMIT ?",
+                (self._EVICTION_BATCH_SIZE,),
+            ).fetchall()
+            if not rows:
+                break
+
+            for url, body_hash, size in rows:
+                if self._total_size <= self._max_size_bytes:
+                    break
+
+                self._connection.execute("DELETE FROM entries WHERE url = ?", (url,))
+                self._remove_unreferenced_blob(body_hash)
+                self._total_size -= size
+                self._statistics["evicted"] += 1
+
+        self._connection.commit()
+
+    def _remove_unreferenced_blob(self, body_hash: str) -> None:
+        """
+        Ссылки на тело ищутся по индексу entries_body_hash, а не полным просмотром записей.
+        """
+        is_referenced = self._connection.execute(
+            "SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1",
+            (body_hash,),
+        ).fetchone()
+        if is_referenced is None:
+            self._get_blob_path(body_hash).unlink(missing_ok=True)
+
+    def _get_blob_path(self, body_hash: str) -> Path:
+        return self._blobs_dir / body_hash[:2] / body_hash
+
+    @staticmethod
+    def _write_blob(blob_path: Path, body: bytes) -> None:
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=blob_path.parent)
+        with os.fdopen(file_descriptor, "wb") as fout:
+            fout.write(body)
+        os.replace(temp_path, blob_path)
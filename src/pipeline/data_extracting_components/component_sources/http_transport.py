@@ -0,0 +1,216 @@
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from importlib.util import find_spec
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src import logger
+from src.entities.pipeline.component_properties import HttpTransportProperties
+from src.pipeline.data_extracting_components.component_sources.adaptive_rate_limiter import AdaptiveRateLimiter
+from src.pipeline.data_extracting_components.component_sources.extraction_telemetry import ExtractionTelemetry
+from src.pipeline.data_extracting_components.component_sources.http_response_cache import HttpResponseCache
+from src.pipeline.data_extracting_components.component_sources.raw_html_archive import RawHtmlArchive
+
+
+@dataclass
+class HttpResponse:
+    url: str
+    status_code: int
+    text: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+    retries: int = 0
+    from_cache: bool = False
+    size: int = 0
+
+
+class HttpTransport:
+    """
+    Общий HTTP-транспорт шага извлечения: пул keep-alive соединений,
+    сжатие gzip/brotli и повторы 5xx/429/таймаутов с экспоненциальной задержкой и джиттером.
+    При переданном кэше ответы переиспользуются через условные запросы (ETag/Last-Modified),
+    при переданном ограничителе каждая сетевая попытка проходит через него.
+    При переданном архиве каждое успешно загруженное из сети тело ответа сохраняется в него,
+    при переданной телеметрии каждый запрос и ожидание в ограничителе учитываются в ней.
+    """
+
+    _RETRYABLE_EXCEPTIONS = (requests.Timeout, requests.ConnectionError)
+    _GATEWAY_TIMEOUT_STATUS = 504
+
+    def __init__(
+        self,
+        properties: Optional[HttpTransportProperties] = None,
+        cache: Optional[HttpResponseCache] = None,
+        offline: bool = False,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        archive: Optional[RawHtmlArchive] = None,
+        telemetry: Optional[ExtractionTelemetry] = None,
+    ):
+        self._properties = properties or HttpTransportProperties()
+        self._cache = cache
+        self._offline = offline
+        self._rate_limiter = rate_limiter
+        self._archive = archive
+        self._telemetry = telemetry
+
+        adapter = HTTPAdapter(
+            pool_connections=self._properties.pool_connections,
+            pool_maxsize=self._properties.pool_maxsize,
+            max_retries=0,
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Accept-Encoding"] = self._get_accept_encoding()
+
+    @property
+    def cache(self) -> Optional[HttpResponseCache]:
+        return self._cache
+
+    @property
+    def rate_limiter(self) -> Optional[AdaptiveRateLimiter]:
+        return self._rate_limiter
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        """
+        :param url: Адрес страницы.
+        :param headers: Дополнительные заголовки запроса.
+        :return: Ответ после последней попытки. Если все попытки завершились
+            таймаутом или ошибкой соединения, пробрасывается последнее исключение.
+        """
+        started = time.perf_counter()
+        try:
+            response = self._get(url, headers)
+        except Exception:
+            if self._telemetry is not None:
+                self._telemetry.record_request(time.perf_counter() - started, 0, None, self._properties.max_retries)
+            raise
+
+        if self._telemetry is not None:
+            self._telemetry.record_request(
+                time.perf_counter() - started,
+                response.size or len(response.text.encode("utf-8")),
+                response.status_code,
+                response.retries,
+                response.from_cache,
+            )
+
+        if self._archive is not None and response.status_code == 200 and not response.from_cache:
+            self._archive.append(url, datetime.now(), response.text)
+
+        return response
+
+    def close(self) -> None:
+        self._session.close()
+        if self._cache is not None:
+            self._cache.close()
+        if self._archive is not None:
+            self._archive.close()
+
+    def __enter__(self) -> "HttpTransport":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]]) -> HttpResponse:
+        if self._cache is None:
+            return self._get_from_network(url, headers)
+
+        cached = self._cache.lookup(url)
+        if cached is not None and (self._offline or self._cache.is_fresh(cached)):
+            self._cache.register_hit(url)
+            return HttpResponse(url=url, status_code=200, text=cached.text, from_cache=True)
+
+        if cached is None and self._offline:
+            self._cache.register_miss()
+            return HttpResponse(url=url, status_code=self._GATEWAY_TIMEOUT_STATUS, text="")
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            request_headers |= self._cache.get_conditional_headers(cached)
+
+        response = self._get_from_network(url, request_headers)
+        if response.status_code == 304 and cached is not None:
+            self._cache.register_revalidation(url)
+            response.status_code = 200
+            response.text = cached.text
+            response.from_cache = True
+            return response
+
+        self._cache.register_miss()
+        if response.status_code == 200:
+            self._cache.store(url, response.text, response.headers)
+
+        return response
+
+    def _get_from_network(self, url: str, headers: Optional[Dict[str, str]]) -> HttpResponse:
+        max_retries = self._properties.max_retries
+        for attempt in range(max_retries + 1):
+            started = time.perf_counter()
+            try:
+                response = self._send(url, headers)
+            except self._RETRYABLE_EXCEPTIONS as e:
+                if attempt == max_retries:
+                    raise
+
+                logger.debug(f"Повтор запроса {url} ({attempt + 1}/{max_retries}) из-за {e}")
+                time.sleep(self._get_backoff(attempt))
+                continue
+
+            elapsed = time.perf_counter() - started
+            if response.status_code in self._properties.retry_statuses and attempt < max_retries:
+                logger.debug(f"Повтор запроса {url} ({attempt + 1}/{max_retries}) из-за {response.status_code}")
+                time.sleep(self._get_backoff(attempt, response.headers.get("Retry-After")))
+                continue
+
+            return HttpResponse(
+                url=url,
+                status_code=response.status_code,
+                text=response.text,
+                headers=dict(response.headers),
+                elapsed=elapsed,
+                retries=attempt,
+                size=len(response.content),
+            )
+
+        raise AssertionError("Недостижимое состояние цикла повторов")
+
+    def _send(self, url: str, headers: Optional[Dict[str, str]]) -> requests.Response:
+        if self._rate_limiter is None:
+            return self._session.get(url, headers=headers, timeout=self._properties.timeout)
+
+        host = urlsplit(url).netloc
+        started = time.perf_counter()
+        self._rate_limiter.acquire(host)
+        if self._telemetry is not None:
+            self._telemetry.record_throttle_wait(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        status_code: Optional[int] = None
+        try:
+            response = self._session.get(url, headers=headers, timeout=self._properties.timeout)
+            status_code = response.status_code
+            return response
+        finally:
+            self._rate_limiter.release(host, time.perf_counter() - started, status_code)
+
+    def _get_backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        ceiling = min(self._properties.backoff_max, self._properties.backoff_factor * 2**attempt)
+        backoff = random.uniform(0, ceiling)
+        if retry_after is not None and retry_after.isdigit():
+            backoff = max(backoff, min(float(retry_after), self._properties.backoff_max))
+
+        return backoff
+
+    @staticmethod
+    def _get_accept_encoding() -> str:
+        if find_spec("brotli") is not None or find_spec("brotlicffi") is not None:
+            return "gzip, deflate, br"
+
+        return "gzip, deflate"
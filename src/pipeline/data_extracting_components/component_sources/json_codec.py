@@ -0,0 +1,28 @@
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+
+def encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+
+    raise TypeError(f"Значение типа {type(value)} не сериализуется в JSON")
+
+
+def decode_object(obj: Dict[str, Any]) -> Any:
+    if obj.keys() == {"$datetime"}:
+        return datetime.fromisoformat(obj["$datetime"])
+
+    return obj
+
+
+def dumps(value: Any) -> str:
+    """
+    Сериализует значение в JSON; datetime сохраняется как {"$datetime": isoformat} и восстанавливается loads.
+    """
+    return json.dumps(value, ensure_ascii=False, default=encode_value)
+
+
+def loads(text: str) -> Any:
+    return json.loads(text, object_hook=decode_object)
@@ -0,0 +1,136 @@
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional
+
+from src.utils.exceptions import ServiceError
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    url: str
+    fetched_at: datetime
+    segment: str
+    offset: int
+    length: int
+    codec: str
+
+
+class RawHtmlArchive:
+    """
+    Архив сырых HTML-ответов: каждое тело сжимается отдельным кадром (zstd, если установлен zstandard,
+    иначе zlib) и дописывается в текущий сегмент; при превышении segment_max_bytes начинается новый сегмент.
+    Индекс (URL, время загрузки) -> (сегмент, смещение, длина) хранится в SQLite,
+    поэтому любую страницу можно прочитать без распаковки соседних.
+    Кодек записывается в индекс для каждой страницы, так что архив читается на любом агенте,
+    где установлен пакет этого кодека.
+    """
+
+    _INDEX_FILE_NAME = "index.sqlite"
+    _SEGMENT_NAME_TEMPLATE = "segment-{:06d}.{}"
+
+    def __init__(self, archive_dir: Path, segment_max_bytes: int, compression_level: int):
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        self._archive_dir = archive_dir
+        self._segment_max_bytes = segment_max_bytes
+
+        self._codec = "zstd" if zstandard is not None else "zlib"
+        self._compression_level = compression_level
+        self._compressor: Any = (
+            zstandard.ZstdCompressor(level=compression_level) if zstandard is not None else None
+        )
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(archive_dir / self._INDEX_FILE_NAME, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT NOT NULL, fetched_at TEXT NOT NULL, segment TEXT NOT NULL, "
+            "offset INTEGER NOT NULL, length INTEGER NOT NULL, codec TEXT NOT NULL, "
+            "PRIMARY KEY (url, fetched_at))"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS pages_fetched_at ON pages (fetched_at)")
+        self._connection.commit()
+
+        self._segment_index = self._get_last_segment_index()
+
+    @property
+    def archive_dir(self) -> Path:
+        return self._archive_dir
+
+    def append(self, url: str, fetched_at: datetime, text: str) -> None:
+        frame = self._compress(text.encode("utf-8"))
+        with self._lock:
+            segment_path = self._get_segment_path(self._segment_index)
+            if segment_path.exists() and segment_path.stat().st_size + len(frame) > self._segment_max_bytes:
+                self._segment_index += 1
+                segment_path = self._get_segment_path(self._segment_index)
+
+            with open(segment_path, "ab") as fout:
+                offset = fout.tell()
+                fout.write(frame)
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                (url, fetched_at.isoformat(), segment_path.name, offset, len(frame), self._codec),
+            )
+            self._connection.commit()
+
+    def list_pages(self, fetched_from: Optional[datetime] = None) -> List[ArchivedPage]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT url, fetched_at, segment, offset, length, codec FROM pages "
+                "WHERE fetched_at >= ? ORDER BY segment, offset",
+                ((fetched_from or datetime.min).isoformat(),),
+            ).fetchall()
+
+        return [
+            ArchivedPage(url, datetime.fromisoformat(fetched_at), segment, offset, length, codec)
+            for url, fetched_at, segment, offset, length, codec in rows
+        ]
+
+    @staticmethod
+    def read_page(archive_dir: Path, page: ArchivedPage) -> str:
+        """
+        Читает одну страницу по записи индекса; не требует открытого архива, поэтому подходит для процессов-воркеров.
+        """
+        with open(archive_dir / page.segment, "rb") as fin:
+            fin.seek(page.offset)
+            frame = fin.read(page.length)
+
+        if page.codec == "zstd":
+            if zstandard is None:
+                raise ServiceError(f"Страница {page.url} сжата zstd: для чтения архива требуется пакет zstandard")
+            body: bytes = zstandard.ZstdDecompressor().decompress(frame)
+        elif page.codec == "zlib":
+            body = zlib.decompress(frame)
+        else:
+            raise ServiceError(f"Неизвестный кодек {page.codec} страницы архива {page.url}")
+
+        return body.decode("utf-8")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _compress(self, body: bytes) -> bytes:
+        if self._compressor is not None:
+            frame: bytes = self._compressor.compress(body)
+            return frame
+
+        return zlib.compress(body, min(self._compression_level, 9))
+
+    def _get_segment_path(self, segment_index: int) -> Path:
+        return self._archive_dir / self._SEGMENT_NAME_TEMPLATE.format(segment_index, self._codec)
+
+    def _get_last_segment_index(self) -> int:
+        segment_indices = [int(path.name.split("-")[1].split(".")[0]) for path in self._archive_dir.glob("segment-*")]
+        return max(segment_indices, default=0)
@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from src import logger
+
+
+class SearchPageCrawler:
+    """
+    Обходит страницы поиска одной позиции, считая выдачу отсортированной по дате обновления резюме.
+    Страницы загружаются окнами по prefetch_pages штук; обход останавливается на границе страницы,
+    самое старое резюме которой обновлено раньше водяного знака. Для глубокой выдачи
+    (от binary_search_min_pages страниц) граница ищется бинарным поиском по номеру страницы.
+    Загруженные при проверке резюме сохраняются в probed_resumes для повторного использования.
+    Карточки выдачи сохраняются в cards; если в карточке есть дата обновления, резюме для проверки не загружается.
+    """
+
+    _DATE_FIELD = "Дата обновления резюме"
+    _URL_FIELD = "Ссылка на резюме"
+    _NO_WATERMARK = datetime(year=1970, month=1, day=1)
+
+    def __init__(
+        self,
+        fetch_pages: Callable[[List[str]], Sequence[Union[List[Dict[str, Any]], BaseException]]],
+        fetch_resume: Callable[[str], Dict[str, Any]],
+        prefetch_pages: int,
+        binary_search_min_pages: int,
+    ):
+        self._fetch_pages = fetch_pages
+        self._fetch_resume = fetch_resume
+        self._prefetch_pages = max(prefetch_pages, 1)
+        self._binary_search_min_pages = binary_search_min_pages
+
+        self._pages: Dict[str, List[str]] = {}
+        self.probed_resumes: Dict[str, Dict[str, Any]] = {}
+        self.cards: Dict[str, Dict[str, Any]] = {}
+
+    def crawl(self, position_url: str, pages_count: int, watermark: datetime) -> List[List[str]]:
+        """
+        :param position_url: URL поиска позиции без номера страницы.
+        :param pages_count: Максимальное количество страниц выдачи.
+        :param watermark: Дата, резюме старше которой уже выгружены.
+        :return: Списки ссылок на резюме по загруженным страницам в порядке выдачи.
+        """
+        has_watermark = watermark > self._NO_WATERMARK
+        if has_watermark and pages_count >= self._binary_search_min_pages:
+            last_page = self._find_watermark_page(position_url, pages_count, watermark)
+            return [page for page in self._get_pages(position_url, range(last_page + 1)) if page]
+
+        pages: List[List[str]] = []
+        for window_start in range(0, pages_count, self._prefetch_pages):
+            window = range(window_start, min(window_start + self._prefetch_pages, pages_count))
+            for page_urls in self._get_pages(position_url, window):
+                if not page_urls:
+                    return pages
+
+                pages.append(page_urls)
+                if has_watermark and self._is_page_older(page_urls, watermark):
+                    return pages
+
+        return pages
+
+    def _find_watermark_page(self, position_url: str, pages_count: int, watermark: datetime) -> int:
+        low, high = 0, pages_count - 1
+        while low < high:
+            middle = (low + high) // 2
+            page_urls = self._get_pages(position_url, [middle])[0]
+            if not page_urls or self._is_page_older(page_urls, watermark):
+                high = middle
+            else:
+                low = middle + 1
+
+        logger.debug(f"Граница водяного знака {position_url}: страница {low} из {pages_count}")
+        return low
+
+    def _get_pages(self, position_url: str, pages: Sequence[int]) -> List[List[str]]:
+        page_urls = [f"{position_url}&page={page}" for page in pages]
+        missing_urls = [url for url in page_urls if url not in self._pages]
+
+        for url, result in zip(missing_urls, self._fetch_pages(missing_urls)):
+            if isinstance(result, BaseException):
+                logger.warning(f"Не удалось загрузить страницу поиска {url}: {result}")
+                result = []
+
+            self.cards.update((card[self._URL_FIELD], card) for card in result)
+            self._pages[url] = [card[self._URL_FIELD] for card in result]
+
+        return [self._pages[url] for url in page_urls]
+
+    def _is_page_older(self, page_urls: List[str], watermark: datetime) -> bool:
+        oldest_date = self._get_oldest_date(page_urls)
+        return oldest_date is not None and oldest_date < watermark
+
+    def _get_oldest_date(self, page_urls: List[str]) -> Optional[datetime]:
+        for resume_url in reversed(page_urls):
+            card_date: Optional[datetime] = self.cards.get(resume_url, {}).get(self._DATE_FIELD)
+            if card_date is not None:
+                return card_date
+
+            info = self.probed_resumes.get(resume_url)
+            if info is None:
+                try:
+                    info = self._fetch_resume(resume_url)
+                except Exception as e:
+                    logger.warning(f"Не получили информацию по {resume_url} из-за {e}")
+                    continue
+
+                if not info:
+                    continue
+                self.probed_resumes[resume_url] = info
+
+            date: datetime = info[self._DATE_FIELD]
+            return date
+
+        return None
@@ -0,0 +1,65 @@
+import threading
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from src.pipeline.data_extracting_components.component_sources.seen_resume_index import SeenResumeIndex
+
+
+class SeenResumeFilter:
+    """
+    Обёртка над индексом выгруженных резюме на один запуск: отвечает, нужна ли загрузка и запись,
+    и копит ключи записанных строк, которые попадают в индекс только после записи всех частей.
+    is_fetch_redundant вызывается из потоков источников одновременно, register_record - из них же под общей
+    блокировкой записи SOURCE_DATA, commit - из основного потока после завершения источников.
+    """
+
+    def __init__(self, seen_index: Optional[SeenResumeIndex], run: str):
+        self._seen_index = seen_index
+        self._run = run
+        self._written_keys: Dict[Tuple[str, date], None] = {}
+        self._lock = threading.Lock()
+        self._skipped_fetches = 0
+        self._skipped_records = 0
+
+    @property
+    def statistics(self) -> Optional[Dict[str, int]]:
+        if self._seen_index is None:
+            return None
+
+        return {
+            "skipped_fetches": self._skipped_fetches,
+            "skipped_records": self._skipped_records,
+            "written_keys": len(self._written_keys),
+            **self._seen_index.statistics,
+        }
+
+    def is_fetch_redundant(self, resume_url: str, listed_update_date: Optional[date]) -> bool:
+        """
+        Индекс знает только дату обновления, с которой резюме было выгружено, а не текущую,
+        поэтому загрузка пропускается, только если текущая дата известна по карточке выдачи
+        и пара (ссылка, эта дата) уже выгружена. Без даты из карточки резюме загружается,
+        а повтор отсекается в register_record.
+        :param listed_update_date: Дата обновления из карточки выдачи, если она там показана.
+        """
+        if self._seen_index is None or listed_update_date is None:
+            return False
+
+        is_redundant = self._seen_index.contains(resume_url, listed_update_date, self._run)
+        with self._lock:
+            self._skipped_fetches += is_redundant
+        return is_redundant
+
+    def register_record(self, resume_url: str, update_date: date) -> bool:
+        """
+        :return: False, если такая пара (ссылка, дата обновления) уже выгружена прошлыми запусками.
+        """
+        if self._seen_index is not None and self._seen_index.contains(resume_url, update_date, self._run):
+            self._skipped_records += 1
+            return False
+
+        self._written_keys[(resume_url, update_date)] = None
+        return True
+
+    def commit(self) -> None:
+        if self._seen_index is not None:
+            self._seen_index.add_many(self._written_keys, self._run)
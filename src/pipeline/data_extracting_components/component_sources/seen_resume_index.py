@@ -0,0 +1,122 @@
+import sqlite3
+import struct
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+from src import logger
+from src.pipeline.data_extracting_components.component_sources.bloom_filter import BloomFilter
+
+
+class SeenResumeIndex:
+    """
+    Персистентный индекс уже выгруженных резюме по ключу (ссылка, дата обновления).
+    Фильтр Блума по ссылкам отсекает новые резюме без обращения к диску,
+    точное множество ключей хранится в SQLite. Каждый ключ помечается запуском, который его добавил,
+    чтобы повтор прерванного запуска не отфильтровал собственные строки.
+    Методы можно вызывать из нескольких потоков: обращения к индексу сериализуются блокировкой.
+    """
+
+    _INDEX_FILE_NAME = "seen.sqlite"
+    _BLOOM_FILE_NAME = "urls.bloom"
+
+    def __init__(self, index_dir: Path, expected_resumes: int, false_positive_rate: float):
+        index_dir.mkdir(parents=True, exist_ok=True)
+        self._bloom_path = index_dir / self._BLOOM_FILE_NAME
+        self._expected_resumes = expected_resumes
+        self._false_positive_rate = false_positive_rate
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(index_dir / self._INDEX_FILE_NAME, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "url TEXT NOT NULL, update_date TEXT NOT NULL, added_by TEXT NOT NULL, "
+            "PRIMARY KEY (url, update_date)) WITHOUT ROWID"
+        )
+        self._connection.commit()
+
+        self._bloom_filter = self._load_bloom_filter()
+        self._statistics = {"bloom_negatives": 0, "exact_lookups": 0, "false_positives": 0}
+
+    @property
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM seen LIMIT 1").fetchone() is None
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._statistics)
+
+    def contains(self, url: str, update_date: date, ignored_run: str) -> bool:
+        """
+        :param ignored_run: Запуск, ключи которого не учитываются (текущий).
+        """
+        with self._lock:
+            if url not in self._bloom_filter:
+                self._statistics["bloom_negatives"] += 1
+                return False
+
+            self._statistics["exact_lookups"] += 1
+            row = self._connection.execute(
+                "SELECT added_by FROM seen WHERE url = ? AND update_date = ?",
+                (url, update_date.isoformat()),
+            ).fetchone()
+            if row is None:
+                self._statistics["false_positives"] += 1
+                return False
+
+            return bool(row[0] != ignored_run)
+
+    def add_many(self, keys: Iterable[Tuple[str, date]], run: str) -> None:
+        """
+        Фильтр Блума сохраняется раньше SQLite: при сбое между ними в фильтре окажутся лишние ссылки,
+        что безопасно, а не недостающие. Уже известные фильтру ссылки не увеличивают его счётчик,
+        поэтому повторное добавление тех же ключей не вызывает перестройку фильтра.
+        """
+        with self._lock:
+            rows = [(url, update_date.isoformat(), run) for url, update_date in keys]
+            added_urls_count = sum(self._bloom_filter.add(url) for url, _, _ in rows)
+            if added_urls_count:
+                self._bloom_filter.save(self._bloom_path)
+
+            self._connection.executemany("INSERT OR IGNORE INTO seen VALUES (?, ?, ?)", rows)
+            self._connection.commit()
+
+            if self._bloom_filter.items_count > self._expected_resumes:
+                self._expected_resumes *= 2
+                self._bloom_filter = self._build_bloom_filter()
+                self._bloom_filter.save(self._bloom_path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM seen")
+            self._connection.commit()
+            self._bloom_filter = self._build_bloom_filter()
+            self._bloom_filter.save(self._bloom_path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _load_bloom_filter(self) -> BloomFilter:
+        if self._bloom_path.is_file():
+            try:
+                return BloomFilter.load(self._bloom_path)
+            except (ValueError, struct.error) as e:
+                logger.warning(f"Фильтр Блума индекса резюме будет перестроен: {e}")
+
+        bloom_filter = self._build_bloom_filter()
+        bloom_filter.save(self._bloom_path)
+        return bloom_filter
+
+    def _build_bloom_filter(self) -> BloomFilter:
+        urls_count = self._connection.execute("SELECT COUNT(DISTINCT url) FROM seen").fetchone()[0]
+        self._expected_resumes = max(self._expected_resumes, urls_count * 2)
+
+        bloom_filter = BloomFilter.for_capacity(self._expected_resumes, self._false_positive_rate)
+        for (url,) in self._connection.execute("SELECT DISTINCT url FROM seen"):
+            bloom_filter.add(url)
+
+        return bloom_filter
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Union
+
+# Принимает ссылки на резюме по позициям и очередную порцию данных резюме по ссылке
+ResumeBatchSink = Callable[[Dict[str, List[str]], Dict[str, Union[Dict[str, Any], BaseException]]], None]
+
+
+@dataclass
+class SourceExtraction:
+    """
+    Результат разбора архива сырых HTML за один день загрузки.
+    position_resume_urls - ссылки на резюме каждой обойденной позиции в порядке выдачи;
+    resumes - данные резюме по ссылке: словарь с колонками RESUME_COLUMNS (дата обновления - datetime)
+    или исключение, если резюме получить не удалось; ссылки без записи в resumes не выгружаются.
+    published_tables - таблицы метрик источника для ILogger.publish_dictionary_values.
+    """
+
+    position_resume_urls: Dict[str, List[str]]
+    resumes: Dict[str, Union[Dict[str, Any], BaseException]]
+    published_tables: Dict[str, Dict[str, Any]] = field(default_factory=dict)
@@ -0,0 +1,238 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.pipeline.data_extracting_components.component_sources import json_codec
+
+
+@dataclass(frozen=True)
+class FrontierTask:
+    source: str
+    run: str
+    kind: str
+    key: str
+    payload: Dict[str, Any]
+    attempts: int
+
+
+class SqliteCrawlFrontier:
+    """
+    Очередь работ обхода в SQLite (режим WAL), которую одновременно разбирают несколько процессов-воркеров.
+    Задача (источник, запуск, вид, ключ) выдаётся в аренду одному воркеру на lease_seconds;
+    если за это время она не подтверждена, она снова становится видимой и выдаётся другому.
+    Подтверждение идемпотентно: принимается только первый результат задачи, повторные
+    (от воркера, чья аренда истекла) отбрасываются.
+    После max_attempts выдач задача помечается неуспешной и больше не выдаётся.
+    """
+
+    _PENDING = "pending"
+    _LEASED = "leased"
+    _DONE = "done"
+    _FAILED = "failed"
+    _CANCELLED = "cancelled"
+    _BUSY_TIMEOUT_SECONDS = 30
+
+    def __init__(self, frontier_path: Path, lease_seconds: float, max_attempts: int):
+        frontier_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            frontier_path, timeout=self._BUSY_TIMEOUT_SECONDS, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "source TEXT NOT NULL, run TEXT NOT NULL, parameters TEXT NOT NULL, is_open INTEGER NOT NULL, "
+            "PRIMARY KEY (source, run))"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "source TEXT NOT NULL, run TEXT NOT NULL, kind TEXT NOT NULL, key TEXT NOT NULL, "
+            "payload TEXT NOT NULL, priority INTEGER NOT NULL, state TEXT NOT NULL, "
+            "lease_owner TEXT, lease_expires_at REAL, attempts INTEGER NOT NULL DEFAULT 0, result TEXT, "
+            "PRIMARY KEY (source, run, kind, key))"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS tasks_queue ON tasks (source, run, state, priority)")
+
+    def open_run(self, source: str, run: str, parameters: Dict[str, Any]) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO runs VALUES (?, ?, ?, 1)", (source, run, json_codec.dumps(parameters))
+            )
+
+    def get_open_run(self, source: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        :return: Идентификатор и параметры открытого запуска источника, None - открытого запуска нет.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT run, parameters FROM runs WHERE source = ? AND is_open = 1 ORDER BY rowid DESC LIMIT 1",
+                (source,),
+            ).fetchone()
+
+        return (row[0], json_codec.loads(row[1])) if row is not None else None
+
+    def close_run(self, source: str, run: str) -> None:
+        """
+        Закрывает запуск и удаляет его задачи: воркеры перестают их получать.
+        """
+        with self._transaction() as connection:
+            connection.execute("UPDATE runs SET is_open = 0 WHERE source = ? AND run = ?", (source, run))
+            connection.execute("DELETE FROM tasks WHERE source = ? AND run = ?", (source, run))
+
+    def add_tasks(self, source: str, run: str, kind: str, tasks: Iterable[Tuple[str, Dict[str, Any], int]]) -> None:
+        """
+        :param tasks: Ключ, данные и приоритет задачи (меньше - раньше); уже добавленные ключи пропускаются.
+        """
+        rows = [
+            (source, run, kind, key, json_codec.dumps(payload), priority, self._PENDING)
+            for key, payload, priority in tasks
+        ]
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO tasks (source, run, kind, key, payload, priority, state) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def lease(self, source: str, run: str, worker: str, limit: int) -> List[FrontierTask]:
+        """
+        Выдаёт воркеру до limit доступных задач: ожидающих и тех, чья аренда истекла.
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE tasks SET state = ?, lease_owner = NULL "
+                "WHERE source = ? AND run = ? AND state = ? AND lease_expires_at < ? AND attempts >= ?",
+                (self._FAILED, source, run, self._LEASED, now, self._max_attempts),
+            )
+            rows = connection.execute(
+                "SELECT kind, key, payload, attempts FROM tasks "
+                "WHERE source = ? AND run = ? AND (state = ? OR (state = ? AND lease_expires_at < ?)) "
+                "ORDER BY priority, rowid LIMIT ?",
+                (source, run, self._PENDING, self._LEASED, now, limit),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE tasks SET state = ?, lease_owner = ?, lease_expires_at = ?, attempts = attempts + 1 "
+                "WHERE source = ? AND run = ? AND kind = ? AND key = ?",
+                [(self._LEASED, worker, now + self._lease_seconds, source, run, kind, key) for kind, key, _, _ in rows],
+            )
+
+        return [
+            FrontierTask(source, run, kind, key, json_codec.loads(payload), attempts + 1)
+            for kind, key, payload, attempts in rows
+        ]
+
+    def complete(
+        self,
+        task: FrontierTask,
+        result: Any,
+        cancelled_keys: Sequence[str] = (),
+    ) -> bool:
+        """
+        Подтверждает задачу в одной транзакции с отменой ожидающих задач того же вида.
+        :param cancelled_keys: Ключи задач, которые после этого результата больше не нужны.
+        :return: False, если задача уже подтверждена или отменена - результат отброшен.
+        """
+        with self._transaction() as connection:
+            is_committed = (
+                connection.execute(
+                    "UPDATE tasks SET state = ?, result = ?, lease_owner = NULL "
+                    "WHERE source = ? AND run = ? AND kind = ? AND key = ? AND state IN (?, ?)",
+                    (
+                        self._DONE,
+                        json_codec.dumps(result),
+                        task.source,
+                        task.run,
+                        task.kind,
+                        task.key,
+                        self._LEASED,
+                        self._PENDING,
+                    ),
+                ).rowcount
+                > 0
+            )
+            if not is_committed:
+                return False
+
+            connection.executemany(
+                "UPDATE tasks SET state = ? WHERE source = ? AND run = ? AND kind = ? AND key = ? AND state = ?",
+                [(self._CANCELLED, task.source, task.run, task.kind, key, self._PENDING) for key in cancelled_keys],
+            )
+
+        return True
+
+    def fail(self, task: FrontierTask, worker: str, error: str) -> None:
+        """
+        Возвращает задачу в очередь; после max_attempts попыток она помечается неуспешной.
+        Ошибка воркера, чья аренда уже перешла к другому, игнорируется.
+        """
+        state = self._FAILED if task.attempts >= self._max_attempts else self._PENDING
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE tasks SET state = ?, result = ?, lease_owner = NULL "
+                "WHERE source = ? AND run = ? AND kind = ? AND key = ? AND state = ? AND lease_owner = ?",
+                (state, json_codec.dumps(error), task.source, task.run, task.kind, task.key, self._LEASED, worker),
+            )
+
+    def is_drained(self, source: str, run: str, kind: Optional[str] = None) -> bool:
+        """
+        :return: True, если задач (вида kind) в очереди и в аренде не осталось.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM tasks WHERE source = ? AND run = ? AND kind = COALESCE(?, kind) "
+                "AND state IN (?, ?) LIMIT 1",
+                (source, run, kind, self._PENDING, self._LEASED),
+            ).fetchone()
+
+        return row is None
+
+    def get_results(self, source: str, run: str, kind: str) -> Iterator[Tuple[str, Dict[str, Any], Any, bool]]:
+        """
+        :return: Ключ, данные, результат подтверждённой или текст ошибки неуспешной задачи и признак успеха.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, payload, result, state FROM tasks "
+                "WHERE source = ? AND run = ? AND kind = ? AND state IN (?, ?) ORDER BY rowid",
+                (source, run, kind, self._DONE, self._FAILED),
+            ).fetchall()
+
+        for key, payload, result, state in rows:
+            yield key, json_codec.loads(payload), json_codec.loads(result) if result else None, state == self._DONE
+
+    def get_statistics(self, source: str, run: str) -> Dict[str, int]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT kind, state, COUNT(*) FROM tasks WHERE source = ? AND run = ? GROUP BY kind, state",
+                (source, run),
+            ).fetchall()
+
+        return {f"{kind}_{state}": count for kind, state, count in sorted(rows)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        BEGIN IMMEDIATE сразу берёт блокировку записи, поэтому выборка и обновление аренды
+        в lease не пересекаются с такими же транзакциями других процессов.
+        """
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
@@ -0,0 +1,107 @@
+import queue
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, TypeVar, Union
+from urllib.parse import urlsplit
+
+from src.utils.exceptions import ServiceError
+
+ParseResult = TypeVar("ParseResult")
+
+
+class StagedPageFetcher(Generic[ParseResult]):
+    """
+    Разделяет загрузку и разбор страниц на две стадии, связанные ограниченной очередью.
+    Загрузка выполняется в пуле потоков с теми же ограничениями, что и в ConcurrentResumeFetcher,
+    разбор - в переданном исполнителе (обычно пуле процессов), не более parse_workers страниц одновременно.
+    Когда очередь заполнена, загрузка ждёт разбора, поэтому в памяти одновременно находится
+    не больше max_in_flight_requests + parse_queue_size + parse_workers страниц.
+    Сломанный пул процессов (BrokenProcessPool) - не ошибка отдельной страницы: загрузка останавливается,
+    и исключение пробрасывается из process_all.
+    """
+
+    def __init__(
+        self,
+        fetch_function: Callable[[str], Optional[str]],
+        parse_function: Callable[[str], ParseResult],
+        parse_executor: Executor,
+        parse_workers: int,
+        max_in_flight_requests: int,
+        max_requests_per_host: int,
+        parse_queue_size: int,
+    ):
+        if min(parse_workers, max_in_flight_requests, max_requests_per_host, parse_queue_size) < 1:
+            raise ServiceError("Ограничения конкурентности загрузки и разбора должны быть положительными")
+
+        self._fetch_function = fetch_function
+        self._parse_function = parse_function
+        self._parse_executor = parse_executor
+        self._parse_workers = parse_workers
+        self._max_in_flight_requests = max_in_flight_requests
+        self._max_requests_per_host = max_requests_per_host
+        self._parse_queue_size = parse_queue_size
+
+    def process_all(self, urls: Sequence[str]) -> List[Union[Optional[ParseResult], BaseException]]:
+        """
+        :param urls: Список URL для загрузки.
+        :return: Результаты разбора в порядке входных URL; None, если страница не загружена,
+            вместо упавших загрузок и разборов - исключения.
+        """
+        if not urls:
+            return []
+
+        results: List[Union[Optional[ParseResult], BaseException]] = [None] * len(urls)
+        parse_queue: queue.Queue[Optional[Tuple[int, str]]] = queue.Queue(maxsize=self._parse_queue_size)
+        host_semaphores = {
+            host: threading.BoundedSemaphore(self._max_requests_per_host)
+            for host in {urlsplit(url).netloc for url in urls}
+        }
+        broken_pools: List[BrokenProcessPool] = []
+        is_stopped = threading.Event()
+
+        def fetch(index: int, url: str) -> None:
+            if is_stopped.is_set():
+                return
+
+            try:
+                with host_semaphores[urlsplit(url).netloc]:
+                    html = self._fetch_function(url)
+            except Exception as e:
+                results[index] = e
+                return
+
+            if html is not None:
+                parse_queue.put((index, html))
+
+        def parse() -> None:
+            while (item := parse_queue.get()) is not None:
+                index, html = item
+                if is_stopped.is_set():
+                    continue
+
+                try:
+                    results[index] = self._parse_executor.submit(self._parse_function, html).result()
+                except BrokenProcessPool as e:
+                    broken_pools.append(e)
+                    is_stopped.set()
+                except Exception as e:
+                    results[index] = e
+
+        parsers = [threading.Thread(target=parse, name=f"parse-{number}") for number in range(self._parse_workers)]
+        for parser in parsers:
+            parser.start()
+        try:
+            with ThreadPoolExecutor(max_workers=min(self._max_in_flight_requests, len(urls))) as fetch_executor:
+                for index, url in enumerate(urls):
+                    fetch_executor.submit(fetch, index, url)
+        finally:
+            for _ in parsers:
+                parse_queue.put(None)
+            for parser in parsers:
+                parser.join()
+
+        if broken_pools:
+            raise broken_pools[0]
+
+        return results
@@ -0,0 +1,253 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Type
+
+from src.utils.exceptions import ServiceError
+
+
+@dataclass(frozen=True)
+class ContainerSelector:
+    tag: str
+    class_name: str
+    each: bool = False
+
+
+@dataclass(frozen=True)
+class FieldSelector:
+    tag: str
+    class_name: str
+    container: Optional[str] = None
+    many: bool = False
+
+
+@dataclass
+class MatchedElement:
+    text: str
+    attributes: Dict[str, str] = field(default_factory=dict)
+    container_index: Optional[int] = None
+
+
+class _HtmlBackend:
+    name = "abstract"
+
+    def iter_elements(self, html: str, is_wanted: Callable[[str, str], bool]) -> Iterator[Tuple[str, str, Any]]:
+        raise NotImplementedError()
+
+    def get_text(self, node: Any) -> str:
+        raise NotImplementedError()
+
+    def get_attributes(self, node: Any) -> Dict[str, str]:
+        raise NotImplementedError()
+
+    def is_ancestor(self, ancestor: Any, node: Any) -> bool:
+        raise NotImplementedError()
+
+
+class _LxmlBackend(_HtmlBackend):
+    name = "lxml"
+
+    def __init__(self):
+        from lxml import html as lxml_html
+
+        self._lxml_html = lxml_html
+
+    def iter_elements(self, html: str, is_wanted: Callable[[str, str], bool]) -> Iterator[Tuple[str, str, Any]]:
+        for element in self._lxml_html.fromstring(html).iter():
+            if isinstance(element.tag, str):
+                yield element.tag, element.get("class", ""), element
+
+    def get_text(self, node: Any) -> str:
+        text: str = node.text_content()
+        return text
+
+    def get_attributes(self, node: Any) -> Dict[str, str]:
+        return dict(node.attrib)
+
+    def is_ancestor(self, ancestor: Any, node: Any) -> bool:
+        return any(parent is ancestor for parent in node.iterancestors())
+
+
+class _SelectolaxBackend(_HtmlBackend):
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser_class = LexborHTMLParser
+
+    def iter_elements(self, html: str, is_wanted: Callable[[str, str], bool]) -> Iterator[Tuple[str, str, Any]]:
+        root = self._parser_class(html).root
+        if root is None:
+            return
+
+        for node in root.traverse():
+            yield node.tag or "", node.attributes.get("class") or "", node
+
+    def get_text(self, node: Any) -> str:
+        text: str = node.text(deep=True)
+        return text
+
+    def get_attributes(self, node: Any) -> Dict[str, str]:
+        return {key: value or "" for key, value in node.attributes.items()}
+
+    def is_ancestor(self, ancestor: Any, node: Any) -> bool:
+        parent = node.parent
+        while parent is not None:
+            if parent.mem_id == ancestor.mem_id:
+                return True
+            parent = parent.parent
+
+        return False
+
+
+class _SoupBackend(_HtmlBackend):
+    """
+    Резервный вариант на html.parser: через SoupStrainer строятся только поддеревья нужных элементов.
+    """
+
+    name = "html.parser"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        self._soup_class = BeautifulSoup
+        self._strainer_class = SoupStrainer
+
+    def iter_elements(self, html: str, is_wanted: Callable[[str, str], bool]) -> Iterator[Tuple[str, str, Any]]:
+        def match(name: Any, attrs: Mapping[str, Any]) -> bool:
+            return is_wanted(name, self._join_class(attrs.get("class")))
+
+        soup = self._soup_class(html, "html.parser", parse_only=self._strainer_class(match))
+        for element in soup.find_all(True):
+            yield element.name, self._join_class(element.get("class")), element
+
+    def get_text(self, node: Any) -> str:
+        text: str = node.get_text()
+        return text
+
+    def get_attributes(self, node: Any) -> Dict[str, str]:
+        return {key: self._join_class(value) for key, value in node.attrs.items()}
+
+    def is_ancestor(self, ancestor: Any, node: Any) -> bool:
+        return any(parent is ancestor for parent in node.parents)
+
+    @staticmethod
+    def _join_class(value: Any) -> str:
+        if value is None:
+            return ""
+
+        if isinstance(value, str):
+            return value
+
+        return " ".join(value)
+
+
+def _create_backend(preferred: Optional[str] = None) -> _HtmlBackend:
+    backends: List[Type[_HtmlBackend]] = [_SelectolaxBackend, _LxmlBackend, _SoupBackend]
+    if preferred is not None:
+        backends = [backend for backend in backends if backend.name == preferred]
+        if not backends:
+            raise ServiceError(f"Неизвестный HTML-парсер {preferred}")
+
+    for backend in backends:
+        try:
+            return backend()
+        except ImportError:
+            continue
+
+    raise ServiceError("Не найден ни один HTML-парсер")
+
+
+class SelectorTableParser:
+    """
+    Извлекает элементы страницы по таблице селекторов за один обход документа.
+    Контейнер с each=False учитывается только первым вхождением (как soup.find),
+    с each=True - каждым; поле без many берёт первый элемент внутри каждого контейнера.
+    Элементы полей внутри контейнера помечаются номером его вхождения.
+    """
+
+    def __init__(
+        self,
+        containers: Dict[str, ContainerSelector],
+        fields: Dict[str, FieldSelector],
+        backend: Optional[str] = None,
+    ):
+        self._containers = containers
+        self._fields = fields
+        self._backend = _create_backend(backend)
+
+        self._selectors_by_tag: Dict[str, List[Tuple[str, bool, str, bool]]] = {}
+        for key, container in containers.items():
+            self._add_selector(container.tag, key, True, container.class_name)
+        for key, field_selector in fields.items():
+            self._add_selector(field_selector.tag, key, False, field_selector.class_name)
+
+    @property
+    def backend_name(self) -> str:
+        return self._backend.name
+
+    def parse(self, html: str) -> Dict[str, List[MatchedElement]]:
+        backend = self._backend
+        found_containers: Dict[str, List[Any]] = {key: [] for key in self._containers}
+        taken_containers: Dict[str, Set[int]] = {key: set() for key in self._fields}
+        result: Dict[str, List[MatchedElement]] = {key: [] for key in self._fields}
+
+        for tag, class_value, node in backend.iter_elements(html, self._is_wanted):
+            selectors = self._selectors_by_tag.get(tag)
+            if selectors is None:
+                continue
+
+            for key, is_container, class_name, single_token in selectors:
+                if not self._class_matches(class_value, class_name, single_token):
+                    continue
+
+                if is_container:
+                    if self._containers[key].each or not found_containers[key]:
+                        found_containers[key].append(node)
+                    continue
+
+                field_selector = self._fields[key]
+                if field_selector.container is None:
+                    if field_selector.many or not result[key]:
+                        result[key].append(self._to_matched(node))
+                    continue
+
+                instances = found_containers[field_selector.container]
+                if not instances or not backend.is_ancestor(instances[-1], node):
+                    continue
+
+                container_index = len(instances) - 1
+                if not field_selector.many:
+                    if container_index in taken_containers[key]:
+                        continue
+                    taken_containers[key].add(container_index)
+
+                result[key].append(self._to_matched(node, container_index))
+
+        return result
+
+    def _add_selector(self, tag: str, key: str, is_container: bool, class_name: str) -> None:
+        single_token = len(class_name.split()) == 1
+        self._selectors_by_tag.setdefault(tag, []).append((key, is_container, class_name, single_token))
+
+    def _is_wanted(self, tag: str, class_value: str) -> bool:
+        selectors = self._selectors_by_tag.get(tag)
+        if selectors is None:
+            return False
+
+        return any(
+            self._class_matches(class_value, class_name, single_token)
+            for _, _, class_name, single_token in selectors
+        )
+
+    def _to_matched(self, node: Any, container_index: Optional[int] = None) -> MatchedElement:
+        return MatchedElement(self._backend.get_text(node), self._backend.get_attributes(node), container_index)
+
+    @staticmethod
+    def _class_matches(class_value: str, class_name: str, single_token: bool) -> bool:
+        if not class_value:
+            return False
+
+        if single_token:
+            return class_name in class_value.split()
+
+        return " ".join(class_value.split()) == class_name
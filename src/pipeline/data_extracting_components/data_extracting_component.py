@@ -1,26 +1,49 @@
+import multiprocessing
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 
 from src import logger
 from src.data_controlling.interfaces import IDataController
 from src.entities.pipeline import PipelineConfiguration
+from src.entities.pipeline.component_properties import ExtractionStepProperties
 from src.entities.pipeline.component_result import DataExtractingResult
 from src.enums import DatasetName
-from src.pipeline.data_extracting_components.get_data_from_superjob import (
-    get_data_from_resume_by_url,
-    get_resume_urls_from_page,
+from src.pipeline.data_extracting_components.component_sources import (
+    ColumnarChunkWriter,
+    CrawlBudgetScheduler,
+    ExtractionJournal,
+    ExtractionStateStore,
+    ExtractionTelemetry,
+    PositionWatermark,
+    PositionYield,
+    ResumeBatchSink,
+    RowKey,
+    SeenResumeFilter,
+    SeenResumeIndex,
 )
-from src.pipeline.data_extracting_components.interfaces import IDataExtractingComponent
+from src.pipeline.data_extracting_components.get_data_from_superjob import RESUME_COLUMNS
+from src.pipeline.data_extracting_components.interfaces import IDataExtractingComponent, ISourceConnector
+from src.pipeline.data_extracting_components.superjob_connector import SuperjobConnector
 from src.utils.artifact_publication.interfaces import ILogger
 from src.utils.exceptions.service_error import ServiceError
 
 
 class DataExtractingComponent(IDataExtractingComponent):
-    _SUPERJOB_BASE_URL = "https://russia.superjob.ru/resume/search_resume.html"
-    _PAGES_COUNT = 1
     _DATE_COLUMN_NAME = "Дата обновления резюме"
+    _SOURCE_COLUMN_NAME = "Источник"
+    _DATASETS_DIR_NAME = "datasets"
+    _NO_WATERMARK = datetime(year=1970, month=1, day=1)
+    # До появления коннекторов данные выгружались только из superjob
+    _LEGACY_SOURCE = SuperjobConnector.SOURCE_NAME
 
     def __init__(
         self,
@@ -32,8 +55,6 @@ class DataExtractingComponent(IDataExtractingComponent):
         self._data_controller = data_controller
         self._target_logger = target_logger
 
-        self._extracted_old_data: Optional[pd.DataFrame] = None
-
     def get_data(self) -> DataExtractingResult:
         step_parameters = self._config.components.extraction_step_properties
         if step_parameters is None:
@@ -43,78 +64,643 @@ class DataExtractingComponent(IDataExtractingComponent):
         if dataset_parameters is None:
             raise ServiceError(f"Обнаружены пустые параметры датасета {DatasetName.SOURCE_DATA}")
 
-        current_date = datetime.now()
-        extraction_parameters = self._get_extraction_parameters(dataset_parameters)
+        if step_parameters.raw_archive.reparse:
+            return self._reparse_archive(step_parameters, dataset_parameters)
+
+        read_history = cache(self._read_history)
+        state_store = ExtractionStateStore(self._get_datasets_dir() / step_parameters.state_path)
+        self._migrate_source_column(state_store, dataset_parameters, read_history)
+        source_watermarks = self._load_watermarks(state_store, dataset_parameters, read_history)
+        source_yields = state_store.load_yields()
+        scheduler = CrawlBudgetScheduler(step_parameters.crawl_budget)
 
-        position_dataframes = [
-            self._extract_api_data(
-                position,
-                current_date,
-                extraction_parameters,
+        telemetry = ExtractionTelemetry() if step_parameters.telemetry.enabled else None
+        connectors = self._create_connectors(step_parameters, telemetry)
+        journal = self._open_journal(step_parameters)
+        source_journals: Dict[str, ExtractionJournal] = {}
+        seen_index: Optional[SeenResumeIndex] = None
+        try:
+            is_restored_run = journal.is_restored
+            current_date, watermarks = self._start_run(journal, source_watermarks)
+            source_journals = {
+                connector.name: self._open_source_journal(step_parameters, connector.name, is_restored_run)
+                for connector in connectors
+            }
+            seen_index = self._open_seen_index(
+                step_parameters, dataset_parameters, read_history, current_date, is_restored_run
             )
-            for position in step_parameters.positions_to_extract
-        ]
-        if self._extracted_old_data is not None:
-            position_dataframes.append(self._extracted_old_data)
+            seen_filter = SeenResumeFilter(seen_index, current_date.isoformat())
+
+            pages_by_source = {
+                connector.name: self._plan_crawl(
+                    connector.name, step_parameters, scheduler, source_yields.get(connector.name, {}), current_date
+                )
+                for connector in connectors
+            }
+            writer = ColumnarChunkWriter(
+                columns=self._get_dataset_columns(),
+                chunk_rows=step_parameters.write_chunk_rows,
+                flush_chunk=self._create_chunk_sink(dataset_parameters, journal),
+            )
+            writer_lock = threading.Lock()
+            source_records: Dict[str, Dict[str, Tuple[Optional[PositionWatermark], int]]] = {
+                connector.name: {} for connector in connectors
+            }
+            resume_sinks = {
+                source: self._create_resume_sink(
+                    writer,
+                    writer_lock,
+                    source,
+                    watermarks.get(source, {}),
+                    current_date,
+                    seen_filter,
+                    position_records,
+                )
+                for source, position_records in source_records.items()
+            }
+            with writer, self._create_parse_executor(step_parameters) as parse_executor:
+                source_tables = self._extract_sources(
+                    connectors, pages_by_source, watermarks, source_journals, seen_filter, parse_executor, resume_sinks
+                )
 
-        extracted_data = pd.concat(position_dataframes, ignore_index=True)
+            for source, position_records in source_records.items():
+                position_watermarks = source_watermarks.setdefault(source, {})
+                position_yields = source_yields.setdefault(source, {})
+                for position, (newest, _) in position_records.items():
+                    self._advance_watermark(position_watermarks, position, newest)
+                for position, pages_crawled in source_journals[source].position_pages.items():
+                    if pages_crawled > 0:
+                        records_count = position_records.get(position, (None, 0))[1]
+                        position_yields[position] = scheduler.update_yield(
+                            position_yields.get(position), pages_crawled, records_count, current_date
+                        )
 
-        logger.debug(f"Выгружено {extracted_data.shape[0]} строк")
+            self._data_controller.publish_appended_dataset(DatasetName.SOURCE_DATA)
+            seen_filter.commit()
+            state_store.save(source_watermarks, source_yields)
+            journal.complete()
+            for source_journal in source_journals.values():
+                source_journal.complete()
+        finally:
+            journal.close()
+            for source_journal in source_journals.values():
+                source_journal.close()
+            if seen_index is not None:
+                seen_index.close()
 
-        self._data_controller.save_dataset(extracted_data, DatasetName.SOURCE_DATA)
+        self._publish_seen_filter_statistics(seen_filter)
+        logger.debug(f"Выгружено {writer.rows_written} строк частями: {writer.chunks_written}")
         logger.info(f"Шаг извлечения данных {DatasetName.SOURCE_DATA} выполнен с параметрами: {dataset_parameters}")
 
+        for source, published_tables in source_tables.items():
+            for name, table in published_tables.items():
+                self._target_logger.publish_dictionary_values(f"{source}: {name}", table)
+
+        if telemetry is not None:
+            self._publish_telemetry(telemetry, step_parameters)
+
         return DataExtractingResult({"source_data": DatasetName.SOURCE_DATA})  # type: ignore
 
-    def _extract_api_data(
+    def _reparse_archive(
         self,
-        position: str,
-        extraction_date: datetime,
-        extraction_parameters: Dict[str, Any],
-    ) -> pd.DataFrame:
-        extraction_date_column = self._data_controller.dataset_extracting_date_column_name
-        position_url = f"{self._SUPERJOB_BASE_URL}?keywords[0][keys]={position}&sbmit=1"
-        extract_from = extraction_parameters.get("last_load_date", datetime(year=1970, month=1, day=1))
+        step_parameters: ExtractionStepProperties,
+        dataset_parameters: Dict[str, Any],
+    ) -> DataExtractingResult:
+        """
+        Пересобирает SOURCE_DATA из архива сырых HTML без обращения к сети: страницы разбираются
+        в пуле процессов, затем дни загрузки проигрываются по порядку так же, как исходные запуски,
+        с водяными знаками позиций и индексом выгруженных резюме, которые строятся заново.
+        Архив ведёт только коннектор superjob, поэтому пересобранный датасет содержит только его строки.
+        """
+        connector = SuperjobConnector(
+            step_parameters, self._get_datasets_dir(), self._get_parse_workers(step_parameters)
+        )
+        with self._create_parse_executor(step_parameters) as executor:
+            extractions = connector.load_archive(executor)
+
+        seen_index = self._open_seen_index(
+            step_parameters, {"use_increment": False}, lambda: None, datetime.now(), is_restored_run=False
+        )
+        position_watermarks: Dict[str, PositionWatermark] = {}
+        resumes: Dict[str, Union[Dict[str, Any], BaseException]] = {}
+        writer = ColumnarChunkWriter(
+            columns=self._get_dataset_columns(),
+            chunk_rows=step_parameters.write_chunk_rows,
+            flush_chunk=self._create_chunk_sink({"use_increment": False}, ExtractionJournal()),
+        )
+        try:
+            with writer:
+                for load_date in sorted(extractions):
+                    extraction = extractions[load_date]
+                    resumes |= extraction.resumes
+                    extraction_date = datetime.combine(load_date, datetime.min.time())
+                    seen_filter = SeenResumeFilter(seen_index, extraction_date.isoformat())
+                    for position, resume_urls in extraction.position_resume_urls.items():
+                        watermark = position_watermarks.get(position)
+                        extract_from = (
+                            watermark.last_update_date
+                            if watermark is not None and dataset_parameters["use_increment"]
+                            else self._NO_WATERMARK
+                        )
+                        newest, _ = self._write_position_records(
+                            writer,
+                            connector.name,
+                            position,
+                            list(dict.fromkeys(resume_urls)),
+                            resumes,
+                            extraction_date,
+                            extract_from,
+                            seen_filter,
+                        )
+                        self._advance_watermark(position_watermarks, position, newest)
+                    seen_filter.commit()
+            self._data_controller.publish_appended_dataset(DatasetName.SOURCE_DATA)
+        finally:
+            if seen_index is not None:
+                seen_index.close()
+
+        if dataset_parameters["use_increment"]:
+            state_path = self._get_datasets_dir() / step_parameters.state_path
+            ExtractionStateStore(state_path).save({connector.name: position_watermarks})
 
-        dataset: Dict[str, List[str]] = {}
-        for page in range(self._PAGES_COUNT):
-            position_url_paged = f"{position_url}&page={page}"
-            resume_urls = get_resume_urls_from_page(position_url_paged)
+        logger.info(f"SOURCE_DATA пересобран из архива: {writer.rows_written} строк, частей {writer.chunks_written}")
+        return DataExtractingResult({"source_data": DatasetName.SOURCE_DATA})  # type: ignore
 
-            for resume_url in resume_urls:
-                try:
-                    info = get_data_from_resume_by_url(resume_url)
-                except Exception as e:
-                    logger.warning(f"Не получили информацию по {resume_url} из-за {e}")
-                    continue
+    def _get_datasets_dir(self) -> Path:
+        return self._data_controller.project_root.parent / self._DATASETS_DIR_NAME
 
-                if info["Дата обновления резюме"] < extract_from:
-                    return pd.DataFrame(dataset)
+    def _open_journal(self, step_parameters: ExtractionStepProperties) -> ExtractionJournal:
+        checkpoint_parameters = step_parameters.checkpoint
+        if not checkpoint_parameters.enabled:
+            return ExtractionJournal()
 
-                info["Ссылка на резюме"] = resume_url
-                info["Искомая позиция"] = position
-                info["Дата обновления резюме"] = info["Дата обновления резюме"].date()
-                info[extraction_date_column] = str(extraction_date.date())
+        return ExtractionJournal(self._get_datasets_dir() / checkpoint_parameters.journal_path)
 
-                for key in info:
-                    if key not in dataset:
-                        dataset[key] = []
+    def _open_source_journal(
+        self,
+        step_parameters: ExtractionStepProperties,
+        source: str,
+        is_restored_run: bool,
+    ) -> ExtractionJournal:
+        """
+        Каждый источник ведёт свой журнал рядом с общим, в котором остаются параметры запуска и записанные части.
+        Журнал источника действителен только вместе с общим: если общий журнал не восстановлен,
+        журнал источника остался от завершённого запуска и удаляется.
+        """
+        checkpoint_parameters = step_parameters.checkpoint
+        if not checkpoint_parameters.enabled:
+            return ExtractionJournal()
 
-                    dataset[key].append(info[key])
+        journal_path = self._get_datasets_dir() / checkpoint_parameters.journal_path
+        source_journal_path = journal_path.with_name(f"{journal_path.stem}.{source}{journal_path.suffix}")
+        if not is_restored_run:
+            source_journal_path.unlink(missing_ok=True)
+
+        return ExtractionJournal(source_journal_path)
+
+    def _start_run(
+        self,
+        journal: ExtractionJournal,
+        source_watermarks: Dict[str, Dict[str, PositionWatermark]],
+    ) -> Tuple[datetime, Dict[str, Dict[str, datetime]]]:
+        if journal.is_restored:
+            logger.info("Продолжается прерванный запуск шага извлечения данных")
 
-        return pd.DataFrame(dataset)
+        watermarks = {
+            source: {position: watermark.last_update_date for position, watermark in position_watermarks.items()}
+            for source, position_watermarks in source_watermarks.items()
+        }
+        return journal.start_run(datetime.now(), watermarks)
 
-    def _get_extraction_parameters(self, dataset_parameters: Dict[str, Any]) -> Dict[str, Any]:
+    def _migrate_source_column(
+        self,
+        state_store: ExtractionStateStore,
+        dataset_parameters: Dict[str, Any],
+        read_history: Callable[[], Optional[pd.DataFrame]],
+    ) -> None:
+        """
+        SOURCE_DATA, выгруженный до появления источников, однократно дополняется колонкой источника.
+        Проверка нужна, только если файла состояния ещё нет: иначе колонка уже есть, и датасет не читается.
+        """
+        if not dataset_parameters["use_increment"] or state_store.exists:
+            return
+
+        extracted_old_data = read_history()
+        if extracted_old_data is None or self._SOURCE_COLUMN_NAME in extracted_old_data.columns:
+            return
+
+        logger.info(f"SOURCE_DATA дополняется колонкой источника со значением {self._LEGACY_SOURCE}")
+        self._data_controller.save_dataset(
+            extracted_old_data.assign(**{self._SOURCE_COLUMN_NAME: self._LEGACY_SOURCE}), DatasetName.SOURCE_DATA
+        )
+
+    def _load_watermarks(
+        self,
+        state_store: ExtractionStateStore,
+        dataset_parameters: Dict[str, Any],
+        read_history: Callable[[], Optional[pd.DataFrame]],
+    ) -> Dict[str, Dict[str, PositionWatermark]]:
+        """
+        Водяные знаки позиций каждого источника читаются из файла состояния. Если его ещё нет, они однократно
+        вычисляются по SOURCE_DATA; позиции без водяного знака выгружаются полностью.
+        """
         if not dataset_parameters["use_increment"]:
             return {}
 
-        try:
-            date_column = self._data_controller.dataset_extracting_date_column_name
+        if state_store.exists:
+            return state_store.load()
 
-            self._extracted_old_data = self._data_controller.get_dataset(DatasetName.SOURCE_DATA)
-            self._extracted_old_data[date_column] = self._extracted_old_data[date_column].apply(pd.to_datetime)
+        extracted_old_data = read_history()
+        if extracted_old_data is None:
+            return {}
+
+        logger.info("Файл состояния извлечения не найден, водяные знаки позиций вычисляются по SOURCE_DATA")
+        update_dates = pd.to_datetime(extracted_old_data[self._DATE_COLUMN_NAME], errors="coerce")
+        sources = extracted_old_data.get(self._SOURCE_COLUMN_NAME, self._LEGACY_SOURCE)
+        newest_resumes = (
+            extracted_old_data.assign(**{self._DATE_COLUMN_NAME: update_dates, self._SOURCE_COLUMN_NAME: sources})
+            .dropna(subset=[self._DATE_COLUMN_NAME])
+            .sort_values(self._DATE_COLUMN_NAME, kind="stable")
+            .groupby([self._SOURCE_COLUMN_NAME, "Искомая позиция"])
+            .tail(1)
+        )
+        source_watermarks: Dict[str, Dict[str, PositionWatermark]] = {}
+        for source, position, update_date, resume_url in newest_resumes[
+            [self._SOURCE_COLUMN_NAME, "Искомая позиция", self._DATE_COLUMN_NAME, "Ссылка на резюме"]
+        ].itertuples(index=False, name=None):
+            source_watermarks.setdefault(source, {})[position] = PositionWatermark(
+                update_date.to_pydatetime(), resume_url
+            )
+
+        return source_watermarks
 
-            return {"last_load_date": self._extracted_old_data[date_column].max()}
+    def _open_seen_index(
+        self,
+        step_parameters: ExtractionStepProperties,
+        dataset_parameters: Dict[str, Any],
+        read_history: Callable[[], Optional[pd.DataFrame]],
+        current_date: datetime,
+        is_restored_run: bool,
+    ) -> Optional[SeenResumeIndex]:
+        """
+        Пустой индекс однократно заполняется ключами из SOURCE_DATA. Если продолжается прерванный запуск,
+        строки с его датой выгрузки помечаются как его собственные, чтобы не отфильтровать их при повторе.
+        При полной перевыгрузке датасет перезаписывается, поэтому индекс очищается.
+        """
+        index_parameters = step_parameters.seen_index
+        if not index_parameters.enabled:
+            return None
+
+        seen_index = SeenResumeIndex(
+            index_dir=self._get_datasets_dir() / index_parameters.directory,
+            expected_resumes=index_parameters.expected_resumes,
+            false_positive_rate=index_parameters.false_positive_rate,
+        )
+        if not dataset_parameters["use_increment"]:
+            seen_index.clear()
+            return seen_index
+
+        extracted_old_data = read_history() if seen_index.is_empty else None
+        if extracted_old_data is None:
+            return seen_index
+
+        logger.info("Индекс выгруженных резюме пуст, он заполняется по SOURCE_DATA")
+        extraction_date_column = self._data_controller.dataset_extracting_date_column_name
+        update_dates = pd.to_datetime(extracted_old_data[self._DATE_COLUMN_NAME], errors="coerce").dt.date
+        load_dates = extracted_old_data[extraction_date_column].astype(str)
+        is_own_row = is_restored_run & (load_dates == str(current_date.date()))
+        for run, rows_mask in ((current_date.isoformat(), is_own_row), ("", ~is_own_row)):
+            keys = zip(extracted_old_data.loc[rows_mask, "Ссылка на резюме"], update_dates[rows_mask])
+            seen_index.add_many(((url, update_date) for url, update_date in keys if pd.notna(update_date)), run)
+
+        return seen_index
+
+    def _read_history(self) -> Optional[pd.DataFrame]:
+        try:
+            return self._data_controller.get_dataset(DatasetName.SOURCE_DATA)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Произошла ошибка при загрузке исторических данных: {e}")
-            return {}
+            return None
+
+    def _plan_crawl(
+        self,
+        source: str,
+        step_parameters: ExtractionStepProperties,
+        scheduler: CrawlBudgetScheduler,
+        position_yields: Dict[str, PositionYield],
+        current_date: datetime,
+    ) -> Dict[str, int]:
+        """
+        Без бюджета обхода каждая позиция обходится на настроенное число страниц в порядке конфигурации.
+        С бюджетом страницы распределяются планировщиком отдельно для каждого источника;
+        при продолжении прерванного запуска дата и статистика те же, поэтому план совпадает с исходным.
+        """
+        max_pages_by_position = {
+            position: step_parameters.pages_count_by_position.get(position, step_parameters.default_pages_count)
+            for position in step_parameters.positions_to_extract
+        }
+        if not step_parameters.crawl_budget.enabled:
+            return max_pages_by_position
+
+        pages_by_position = scheduler.allocate(max_pages_by_position, position_yields, current_date)
+        skipped_positions = [position for position, pages_count in pages_by_position.items() if pages_count == 0]
+        budget_statistics = {
+            "request_budget": step_parameters.crawl_budget.request_budget,
+            "scheduled_positions": len(pages_by_position) - len(skipped_positions),
+            "skipped_positions": len(skipped_positions),
+            "scheduled_pages": sum(pages_by_position.values()),
+        }
+        logger.info(f"План обхода позиций источника {source}: {budget_statistics}")
+        logger.debug(f"Страницы по позициям источника {source}: {pages_by_position}")
+        self._target_logger.publish_dictionary_values(f"{source}: Бюджет обхода", budget_statistics)
+
+        return pages_by_position
+
+    def _create_connectors(
+        self,
+        step_parameters: ExtractionStepProperties,
+        telemetry: Optional[ExtractionTelemetry],
+    ) -> List[ISourceConnector]:
+        if not step_parameters.sources:
+            raise ServiceError("Не задан ни один источник данных шага извлечения")
+
+        if len(set(step_parameters.sources)) != len(step_parameters.sources):
+            raise ServiceError(f"Источники данных шага извлечения повторяются: {step_parameters.sources}")
+
+        return [self._create_connector(source, step_parameters, telemetry) for source in step_parameters.sources]
+
+    def _create_connector(
+        self,
+        source: str,
+        step_parameters: ExtractionStepProperties,
+        telemetry: Optional[ExtractionTelemetry],
+    ) -> ISourceConnector:
+        if source == SuperjobConnector.SOURCE_NAME:
+            return SuperjobConnector(
+                step_parameters, self._get_datasets_dir(), self._get_parse_workers(step_parameters), telemetry
+            )
+
+        raise ServiceError(f"Неизвестный источник данных {source}")
+
+    @staticmethod
+    def _extract_sources(
+        connectors: List[ISourceConnector],
+        pages_by_source: Dict[str, Dict[str, int]],
+        watermarks: Dict[str, Dict[str, datetime]],
+        source_journals: Dict[str, ExtractionJournal],
+        seen_filter: SeenResumeFilter,
+        parse_executor: Executor,
+        resume_sinks: Dict[str, ResumeBatchSink],
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Каждый источник обходится в своём потоке, поэтому время шага определяется самым медленным источником,
+        а не суммой. Ошибка источника прерывает шаг только после завершения остальных: их журналы
+        сохраняют загруженное, и повторный запуск продолжит с места сбоя.
+        :return: Таблицы метрик каждого источника.
+        """
+
+        def extract(connector: ISourceConnector) -> Dict[str, Dict[str, Any]]:
+            started = time.perf_counter()
+            published_tables = connector.extract(
+                pages_by_source[connector.name],
+                watermarks.get(connector.name, {}),
+                source_journals[connector.name],
+                seen_filter,
+                parse_executor,
+                resume_sinks[connector.name],
+            )
+            logger.info(f"Источник {connector.name} обработан за {time.perf_counter() - started:.1f} с")
+            return published_tables
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(connectors), thread_name_prefix="source") as executor:
+            futures = {connector.name: executor.submit(extract, connector) for connector in connectors}
+
+        extractions = {}
+        for source, future in futures.items():
+            try:
+                extractions[source] = future.result()
+            except Exception as e:
+                raise ServiceError(f"Не удалось выгрузить данные источника {source}: {e}") from e
+
+        logger.info(f"Источников обработано: {len(extractions)} за {time.perf_counter() - started:.1f} с")
+        return extractions
+
+    def _create_resume_sink(
+        self,
+        writer: ColumnarChunkWriter,
+        writer_lock: threading.Lock,
+        source: str,
+        watermarks: Dict[str, datetime],
+        extraction_date: datetime,
+        seen_filter: SeenResumeFilter,
+        position_records: Dict[str, Tuple[Optional[PositionWatermark], int]],
+    ) -> ResumeBatchSink:
+        """
+        Строки каждой порции резюме источника сразу передаются в writer, который записывает их частями,
+        поэтому в памяти находятся только текущая порция и незаписанная часть, а не все резюме запуска.
+        Источники вызывают приёмник из своих потоков, запись в общий writer выполняется под writer_lock.
+        :param position_records: Самое свежее записанное резюме и число записанных строк каждой позиции,
+            накапливаются по всем порциям.
+        """
+        url_positions: Dict[str, List[str]] = {}
+
+        def write_resumes(
+            position_resume_urls: Dict[str, List[str]],
+            resumes: Dict[str, Union[Dict[str, Any], BaseException]],
+        ) -> None:
+            if not url_positions:
+                for position, resume_urls in position_resume_urls.items():
+                    for resume_url in resume_urls:
+                        url_positions.setdefault(resume_url, []).append(position)
+
+            batch_position_urls: Dict[str, List[str]] = defaultdict(list)
+            for resume_url in resumes:
+                for position in url_positions.get(resume_url, []):
+                    batch_position_urls[position].append(resume_url)
+
+            with writer_lock:
+                for position in position_resume_urls:
+                    if position not in batch_position_urls:
+                        continue
+
+                    newest, records_count = self._write_position_records(
+                        writer,
+                        source,
+                        position,
+                        batch_position_urls[position],
+                        resumes,
+                        extraction_date,
+                        watermarks.get(position, self._NO_WATERMARK),
+                        seen_filter,
+                    )
+                    previous_newest, previous_count = position_records.get(position, (None, 0))
+                    if newest is None or (
+                        previous_newest is not None and previous_newest.last_update_date >= newest.last_update_date
+                    ):
+                        newest = previous_newest
+                    position_records[position] = (newest, previous_count + records_count)
+
+        return write_resumes
+
+    def _write_position_records(
+        self,
+        writer: ColumnarChunkWriter,
+        source: str,
+        position: str,
+        resume_urls: List[str],
+        resumes: Dict[str, Union[Dict[str, Any], BaseException]],
+        extraction_date: datetime,
+        extract_from: datetime,
+        seen_filter: SeenResumeFilter,
+    ) -> Tuple[Optional[PositionWatermark], int]:
+        """
+        :return: Дата обновления и ссылка самого свежего записанного резюме позиции и число записанных строк.
+        """
+        extraction_date_column = self._data_controller.dataset_extracting_date_column_name
+
+        newest: Optional[PositionWatermark] = None
+        records_count = 0
+        for resume_url in resume_urls:
+            info = resumes.get(resume_url)
+            if info is None:
+                continue
+
+            if isinstance(info, BaseException):
+                logger.warning(f"Не получили информацию по {resume_url} из-за {info}")
+                continue
+
+            if not info:
+                logger.warning(f"Не получили информацию по {resume_url}: пустой ответ")
+                continue
+
+            if info["Дата обновления резюме"] < extract_from:
+                continue
+
+            if not seen_filter.register_record(resume_url, info["Дата обновления резюме"].date()):
+                continue
+
+            record = dict(info)
+            record["Ссылка на резюме"] = resume_url
+            record["Искомая позиция"] = position
+            record[self._SOURCE_COLUMN_NAME] = source
+            record["Дата обновления резюме"] = record["Дата обновления резюме"].date()
+            record[extraction_date_column] = str(extraction_date.date())
+            writer.append(record)
+            records_count += 1
+
+            if newest is None or info["Дата обновления резюме"] > newest.last_update_date:
+                newest = PositionWatermark(info["Дата обновления резюме"], resume_url)
+
+        return newest, records_count
+
+    @staticmethod
+    def _advance_watermark(
+        position_watermarks: Dict[str, PositionWatermark],
+        position: str,
+        newest: Optional[PositionWatermark],
+    ) -> None:
+        previous = position_watermarks.get(position)
+        if newest is not None and (previous is None or newest.last_update_date >= previous.last_update_date):
+            position_watermarks[position] = newest
+
+    def _get_dataset_columns(self) -> List[str]:
+        return [
+            *RESUME_COLUMNS,
+            "Ссылка на резюме",
+            "Искомая позиция",
+            self._SOURCE_COLUMN_NAME,
+            self._data_controller.dataset_extracting_date_column_name,
+        ]
+
+    def _create_chunk_sink(
+        self,
+        dataset_parameters: Dict[str, Any],
+        journal: ExtractionJournal,
+    ) -> Callable[[pd.DataFrame], None]:
+        """
+        При инкрементальной выгрузке каждая часть дописывается к SOURCE_DATA,
+        при полной - первая записанная часть перезаписывает датасет, остальные дописываются к ней.
+        Запись идемпотентна по ключу строки (ссылка, позиция, дата выгрузки), а не по номеру части: при повторе
+        прерванного запуска строки могут лечь в другие части, поэтому из каждой части отбрасываются строки,
+        записанные до сбоя, а строки части, запись которой начата, но не подтверждена, сверяются с SOURCE_DATA.
+        """
+        is_increment = dataset_parameters["use_increment"]
+        saved_rows: Optional[Set[RowKey]] = None
+
+        def write_chunk(chunk: pd.DataFrame) -> None:
+            nonlocal saved_rows
+            rows = self._get_row_keys(chunk)
+            is_overwrite = not is_increment and not journal.committed_rows
+            if not is_overwrite:
+                uncommitted_rows = journal.uncommitted_rows
+                if saved_rows is None and any(row in uncommitted_rows for row in rows):
+                    saved_rows = self._read_saved_rows()
+
+                is_written = [
+                    row in journal.committed_rows or (row in uncommitted_rows and row in (saved_rows or set()))
+                    for row in rows
+                ]
+                if any(is_written):
+                    logger.info(f"Часть выгрузки: уже записано до сбоя строк {sum(is_written)} из {chunk.shape[0]}")
+                    chunk = chunk[[not written for written in is_written]]
+                    rows = [row for row, written in zip(rows, is_written) if not written]
+
+            if chunk.empty:
+                return
+
+            chunk_id = journal.record_chunk_started(rows)
+            if is_overwrite:
+                self._data_controller.save_dataset(chunk, DatasetName.SOURCE_DATA)
+            else:
+                self._data_controller.append_dataset(chunk, DatasetName.SOURCE_DATA)
+            journal.record_chunk_committed(chunk_id)
+
+        return write_chunk
+
+    def _get_row_keys(self, dataset: pd.DataFrame) -> List[RowKey]:
+        key_columns = ["Ссылка на резюме", "Искомая позиция", self._data_controller.dataset_extracting_date_column_name]
+        return [tuple(str(value) for value in row) for row in dataset[key_columns].itertuples(index=False, name=None)]
+
+    def _read_saved_rows(self) -> Set[RowKey]:
+        try:
+            saved_data = self._data_controller.get_dataset(DatasetName.SOURCE_DATA)
+        except FileNotFoundError:
+            return set()
+
+        return set(self._get_row_keys(saved_data))
+
+    def _publish_seen_filter_statistics(self, seen_filter: SeenResumeFilter) -> None:
+        statistics = seen_filter.statistics
+        if statistics is None:
+            return
+
+        logger.info(f"Индекс выгруженных резюме: {statistics}")
+        self._target_logger.publish_dictionary_values("Индекс выгруженных резюме", statistics)
+
+    @staticmethod
+    def _get_parse_workers(step_parameters: ExtractionStepProperties) -> int:
+        return step_parameters.parse_workers or os.cpu_count() or 1
+
+    def _create_parse_executor(self, step_parameters: ExtractionStepProperties) -> ProcessPoolExecutor:
+        """
+        Процессы запускаются через spawn: к моменту первого разбора в процессе уже работают потоки загрузки,
+        и fork мог бы унаследовать захваченные ими блокировки. Пустые задачи запускают процессы сразу,
+        чтобы их импорт шёл параллельно с обходом страниц поиска.
+        """
+        workers_count = self._get_parse_workers(step_parameters)
+        executor = ProcessPoolExecutor(max_workers=workers_count, mp_context=multiprocessing.get_context("spawn"))
+        for _ in range(workers_count):
+            executor.submit(os.getpid)
+
+        return executor
+
+    def _publish_telemetry(self, telemetry: ExtractionTelemetry, step_parameters: ExtractionStepProperties) -> None:
+        for name, table in telemetry.get_published_tables().items():
+            self._target_logger.publish_dictionary_values(name, table)
+
+        report_path = self._data_controller.project_root.parent / step_parameters.telemetry.report_path
+        telemetry.save(report_path)
+        logger.info(f"Телеметрия шага извлечения сохранена в {report_path}")
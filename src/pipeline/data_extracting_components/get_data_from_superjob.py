@@ -1,195 +1,370 @@
-import re
-from datetime import datetime, timedelta
-from typing import Any
-
-import requests
-from bs4 import BeautifulSoup
-
-
-def get_resume_urls_from_page(url: str) -> list[str]:
-    response = requests.get(url)
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cache, partial
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from src import logger
+from src.pipeline.data_extracting_components.component_sources import (
+    ArchivedPage,
+    ConcurrentResumeFetcher,
+    ContainerSelector,
+    ExtractionTelemetry,
+    FieldSelector,
+    HttpTransport,
+    MatchedElement,
+    RawHtmlArchive,
+    SelectorTableParser,
+    StagedPageFetcher,
+)
+from src.utils.text_normalization import parse_date
+
+SUPERJOB_SEARCH_URL = "https://russia.superjob.ru/resume/search_resume.html"
+SUPERJOB_RESUME_BASE_URL = "https://www.superjob.ru/"
+
+SEARCH_PAGE_CONTAINERS = {
+    "search_result_item": ContainerSelector("div", "f-test-search-result-item", each=True),
+}
+SEARCH_PAGE_FIELDS = {
+    "resume_anchor": FieldSelector("a", "EruXX", container="search_result_item"),
+    "card_salary": FieldSelector("span", "_3OBe9", container="search_result_item"),
+    "card_age": FieldSelector("span", "f-test-text-resume-age", container="search_result_item"),
+    "card_city": FieldSelector("span", "f-test-text-resume-city", container="search_result_item"),
+    "card_updating_date": FieldSelector("span", "f-test-text-resume-update-date", container="search_result_item"),
+}
+
+RESUME_PAGE_CONTAINERS = {
+    "updating_block": ContainerSelector("div", "e1UIb"),
+    "conditions_block": ContainerSelector("div", "Xkibi"),
+    "skills_block": ContainerSelector("ul", "_8jaXR _1nNwC _2P41q bn_Xt _1kYH3"),
+    "employment_block": ContainerSelector("div", "vK4Mq _2NPzg _1-86a _3umqY _2w28p Kwuox"),
+    "experience_block": ContainerSelector("div", "Ed+Mf"),
+    "education_block": ContainerSelector("div", "f-test-block-account_balance"),
+}
+RESUME_PAGE_FIELDS = {
+    "updating_dates": FieldSelector("span", "_1vAof _38Lv- _3fAzh _3L1uo", "updating_block", many=True),
+    "age": FieldSelector("span", "DzbIT s24Iy _1yskz _3Bzp6 lkr9c Qpqo3 _1vBD3 cq8in"),
+    "salary": FieldSelector("span", "_3OBe9 _38Lv- _2eJfc"),
+    "desired_position": FieldSelector("h1", "VB8-V -Hv1l Qpqo3 _2m2xE"),
+    "city": FieldSelector("div", "J+R2u"),
+    "working_conditions": FieldSelector("div", "J+R2u", "conditions_block"),
+    "skills": FieldSelector("li", "_19Wau", "skills_block", many=True),
+    "employment": FieldSelector("span", "lkr9c Qpqo3 _1vBD3 B7FnQ", "employment_block"),
+    "last_place_of_work": FieldSelector("span", "lkr9c Qpqo3 _31H4p B7FnQ _3YZZG", "experience_block"),
+    "last_position": FieldSelector("h3", "_1g0P1 Qpqo3 _1vBD3 B7FnQ _3YZZG", "experience_block"),
+    "education": FieldSelector("h3", "_1g0P1 Qpqo3 _1vBD3 B7FnQ _3YZZG", "education_block"),
+}
+
+_SEARCH_PAGE_PARSER = SelectorTableParser(SEARCH_PAGE_CONTAINERS, SEARCH_PAGE_FIELDS)
+_RESUME_PAGE_PARSER = SelectorTableParser(RESUME_PAGE_CONTAINERS, RESUME_PAGE_FIELDS)
+
+
+RESUME_URL_COLUMN = "Ссылка на резюме"
+SEARCH_CARD_COLUMNS = ("Дата обновления резюме", "Возраст", "ЗП", "Желаемая должность", "Город")
+
+
+@cache
+def _get_default_http_transport() -> HttpTransport:
+    """
+    Транспорт по умолчанию создаётся при первом запросе без переданного транспорта,
+    а не при импорте модуля, который импортируется и в каждом процессе разбора.
+    """
+    return HttpTransport()
+
+
+def get_resume_urls_from_page(
+    url: str,
+    http_transport: Optional[HttpTransport] = None,
+    resume_base_url: str = SUPERJOB_RESUME_BASE_URL,
+) -> list[str]:
+    return [card[RESUME_URL_COLUMN] for card in get_resume_cards_from_page(url, http_transport, resume_base_url)]
+
+
+def get_resume_cards_from_page(
+    url: str,
+    http_transport: Optional[HttpTransport] = None,
+    resume_base_url: str = SUPERJOB_RESUME_BASE_URL,
+) -> list[dict[str, Any]]:
+    response = (http_transport or _get_default_http_transport()).get(url)
     if response.status_code != 200:
+        logger.warning(f"Не удалось загрузить страницу поиска {url}: {response.status_code}")
         return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    result = []
-
-    divs = soup.find_all("div", class_="f-test-search-result-item")
-
-    for div in divs:
-        anchor = div.find("a", class_="EruXX")
-        if anchor is not None:
-            if anchor.get("href").startswith("/resume"):
-                result.append(rf"https://www.superjob.ru/{anchor.get('href')}")
-
-    return result
-
-
-def str_date_to_datetime(date: str) -> datetime:
-    if "вчера" in date:
-        return datetime.now() - timedelta(days=1)
-
-    months_dict = {
-        "января": 1,
-        "февраля": 2,
-        "марта": 3,
-        "апреля": 4,
-        "мая": 5,
-        "июня": 6,
-        "июля": 7,
-        "августа": 8,
-        "сентября": 9,
-        "октября": 10,
-        "ноября": 11,
-        "декабря": 12,
+    return parse_resume_cards(response.text, base_url=resume_base_url)
+
+
+def get_resume_cards_from_pages(
+    urls: list[str],
+    max_in_flight_requests: int,
+    max_requests_per_host: int,
+    http_transport: Optional[HttpTransport] = None,
+    resume_base_url: str = SUPERJOB_RESUME_BASE_URL,
+) -> list[Union[list[dict[str, Any]], BaseException]]:
+    fetcher = ConcurrentResumeFetcher(
+        partial(get_resume_cards_from_page, http_transport=http_transport, resume_base_url=resume_base_url),
+        max_in_flight_requests,
+        max_requests_per_host,
+    )
+    return fetcher.fetch_all(urls)
+
+
+def parse_resume_urls(
+    html: str,
+    parser: Optional[SelectorTableParser] = None,
+    base_url: str = SUPERJOB_RESUME_BASE_URL,
+) -> list[str]:
+    return [card[RESUME_URL_COLUMN] for card in parse_resume_cards(html, parser, base_url)]
+
+
+def parse_resume_cards(
+    html: str,
+    parser: Optional[SelectorTableParser] = None,
+    base_url: str = SUPERJOB_RESUME_BASE_URL,
+) -> list[dict[str, Any]]:
+    """
+    Разбирает карточки выдачи: ссылка и желаемая должность есть всегда,
+    зарплата, возраст, город и дата обновления - только если они показаны в карточке.
+    """
+    elements = (parser or _SEARCH_PAGE_PARSER).parse(html)
+    card_fields = {
+        "ЗП": _index_by_container(elements["card_salary"]),
+        "Возраст": _index_by_container(elements["card_age"]),
+        "Город": _index_by_container(elements["card_city"]),
     }
+    updating_dates = _index_by_container(elements["card_updating_date"])
 
-    month = 0
-    for month_str, number in months_dict.items():
-        if month_str in date:
-            month = number
-
-    if not month:
-        return datetime.now()
-
-    try:
-        day = re.findall(r"\d{1,2} ", date)[0].strip()
-        year_found = re.findall(r"20\d{2}", date)
-        if year_found:
-            year = year_found[0]
-        else:
-            year = 2024
-
-        return datetime(year=int(year), month=int(month), day=int(day))
-    except Exception:
-        return datetime(year=1970, month=1, day=1)
-
-
-def get_date_of_updating(soup: BeautifulSoup) -> datetime:
-
-    div = soup.find("div", class_="e1UIb")
-
-    updating_dates = div.find_all("span", class_="_1vAof _38Lv- _3fAzh _3L1uo")
-
-    updating_date: str = updating_dates[1].text.strip() if updating_dates[1] is not None else ""
-    return str_date_to_datetime(updating_date)
-
-
-def get_age(soup: BeautifulSoup) -> str:
-    age = soup.find("span", class_="DzbIT s24Iy _1yskz _3Bzp6 lkr9c Qpqo3 _1vBD3 cq8in")
-    result_age: str = age.text.strip().replace("\xa0", " ") if age is not None else "-1"
-    return result_age
-
-
-def get_salary(soup: BeautifulSoup) -> str:
-    salary = soup.find("span", class_="_3OBe9 _38Lv- _2eJfc")
-    if salary is None:
-        return "По договорённости"
-
-    result_salary: str = salary.text.strip().replace("\xa0", " ")
-    return result_salary
-
-
-def get_desired_position(soup: BeautifulSoup) -> str:
-    desired_position = soup.find("h1", class_="VB8-V -Hv1l Qpqo3 _2m2xE")
-    result_desired_position: str = desired_position.text.strip() if desired_position else ""
-    return result_desired_position
-
-
-def get_city(soup: BeautifulSoup) -> str:
-    city = soup.find("div", class_="J+R2u")
-
-    city = city.get_text()
-    result_city: str = city.split(",")[0].strip() if city else ""
-
-    return result_city
-
-
-def get_working_conditions(soup: BeautifulSoup) -> str:
-    div = soup.find("div", class_="Xkibi")
-
-    working_conditions = div.find("div", class_="J+R2u")
-
-    working_conditions = working_conditions.get_text()
-    working_conditions = working_conditions.split(",")[1:]
-    result_working_conditions: str = ",".join(working_conditions).strip().replace("\xa0", " ")
-
-    return result_working_conditions
-
-
-def get_skills(soup: BeautifulSoup) -> str:
-    skills = soup.find("ul", class_="_8jaXR _1nNwC _2P41q bn_Xt _1kYH3")
-    if skills is None:
-        return ""
-
-    skills = skills.find_all("li", class_="_19Wau")
-    skills = [tag.get_text().strip() for tag in skills if tag.get_text().strip() != "Показать еще"]
-    result_skills: str = ", ".join(skills)
-
-    return result_skills
-
+    result = []
+    for anchor in elements["resume_anchor"]:
+        href = anchor.attributes.get("href", "")
+        if not href.startswith("/resume"):
+            continue
+
+        card: dict[str, Any] = {RESUME_URL_COLUMN: f"{base_url}{href}", "Желаемая должность": anchor.text.strip()}
+        for column, texts in card_fields.items():
+            if anchor.container_index in texts:
+                card[column] = texts[anchor.container_index].strip().replace("\xa0", " ")
+        if anchor.container_index in updating_dates:
+            card["Дата обновления резюме"] = str_date_to_datetime(updating_dates[anchor.container_index].strip())
+        result.append(card)
 
-def get_employment(soup: BeautifulSoup) -> str:
-    div = soup.find("div", class_="vK4Mq _2NPzg _1-86a _3umqY _2w28p Kwuox")
-    if div is None:
-        return ""
+    return result
 
-    employment = div.find("span", class_="lkr9c Qpqo3 _1vBD3 B7FnQ")
-    result_employment: str = employment.text.strip().replace("\xa0", " ") if employment else ""
 
-    return result_employment
+def _index_by_container(matched: list[MatchedElement]) -> dict[Optional[int], str]:
+    return {element.container_index: element.text for element in matched}
 
 
-def get_last_experience(soup: BeautifulSoup) -> tuple[str, str]:
-    div = soup.find("div", class_="Ed+Mf")
+def str_date_to_datetime(date: str) -> datetime:
+    return parse_date(date)
 
-    if not div:
-        return "", ""
 
-    last_current_place_of_work = div.find("span", class_="lkr9c Qpqo3 _31H4p B7FnQ _3YZZG")
-    last_current_place_of_work = last_current_place_of_work.get_text().strip() if last_current_place_of_work else ""
+def fetch_resume_page(url: str, http_transport: Optional[HttpTransport] = None) -> Optional[str]:
+    response = (http_transport or _get_default_http_transport()).get(url)
+    if response.status_code != 200:
+        logger.warning(f"Не удалось загрузить страницу {url}: {response.status_code}")
+        return None
 
-    last_current_position = div.find("h3", class_="_1g0P1 Qpqo3 _1vBD3 B7FnQ _3YZZG")
-    last_current_position = last_current_position.get_text().strip() if last_current_position else ""
+    return response.text
 
-    return last_current_place_of_work, last_current_position
 
+def get_data_from_resume_by_url(url: str, http_transport: Optional[HttpTransport] = None) -> dict[str, Any]:
+    html = fetch_resume_page(url, http_transport)
+    if html is None:
+        return {}
 
-def get_education(soup: BeautifulSoup) -> str:
-    div = soup.find("div", class_="f-test-block-account_balance")
+    return parse_resume_page(html)
+
+
+RESUME_COLUMNS = (
+    "Дата обновления резюме",
+    "Возраст",
+    "ЗП",
+    "Желаемая должность",
+    "Город",
+    "Условия работы",
+    "Занятость",
+    "Навыки",
+    "Последнее/текущее место работы",
+    "Последняя/текущая должность",
+    "Образование и ВУЗ",
+)
+
+
+@dataclass
+class ParsedResumePage:
+    record: dict[str, Any]
+    seconds: float
+    field_seconds: dict[str, float] = field(default_factory=dict)
+    empty_fields: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def parse_resume_page(html: str, parser: Optional[SelectorTableParser] = None) -> dict[str, Any]:
+    elements = (parser or _RESUME_PAGE_PARSER).parse(html)
+    return {column: extract(elements) for column, (_, extract) in RESUME_FIELD_EXTRACTORS.items()}
+
+
+def parse_resume_page_with_timings(html: str) -> ParsedResumePage:
+    """
+    Разбирает страницу резюме, замеряя время каждого извлекателя поля. Поле считается пустым,
+    если его селектор ничего не нашёл. Ошибка разбора возвращается в error, а не пробрасывается,
+    чтобы её длительность тоже попала в телеметрию.
+    """
+    started = time.perf_counter()
+    elements = _RESUME_PAGE_PARSER.parse(html)
+
+    record: dict[str, Any] = {}
+    field_seconds: dict[str, float] = {}
+    try:
+        for column, (_, extract) in RESUME_FIELD_EXTRACTORS.items():
+            field_started = time.perf_counter()
+            record[column] = extract(elements)
+            field_seconds[column] = time.perf_counter() - field_started
+    except ValueError as e:
+        return ParsedResumePage(record={}, seconds=time.perf_counter() - started, error=str(e))
 
-    if not div:
-        return ""
+    empty_fields = [column for column, (key, _) in RESUME_FIELD_EXTRACTORS.items() if not elements[key]]
+    return ParsedResumePage(record, time.perf_counter() - started, field_seconds, empty_fields)
 
-    uni_name = div.find("h3", class_="_1g0P1 Qpqo3 _1vBD3 B7FnQ _3YZZG")
-    result_uni_name: str = uni_name.get_text().strip() if uni_name else ""
 
-    return result_uni_name
+def _extract_updating_date(elements: dict[str, list[MatchedElement]]) -> datetime:
+    updating_dates = elements["updating_dates"]
+    if len(updating_dates) < 2:
+        raise ValueError("На странице резюме не найдена дата обновления")
+
+    return str_date_to_datetime(updating_dates[1].text.strip())
+
+
+def _extract_city(elements: dict[str, list[MatchedElement]]) -> str:
+    city = _get_first_text(elements, "city")
+    if city is None:
+        raise ValueError("На странице резюме не найден город")
+
+    return city.split(",")[0].strip()
+
+
+def _extract_working_conditions(elements: dict[str, list[MatchedElement]]) -> str:
+    working_conditions = _get_first_text(elements, "working_conditions")
+    if working_conditions is None:
+        raise ValueError("На странице резюме не найдены условия работы")
+
+    return ",".join(working_conditions.split(",")[1:]).strip().replace("\xa0", " ")
+
+
+def _extract_skills(elements: dict[str, list[MatchedElement]]) -> str:
+    skills = [element.text.strip() for element in elements["skills"]]
+    return ", ".join(skill for skill in skills if skill != "Показать еще")
+
+
+def _extract_stripped_text(key: str) -> Callable[[dict[str, list[MatchedElement]]], str]:
+    return lambda elements: (_get_first_text(elements, key) or "").strip()
+
+
+def _extract_cleaned_text(key: str, default: str) -> Callable[[dict[str, list[MatchedElement]]], str]:
+    return lambda elements: _get_cleaned_text(elements, key, default)
+
+
+RESUME_FIELD_EXTRACTORS: dict[str, tuple[str, Callable[[dict[str, list[MatchedElement]]], Any]]] = {
+    "Дата обновления резюме": ("updating_dates", _extract_updating_date),
+    "Возраст": ("age", _extract_cleaned_text("age", "-1")),
+    "ЗП": ("salary", _extract_cleaned_text("salary", "По договорённости")),
+    "Желаемая должность": ("desired_position", _extract_stripped_text("desired_position")),
+    "Город": ("city", _extract_city),
+    "Условия работы": ("working_conditions", _extract_working_conditions),
+    "Занятость": ("employment", _extract_cleaned_text("employment", "")),
+    "Навыки": ("skills", _extract_skills),
+    "Последнее/текущее место работы": ("last_place_of_work", _extract_stripped_text("last_place_of_work")),
+    "Последняя/текущая должность": ("last_position", _extract_stripped_text("last_position")),
+    "Образование и ВУЗ": ("education", _extract_stripped_text("education")),
+}
+
+
+def _get_first_text(elements: dict[str, list[MatchedElement]], key: str) -> Optional[str]:
+    matched = elements[key]
+    return matched[0].text if matched else None
+
+
+def _get_cleaned_text(elements: dict[str, list[MatchedElement]], key: str, default: str) -> str:
+    text = _get_first_text(elements, key)
+    if text is None:
+        return default
+
+    return text.strip().replace("\xa0", " ")
+
+
+def get_data_from_resumes_by_urls(
+    urls: list[str],
+    max_in_flight_requests: int,
+    max_requests_per_host: int,
+    http_transport: Optional[HttpTransport] = None,
+    parse_executor: Optional[Executor] = None,
+    parse_workers: int = 1,
+    parse_queue_size: int = 64,
+    telemetry: Optional[ExtractionTelemetry] = None,
+) -> list[Union[dict[str, Any], BaseException]]:
+    """
+    Без parse_executor каждая страница разбирается в потоке, который её загрузил.
+    С ним загрузка и разбор выполняются раздельными стадиями StagedPageFetcher,
+    а время разбора страниц и полей учитывается в телеметрии.
+    """
+    if parse_executor is not None:
+        staged_fetcher = StagedPageFetcher(
+            partial(fetch_resume_page, http_transport=http_transport),
+            parse_resume_page_with_timings,
+            parse_executor,
+            parse_workers,
+            max_in_flight_requests,
+            max_requests_per_host,
+            parse_queue_size,
+        )
+        return [_unpack_parsed_page(result, telemetry) for result in staged_fetcher.process_all(urls)]
 
+    fetcher = ConcurrentResumeFetcher(
+        partial(get_data_from_resume_by_url, http_transport=http_transport),
+        max_in_flight_requests,
+        max_requests_per_host,
+    )
+    return fetcher.fetch_all(urls)
 
-def get_data_from_resume_by_url(url: str) -> dict[str, Any]:
-    info: dict[str, Any] = {}
 
-    response = requests.get(url, timeout=5)
-    if response.status_code != 200:
-        print(f"Не удалось загрузить страницу: {response.status_code}")
+def _unpack_parsed_page(
+    result: Union[Optional[ParsedResumePage], BaseException],
+    telemetry: Optional[ExtractionTelemetry],
+) -> Union[dict[str, Any], BaseException]:
+    if result is None:
         return {}
 
-    soup = BeautifulSoup(response.text, "html.parser")
-
-    info["Дата обновления резюме"] = get_date_of_updating(soup)
-    info["Возраст"] = get_age(soup)
-    info["ЗП"] = get_salary(soup)
-    info["Желаемая должность"] = get_desired_position(soup)
-    info["Город"] = get_city(soup)
-    info["Условия работы"] = get_working_conditions(soup)
-    info["Занятость"] = get_employment(soup)
-    info["Навыки"] = get_skills(soup)
-
-    experience = get_last_experience(soup)
-    info["Последнее/текущее место работы"] = experience[0]
-    info["Последняя/текущая должность"] = experience[1]
-
-    info["Образование и ВУЗ"] = get_education(soup)
+    if isinstance(result, BaseException):
+        return result
+
+    if result.error is not None:
+        if telemetry is not None:
+            telemetry.record_parse_error(result.seconds)
+        return ValueError(result.error)
+
+    if telemetry is not None:
+        telemetry.record_page_parse(result.seconds, result.field_seconds, result.empty_fields)
+    return result.record
+
+
+def parse_archived_page(
+    page: ArchivedPage,
+    archive_dir: Path,
+    search_url: str = SUPERJOB_SEARCH_URL,
+    resume_base_url: str = SUPERJOB_RESUME_BASE_URL,
+) -> Union[list[dict[str, Any]], dict[str, Any], BaseException]:
+    """
+    Разбирает страницу из архива сырых HTML: страницы поиска - в карточки резюме,
+    остальные - в данные резюме. Ошибка разбора возвращается, а не пробрасывается,
+    чтобы функцию можно было выполнять в пуле процессов.
+    """
+    try:
+        html = RawHtmlArchive.read_page(archive_dir, page)
+        if page.url.startswith(search_url):
+            return parse_resume_cards(html, base_url=resume_base_url)
 
-    return info
+        return parse_resume_page(html)
+    except Exception as e:
+        return e
@@ -1,3 +1,4 @@
 from .i_data_extracting_component import IDataExtractingComponent
+from .i_source_connector import ISourceConnector
 
-__all__ = ["IDataExtractingComponent"]
+__all__ = ["IDataExtractingComponent", "ISourceConnector"]
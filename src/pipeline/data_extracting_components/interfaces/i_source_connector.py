@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from datetime import datetime
+from typing import Any, Dict
+
+from src.pipeline.data_extracting_components.component_sources import (
+    ExtractionJournal,
+    ResumeBatchSink,
+    SeenResumeFilter,
+)
+
+
+class ISourceConnector(ABC):
+    """
+    Источник резюме для шага извлечения. Коннекторы разных источников выполняются одновременно
+    в отдельных потоках, поэтому коннектор не должен разделять изменяемое состояние с другими,
+    кроме переданных ему потокобезопасных объектов.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """
+        :return: Имя источника, записывается в колонку источника SOURCE_DATA
+        """
+
+    @abstractmethod
+    def extract(
+        self,
+        pages_by_position: Dict[str, int],
+        watermarks: Dict[str, datetime],
+        journal: ExtractionJournal,
+        seen_filter: SeenResumeFilter,
+        parse_executor: Executor,
+        write_resumes: ResumeBatchSink,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Данные резюме передаются в write_resumes порциями по мере загрузки, а не возвращаются целиком:
+        каждая ссылка передаётся один раз, ссылки без данных не выгружаются. Коннектор не хранит
+        переданные порции. write_resumes можно вызывать из потока коннектора.
+        :param pages_by_position: Число страниц выдачи для каждой позиции; позиции с 0 страниц не обходятся.
+        :param watermarks: Водяные знаки позиций источника; более старые резюме можно не загружать.
+        :param journal: Журнал контрольных точек источника; восстановленные из него данные повторно не загружаются.
+        :param seen_filter: Фильтр уже выгруженных резюме.
+        :param parse_executor: Общий пул процессов для разбора страниц.
+        :param write_resumes: Приёмник ссылок на резюме по позициям и порции данных резюме в общей схеме
+            SOURCE_DATA (дата обновления - datetime) или исключений, если резюме получить не удалось.
+        :return: Таблицы метрик источника для ILogger.publish_dictionary_values
+        """
@@ -0,0 +1,661 @@
+import os
+import socket
+import time
+from collections import defaultdict
+from concurrent.futures import Executor
+from datetime import date, datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from src import logger
+from src.entities.pipeline.component_properties import ExtractionStepProperties, ListingProperties
+from src.pipeline.data_extracting_components.component_sources import (
+    AdaptiveRateLimiter,
+    ExtractionJournal,
+    ExtractionTelemetry,
+    FrontierTask,
+    HttpResponseCache,
+    HttpTransport,
+    RawHtmlArchive,
+    ResumeBatchSink,
+    SearchPageCrawler,
+    SeenResumeFilter,
+    SourceExtraction,
+    SqliteCrawlFrontier,
+)
+from src.pipeline.data_extracting_components.get_data_from_superjob import (
+    RESUME_URL_COLUMN,
+    SEARCH_CARD_COLUMNS,
+    get_data_from_resume_by_url,
+    get_data_from_resumes_by_urls,
+    get_resume_cards_from_pages,
+    parse_archived_page,
+)
+from src.pipeline.data_extracting_components.interfaces import ISourceConnector
+from src.utils.exceptions.service_error import ServiceError
+
+
+class SuperjobConnector(ISourceConnector):
+    """
+    Источник резюме superjob.ru: обход страниц поиска по позициям, загрузка и разбор страниц резюме.
+    """
+
+    SOURCE_NAME = "superjob"
+
+    _DATE_COLUMN_NAME = "Дата обновления резюме"
+    _NO_WATERMARK = datetime(year=1970, month=1, day=1)
+    _POSITION_QUERY_PARAMETER = "keywords[0][keys]"
+    _PAGE_TASK = "page"
+    _RESUME_TASK = "resume"
+
+    def __init__(
+        self,
+        step_parameters: ExtractionStepProperties,
+        datasets_dir: Path,
+        parse_workers: int,
+        telemetry: Optional[ExtractionTelemetry] = None,
+    ):
+        self._step_parameters = step_parameters
+        self._datasets_dir = datasets_dir
+        self._parse_workers = parse_workers
+        self._telemetry = telemetry
+
+    @property
+    def name(self) -> str:
+        return self.SOURCE_NAME
+
+    def extract(
+        self,
+        pages_by_position: Dict[str, int],
+        watermarks: Dict[str, datetime],
+        journal: ExtractionJournal,
+        seen_filter: SeenResumeFilter,
+        parse_executor: Executor,
+        write_resumes: ResumeBatchSink,
+    ) -> Dict[str, Dict[str, Any]]:
+        positions = {position: pages_count for position, pages_count in pages_by_position.items() if pages_count > 0}
+        extract_positions = (
+            self._extract_with_frontier if self._step_parameters.frontier.enabled else self._extract_directly
+        )
+        with self._create_http_transport() as http_transport:
+            published_tables = extract_positions(
+                positions, watermarks, journal, seen_filter, http_transport, parse_executor, write_resumes
+            )
+            response_cache = http_transport.cache
+            rate_limiter = http_transport.rate_limiter
+            cache_statistics = response_cache.statistics if response_cache is not None else None
+            rate_limit_metrics = rate_limiter.metrics if rate_limiter is not None else None
+
+        if cache_statistics is not None:
+            logger.info(f"Статистика кэша HTTP-ответов: {cache_statistics}")
+            published_tables["Кэш HTTP-ответов"] = cache_statistics
+
+        for host, host_metrics in (rate_limit_metrics or {}).items():
+            logger.info(f"Итоговый лимит запросов к {host}: {host_metrics}")
+            published_tables[f"Лимит запросов {host}"] = host_metrics
+
+        return published_tables
+
+    def load_archive(self, parse_executor: Executor) -> Dict[date, SourceExtraction]:
+        """
+        Разбирает архив сырых HTML в пуле процессов без обращения к сети.
+        :return: Ссылки на резюме по позициям и данные резюме по дням загрузки страниц.
+        """
+        archive_parameters = self._step_parameters.raw_archive
+        archive_dir = self._datasets_dir / archive_parameters.directory
+        if not archive_dir.is_dir():
+            raise ServiceError(f"Архив сырых HTML {archive_dir} не найден")
+
+        archive = RawHtmlArchive(archive_dir, archive_parameters.segment_max_mb * 2**20, 0)
+        try:
+            pages = archive.list_pages()
+        finally:
+            archive.close()
+
+        parse_page = partial(
+            parse_archived_page,
+            archive_dir=archive_dir,
+            search_url=self._step_parameters.search_url,
+            resume_base_url=self._step_parameters.resume_base_url,
+        )
+        chunk_size = max(1, len(pages) // (self._parse_workers * 4))
+        parsed_pages = list(parse_executor.map(parse_page, pages, chunksize=chunk_size))
+        logger.info(f"Из архива сырых HTML разобрано {len(pages)} страниц в {self._parse_workers} процессах")
+
+        extractions: Dict[date, SourceExtraction] = defaultdict(lambda: SourceExtraction(defaultdict(list), {}))
+        for page, parsed in zip(pages, parsed_pages):
+            extraction = extractions[page.fetched_at.date()]
+            if isinstance(parsed, list):
+                position = self._get_position_from_search_url(page.url)
+                extraction.position_resume_urls[position].extend(card[RESUME_URL_COLUMN] for card in parsed)
+                for card in parsed:
+                    listing_info = self._get_listing_info(card, self._step_parameters.listing)
+                    if listing_info is not None:
+                        extraction.resumes.setdefault(card[RESUME_URL_COLUMN], listing_info)
+            elif page.url.startswith(self._step_parameters.search_url):
+                logger.warning(f"Не удалось разобрать страницу поиска {page.url} из архива: {parsed}")
+            elif isinstance(parsed, dict) or page.url not in extraction.resumes:
+                extraction.resumes[page.url] = parsed
+
+        return dict(extractions)
+
+    def run_frontier_worker(self, parse_executor: Executor, idle_timeout_seconds: float) -> int:
+        """
+        Разбирает задачи открытого запуска из очереди работ обхода, пока в течение idle_timeout_seconds
+        не появится ни одной новой задачи. Воркеру не нужно локальное состояние шага: он только загружает
+        и разбирает страницы, а выбор резюме и запись SOURCE_DATA выполняет шаг извлечения.
+        :return: Число обработанных задач.
+        """
+        frontier = self._open_frontier()
+        worker = self._get_worker_name()
+        processed_count = 0
+        idle_since = time.monotonic()
+        try:
+            with self._create_http_transport() as http_transport:
+                while time.monotonic() - idle_since < idle_timeout_seconds:
+                    open_run = frontier.get_open_run(self.name)
+                    batch_count = (
+                        self._process_frontier_batch(frontier, open_run[0], worker, http_transport, parse_executor)
+                        if open_run is not None
+                        else 0
+                    )
+                    if batch_count == 0:
+                        time.sleep(self._step_parameters.frontier.poll_seconds)
+                        continue
+
+                    processed_count += batch_count
+                    idle_since = time.monotonic()
+        finally:
+            frontier.close()
+
+        logger.info(f"Воркер {worker} обработал задач очереди обхода: {processed_count}")
+        return processed_count
+
+    def _extract_directly(
+        self,
+        positions: Dict[str, int],
+        watermarks: Dict[str, datetime],
+        journal: ExtractionJournal,
+        seen_filter: SeenResumeFilter,
+        http_transport: HttpTransport,
+        parse_executor: Executor,
+        write_resumes: ResumeBatchSink,
+    ) -> Dict[str, Dict[str, Any]]:
+        crawler = self._create_crawler(http_transport, journal)
+        position_resume_urls = {
+            position: self._collect_resume_urls(
+                position,
+                crawler,
+                watermarks.get(position, self._NO_WATERMARK),
+                journal,
+                pages_count,
+            )
+            for position, pages_count in positions.items()
+        }
+        return self._fetch_unique_resumes(
+            position_resume_urls,
+            watermarks,
+            crawler,
+            http_transport,
+            parse_executor,
+            journal,
+            seen_filter,
+            write_resumes,
+        )
+
+    def _extract_with_frontier(
+        self,
+        positions: Dict[str, int],
+        watermarks: Dict[str, datetime],
+        journal: ExtractionJournal,
+        seen_filter: SeenResumeFilter,
+        http_transport: HttpTransport,
+        parse_executor: Executor,
+        write_resumes: ResumeBatchSink,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Страницы поиска и резюме загружаются через очередь работ обхода, которую вместе с шагом
+        разбирают внешние воркеры (run_frontier_worker). Сначала в очередь ставятся все страницы плана;
+        между стадиями здесь же выбираются резюме для загрузки, затем в очередь ставятся они.
+        Запуск в очереди продолжается, если параметры совпадают с открытым, поэтому после сбоя шага
+        подтверждённые воркерами задачи повторно не выполняются.
+        """
+        frontier = self._open_frontier()
+        worker = self._get_worker_name()
+        try:
+            run = self._open_frontier_run(frontier, positions, watermarks)
+            frontier.add_tasks(
+                self.name,
+                run,
+                self._PAGE_TASK,
+                (
+                    (f"{self._get_position_url(position)}&page={page}", payload, page)
+                    for position, pages_count in positions.items()
+                    if position not in journal.position_resume_urls
+                    for page, payload in self._get_page_payloads(position, pages_count, watermarks)
+                ),
+            )
+            self._work_frontier_until_drained(frontier, run, worker, self._PAGE_TASK, http_transport, parse_executor)
+            self._record_frontier_pages(frontier, run, positions, watermarks, journal)
+
+            position_resume_urls = {position: journal.position_resume_urls[position] for position in positions}
+            cards = {card[RESUME_URL_COLUMN]: card for page in journal.search_pages.values() for card in page}
+            resumes, urls_to_fetch, published_tables = self._select_resumes_to_fetch(
+                position_resume_urls, watermarks, journal.resumes, cards, seen_filter
+            )
+            write_resumes(position_resume_urls, resumes)
+            frontier.add_tasks(self.name, run, self._RESUME_TASK, ((url, {}, 0) for url in urls_to_fetch))
+            self._work_frontier_until_drained(frontier, run, worker, self._RESUME_TASK, http_transport, parse_executor)
+
+            batch_size = self._step_parameters.checkpoint.resume_batch_size
+            batch_resumes: Dict[str, Union[Dict[str, Any], BaseException]] = {}
+            for url, _, result, is_done in frontier.get_results(self.name, run, self._RESUME_TASK):
+                batch_resumes[url] = result if is_done else ServiceError(result)
+                if len(batch_resumes) >= batch_size:
+                    self._write_fetched_resumes(position_resume_urls, batch_resumes, journal, write_resumes)
+                    batch_resumes = {}
+            self._write_fetched_resumes(position_resume_urls, batch_resumes, journal, write_resumes)
+
+            frontier_statistics = frontier.get_statistics(self.name, run)
+            logger.info(f"Очередь работ обхода: {frontier_statistics}")
+            published_tables["Очередь работ обхода"] = frontier_statistics
+            frontier.close_run(self.name, run)
+        finally:
+            frontier.close()
+
+        return published_tables
+
+    def _open_frontier(self) -> SqliteCrawlFrontier:
+        frontier_parameters = self._step_parameters.frontier
+        return SqliteCrawlFrontier(
+            self._datasets_dir / frontier_parameters.path,
+            frontier_parameters.lease_seconds,
+            frontier_parameters.max_attempts,
+        )
+
+    @staticmethod
+    def _get_worker_name() -> str:
+        return f"{socket.gethostname()}-{os.getpid()}"
+
+    def _open_frontier_run(
+        self,
+        frontier: SqliteCrawlFrontier,
+        positions: Dict[str, int],
+        watermarks: Dict[str, datetime],
+    ) -> str:
+        parameters = {
+            "pages_by_position": positions,
+            "watermarks": {position: watermarks.get(position, self._NO_WATERMARK) for position in positions},
+        }
+        open_run = frontier.get_open_run(self.name)
+        if open_run is not None and open_run[1] == parameters:
+            logger.info(f"Продолжается запуск {open_run[0]} в очереди работ обхода")
+            return open_run[0]
+
+        if open_run is not None:
+            logger.warning(f"Запуск {open_run[0]} в очереди работ обхода закрыт: параметры обхода изменились")
+            frontier.close_run(self.name, open_run[0])
+
+        run = datetime.now().isoformat()
+        frontier.open_run(self.name, run, parameters)
+        return run
+
+    def _get_page_payloads(
+        self,
+        position: str,
+        pages_count: int,
+        watermarks: Dict[str, datetime],
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        watermark = watermarks.get(position, self._NO_WATERMARK)
+        for page in range(pages_count):
+            yield page, {"position": position, "page": page, "pages_count": pages_count, "watermark": watermark}
+
+    def _work_frontier_until_drained(
+        self,
+        frontier: SqliteCrawlFrontier,
+        run: str,
+        worker: str,
+        kind: str,
+        http_transport: HttpTransport,
+        parse_executor: Executor,
+    ) -> None:
+        while not frontier.is_drained(self.name, run, kind):
+            if self._process_frontier_batch(frontier, run, worker, http_transport, parse_executor) == 0:
+                time.sleep(self._step_parameters.frontier.poll_seconds)
+
+    def _process_frontier_batch(
+        self,
+        frontier: SqliteCrawlFrontier,
+        run: str,
+        worker: str,
+        http_transport: HttpTransport,
+        parse_executor: Executor,
+    ) -> int:
+        """
+        :return: Число задач, полученных в аренду.
+        """
+        tasks = frontier.lease(self.name, run, worker, self._step_parameters.frontier.lease_batch_size)
+        page_tasks = [task for task in tasks if task.kind == self._PAGE_TASK]
+        resume_tasks = [task for task in tasks if task.kind == self._RESUME_TASK]
+
+        if page_tasks:
+            pages = get_resume_cards_from_pages(
+                [task.key for task in page_tasks],
+                self._step_parameters.max_in_flight_requests,
+                self._step_parameters.max_requests_per_host,
+                http_transport,
+                self._step_parameters.resume_base_url,
+            )
+            for task, page in zip(page_tasks, pages):
+                if isinstance(page, BaseException):
+                    frontier.fail(task, worker, str(page))
+                elif self._is_last_page(page, task.payload["watermark"]):
+                    frontier.complete(task, page, self._get_next_page_keys(task))
+                else:
+                    frontier.complete(task, page)
+
+        if resume_tasks:
+            resumes = self._fetch_resumes([task.key for task in resume_tasks], http_transport, parse_executor)
+            for task, info in zip(resume_tasks, resumes):
+                if isinstance(info, BaseException):
+                    frontier.fail(task, worker, str(info))
+                else:
+                    frontier.complete(task, info)
+
+        return len(tasks)
+
+    def _is_last_page(self, cards: List[Dict[str, Any]], watermark: datetime) -> bool:
+        """
+        Как и в SearchPageCrawler, обход позиции заканчивается на пустой странице или на странице,
+        самое старое резюме которой обновлено раньше водяного знака. Дата берётся только из карточек:
+        без неё обходятся все страницы плана.
+        """
+        card_dates = [card[self._DATE_COLUMN_NAME] for card in cards if self._DATE_COLUMN_NAME in card]
+        return not cards or (watermark > self._NO_WATERMARK and bool(card_dates) and card_dates[-1] < watermark)
+
+    def _get_next_page_keys(self, task: FrontierTask) -> List[str]:
+        position_url = self._get_position_url(task.payload["position"])
+        return [f"{position_url}&page={page}" for page in range(task.payload["page"] + 1, task.payload["pages_count"])]
+
+    def _record_frontier_pages(
+        self,
+        frontier: SqliteCrawlFrontier,
+        run: str,
+        positions: Dict[str, int],
+        watermarks: Dict[str, datetime],
+        journal: ExtractionJournal,
+    ) -> None:
+        """
+        Переносит загруженные страницы поиска в журнал. Страницы позиции берутся по порядку до последней;
+        страницы после неё, загруженные другими воркерами до отмены, отбрасываются, как и при обходе без очереди.
+        """
+        position_pages: Dict[str, Dict[int, List[Dict[str, Any]]]] = defaultdict(dict)
+        search_pages = []
+        for url, payload, cards, is_done in frontier.get_results(self.name, run, self._PAGE_TASK):
+            if not is_done:
+                logger.warning(f"Не удалось загрузить страницу поиска {url}: {cards}")
+                cards = []
+            elif url not in journal.search_pages:
+                search_pages.append((url, cards))
+
+            position_pages[payload["position"]][payload["page"]] = cards
+        journal.record_search_pages(search_pages)
+
+        for position, pages_count in positions.items():
+            if position in journal.position_resume_urls:
+                continue
+
+            pages: List[List[Dict[str, Any]]] = []
+            for page in range(pages_count):
+                cards = position_pages[position].get(page, [])
+                if not cards:
+                    break
+
+                pages.append(cards)
+                if self._is_last_page(cards, watermarks.get(position, self._NO_WATERMARK)):
+                    break
+
+            resume_urls = list(dict.fromkeys(card[RESUME_URL_COLUMN] for cards in pages for card in cards))
+            logger.debug(f"По позиции {position} загружено {len(pages)} страниц поиска из {pages_count}")
+            journal.record_position(position, resume_urls, len(pages))
+
+    def _get_position_url(self, position: str) -> str:
+        return f"{self._step_parameters.search_url}?keywords[0][keys]={position}&sbmit=1"
+
+    def _get_position_from_search_url(self, search_url: str) -> str:
+        return parse_qs(urlsplit(search_url).query)[self._POSITION_QUERY_PARAMETER][0]
+
+    def _create_crawler(self, http_transport: HttpTransport, journal: ExtractionJournal) -> SearchPageCrawler:
+        fetch_pages = partial(
+            get_resume_cards_from_pages,
+            max_in_flight_requests=self._step_parameters.max_in_flight_requests,
+            max_requests_per_host=self._step_parameters.max_requests_per_host,
+            http_transport=http_transport,
+            resume_base_url=self._step_parameters.resume_base_url,
+        )
+        crawler = SearchPageCrawler(
+            fetch_pages=partial(self._fetch_search_pages, fetch_pages=fetch_pages, journal=journal),
+            fetch_resume=partial(get_data_from_resume_by_url, http_transport=http_transport),
+            prefetch_pages=self._step_parameters.prefetch_pages,
+            binary_search_min_pages=self._step_parameters.binary_search_min_pages,
+        )
+        crawler.probed_resumes.update(journal.resumes)
+        for cards in journal.search_pages.values():
+            crawler.cards.update((card[RESUME_URL_COLUMN], card) for card in cards)
+
+        return crawler
+
+    @staticmethod
+    def _fetch_search_pages(
+        urls: List[str],
+        fetch_pages: Callable[[List[str]], List[Union[List[Dict[str, Any]], BaseException]]],
+        journal: ExtractionJournal,
+    ) -> List[Union[List[Dict[str, Any]], BaseException]]:
+        missing_urls = [url for url in urls if url not in journal.search_pages]
+        fetched_pages = dict(zip(missing_urls, fetch_pages(missing_urls) if missing_urls else []))
+        journal.record_search_pages(
+            (url, page) for url, page in fetched_pages.items() if not isinstance(page, BaseException)
+        )
+
+        return [journal.search_pages[url] if url in journal.search_pages else fetched_pages[url] for url in urls]
+
+    def _collect_resume_urls(
+        self,
+        position: str,
+        crawler: SearchPageCrawler,
+        extract_from: datetime,
+        journal: ExtractionJournal,
+        pages_count: int,
+    ) -> List[str]:
+        if position in journal.position_resume_urls:
+            return journal.position_resume_urls[position]
+
+        pages = crawler.crawl(self._get_position_url(position), pages_count, extract_from)
+        logger.debug(f"По позиции {position} загружено {len(pages)} страниц поиска из {pages_count}")
+
+        resume_urls = list(dict.fromkeys(resume_url for page_urls in pages for resume_url in page_urls))
+        journal.record_resumes(
+            (resume_url, info)
+            for resume_url, info in crawler.probed_resumes.items()
+            if resume_url not in journal.resumes
+        )
+        journal.record_position(position, resume_urls, len(pages))
+
+        return resume_urls
+
+    def _fetch_unique_resumes(
+        self,
+        position_resume_urls: Dict[str, List[str]],
+        watermarks: Dict[str, datetime],
+        crawler: SearchPageCrawler,
+        http_transport: HttpTransport,
+        parse_executor: Executor,
+        journal: ExtractionJournal,
+        seen_filter: SeenResumeFilter,
+        write_resumes: ResumeBatchSink,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Резюме, не требующие загрузки, передаются в write_resumes сразу, загруженные - каждой порцией.
+        :return: Таблицы статистики дедупликации и карточек.
+        """
+        resumes, urls_to_fetch, published_tables = self._select_resumes_to_fetch(
+            position_resume_urls, watermarks, crawler.probed_resumes, crawler.cards, seen_filter
+        )
+        write_resumes(position_resume_urls, resumes)
+
+        batch_size = self._step_parameters.checkpoint.resume_batch_size
+        for batch_start in range(0, len(urls_to_fetch), batch_size):
+            batch_urls = urls_to_fetch[batch_start:batch_start + batch_size]
+            batch_resumes = self._fetch_resumes(batch_urls, http_transport, parse_executor)
+            self._write_fetched_resumes(
+                position_resume_urls, dict(zip(batch_urls, batch_resumes)), journal, write_resumes
+            )
+
+        return published_tables
+
+    @staticmethod
+    def _write_fetched_resumes(
+        position_resume_urls: Dict[str, List[str]],
+        resumes: Dict[str, Union[Dict[str, Any], BaseException]],
+        journal: ExtractionJournal,
+        write_resumes: ResumeBatchSink,
+    ) -> None:
+        if not resumes:
+            return
+
+        journal.persist_resumes((url, info) for url, info in resumes.items() if isinstance(info, dict) and info)
+        write_resumes(position_resume_urls, resumes)
+
+    def _select_resumes_to_fetch(
+        self,
+        position_resume_urls: Dict[str, List[str]],
+        watermarks: Dict[str, datetime],
+        known_resumes: Dict[str, Dict[str, Any]],
+        cards: Dict[str, Dict[str, Any]],
+        seen_filter: SeenResumeFilter,
+    ) -> Tuple[Dict[str, Union[Dict[str, Any], BaseException]], List[str], Dict[str, Dict[str, Any]]]:
+        """
+        Ссылка, встретившаяся у нескольких позиций, загружается один раз. Ссылка не загружается,
+        если резюме уже выгружено с датой обновления, показанной в его карточке выдачи.
+        С включённым режимом карточек страница резюме не загружается, если по дате в карточке
+        резюме старше водяных знаков всех позиций или если в карточке есть все обязательные поля.
+        :param known_resumes: Резюме, уже загруженные при обходе или восстановленные из журнала.
+        :return: Данные резюме, не требующих загрузки, ссылки для загрузки и таблицы статистики
+            дедупликации и карточек.
+        """
+        step_parameters = self._step_parameters
+        resume_links_count = sum(len(resume_urls) for resume_urls in position_resume_urls.values())
+        url_oldest_watermarks: Dict[str, datetime] = {}
+        for position, resume_urls in position_resume_urls.items():
+            watermark = watermarks.get(position, self._NO_WATERMARK)
+            for resume_url in resume_urls:
+                url_oldest_watermarks[resume_url] = min(url_oldest_watermarks.get(resume_url, watermark), watermark)
+
+        unique_urls = list(url_oldest_watermarks)
+        resumes: Dict[str, Union[Dict[str, Any], BaseException]] = dict(known_resumes)
+        listing_statistics = {"listing_records": 0, "skipped_by_card_date": 0}
+        urls_to_fetch = []
+        for resume_url in unique_urls:
+            listed_update_date = cards.get(resume_url, {}).get(self._DATE_COLUMN_NAME)
+            if resume_url in known_resumes or seen_filter.is_fetch_redundant(
+                resume_url, listed_update_date.date() if listed_update_date is not None else None
+            ):
+                continue
+
+            card = cards.get(resume_url, {}) if step_parameters.listing.enabled else {}
+            if card.get(self._DATE_COLUMN_NAME, datetime.max) < url_oldest_watermarks[resume_url]:
+                listing_statistics["skipped_by_card_date"] += 1
+                continue
+
+            listing_info = self._get_listing_info(card, step_parameters.listing)
+            if listing_info is not None:
+                listing_statistics["listing_records"] += 1
+                resumes[resume_url] = listing_info
+                continue
+
+            urls_to_fetch.append(resume_url)
+
+        deduplication_statistics = {
+            "resume_links": resume_links_count,
+            "unique_resumes": len(unique_urls),
+            "saved_requests": resume_links_count - len(unique_urls),
+        }
+        logger.info(f"Дедупликация ссылок на резюме между позициями: {deduplication_statistics}")
+        published_tables: Dict[str, Dict[str, Any]] = {"Дедупликация резюме": deduplication_statistics}
+
+        if step_parameters.listing.enabled:
+            missing_card_fields = sorted(set(step_parameters.listing.required_fields) - set(SEARCH_CARD_COLUMNS))
+            if missing_card_fields:
+                logger.warning(f"Поля {missing_card_fields} не показываются в карточках выдачи: резюме загружаются")
+            listing_statistics["detail_fetches"] = len(urls_to_fetch)
+            logger.info(f"Карточки выдачи: {listing_statistics}")
+            published_tables["Карточки выдачи"] = listing_statistics
+
+        return resumes, urls_to_fetch, published_tables
+
+    def _fetch_resumes(
+        self,
+        urls: List[str],
+        http_transport: HttpTransport,
+        parse_executor: Executor,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        return get_data_from_resumes_by_urls(
+            urls,
+            self._step_parameters.max_in_flight_requests,
+            self._step_parameters.max_requests_per_host,
+            http_transport,
+            parse_executor,
+            self._parse_workers,
+            self._step_parameters.parse_queue_size,
+            self._telemetry,
+        )
+
+    def _get_listing_info(self, card: Dict[str, Any], listing: ListingProperties) -> Optional[Dict[str, Any]]:
+        """
+        Карточка выдачи содержит только дату обновления, возраст, зарплату, желаемую должность и город,
+        поэтому строка из карточки неполная: остальные колонки SOURCE_DATA в ней пустые.
+        Поле, которого нет ни в одной карточке, в обязательных означает загрузку страницы каждого резюме.
+        :return: Данные резюме из карточки, если режим карточек включён и в ней есть дата обновления
+            и все обязательные поля, иначе None - нужна страница резюме.
+        """
+        required_fields = [self._DATE_COLUMN_NAME, *listing.required_fields]
+        if not listing.enabled or any(field not in card for field in required_fields):
+            return None
+
+        return {column: value for column, value in card.items() if column != RESUME_URL_COLUMN}
+
+    def _create_http_transport(self) -> HttpTransport:
+        step_parameters = self._step_parameters
+        rate_limiter = (
+            AdaptiveRateLimiter(step_parameters.rate_limit, step_parameters.max_requests_per_host)
+            if step_parameters.rate_limit.enabled
+            else None
+        )
+
+        archive_parameters = step_parameters.raw_archive
+        archive = (
+            RawHtmlArchive(
+                archive_dir=self._datasets_dir / archive_parameters.directory,
+                segment_max_bytes=archive_parameters.segment_max_mb * 2**20,
+                compression_level=archive_parameters.compression_level,
+            )
+            if archive_parameters.enabled
+            else None
+        )
+
+        cache_parameters = step_parameters.http_cache
+        if not cache_parameters.enabled:
+            return HttpTransport(
+                step_parameters.http_transport, rate_limiter=rate_limiter, archive=archive, telemetry=self._telemetry
+            )
+
+        cache = HttpResponseCache(
+            cache_dir=self._datasets_dir / cache_parameters.directory,
+            max_size_bytes=cache_parameters.max_size_mb * 2**20,
+            ttl_seconds=cache_parameters.ttl_hours * 3600,
+        )
+        return HttpTransport(
+            step_parameters.http_transport, cache, cache_parameters.offline, rate_limiter, archive, self._telemetry
+        )
@@ -0,0 +1,3 @@
+from .nli_relevance_classifier import NliRelevanceClassifier
+
+__all__ = ["NliRelevanceClassifier"]
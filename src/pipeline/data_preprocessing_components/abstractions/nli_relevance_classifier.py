@@ -0,0 +1,91 @@
+from abc import abstractmethod
+from typing import Any, Dict, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from src.pipeline.data_preprocessing_components.interfaces import IRelevanceClassifier
+from src.utils.exceptions import ServiceError
+
+
+class NliRelevanceClassifier(IRelevanceClassifier):
+    """
+    Пакетная zero-shot классификация пар (текст, метка) NLI-моделью - то же, что делает
+    transformers.pipeline("zero-shot-classification") с одной меткой: гипотеза строится по hypothesis_template,
+    оценка - softmax логитов противоречия и следования, взятый для следования.
+    Пары токенизируются один раз, сортируются по длине и режутся на пакеты по batch_size,
+    каждый пакет дополняется только до длины своей самой длинной пары.
+    Наследник загружает токенизатор и модель и считает логиты пакета.
+    """
+
+    DEFAULT_HYPOTHESIS_TEMPLATE = "This example is {}."
+
+    def __init__(self, model_name: str, backend_name: str, batch_size: int, hypothesis_template: str):
+        if batch_size < 1:
+            raise ServiceError("Размер пакета классификации должен быть положительным")
+
+        self._model_name = model_name
+        self._backend_name = backend_name
+        self._batch_size = batch_size
+        self._hypothesis_template = hypothesis_template
+        self._tokenizer: Any = None
+        self._entailment_id = 0
+        self._contradiction_id = 0
+
+    @property
+    def model_id(self) -> str:
+        return self.get_model_id(self._model_name, self._backend_name, self._hypothesis_template)
+
+    @classmethod
+    def get_model_id(
+        cls,
+        model_name: str,
+        backend_name: str,
+        hypothesis_template: str = DEFAULT_HYPOTHESIS_TEMPLATE,
+    ) -> str:
+        """
+        Идентификатор известен до загрузки модели, поэтому по нему можно сначала заглянуть в кэш оценок.
+        """
+        return f"{model_name}|{hypothesis_template}|{backend_name}"
+
+    def score(self, texts: Sequence[str], labels: Sequence[str]) -> npt.NDArray[np.float64]:
+        if len(texts) != len(labels):
+            raise ServiceError("Число текстов и меток для классификации не совпадает")
+
+        scores = np.empty(len(texts), dtype=np.float64)
+        if not texts:
+            return scores
+
+        hypotheses = [self._hypothesis_template.format(label) for label in labels]
+        encodings = self._tokenizer(list(texts), hypotheses, truncation="only_first")
+        order = np.argsort([len(input_ids) for input_ids in encodings["input_ids"]], kind="stable")
+
+        for start in range(0, len(order), self._batch_size):
+            batch_indices = order[start:start + self._batch_size]
+            batch = self._tokenizer.pad(
+                [{key: values[index] for key, values in encodings.items()} for index in batch_indices],
+                padding="longest",
+                return_tensors="np",
+            )
+            logits = self._get_logits(dict(batch))[:, [self._contradiction_id, self._entailment_id]]
+            logits = logits - logits.max(axis=1, keepdims=True)
+            probabilities = np.exp(logits)
+            scores[batch_indices] = probabilities[:, 1] / probabilities.sum(axis=1)
+
+        return scores
+
+    @abstractmethod
+    def _get_logits(self, batch: Dict[str, npt.NDArray[np.int64]]) -> npt.NDArray[np.float32]:
+        """
+        :return: Логиты NLI-модели для дополненного пакета, форма (размер пакета, число меток).
+        """
+
+    def _set_label_ids(self, label2id: Dict[str, int]) -> None:
+        label_ids = {label.lower(): index for label, index in label2id.items()}
+        try:
+            self._entailment_id, self._contradiction_id = [
+                next(index for label, index in label_ids.items() if label.startswith(prefix))
+                for prefix in ("entail", "contradict")
+            ]
+        except StopIteration:
+            raise ServiceError(f"В метках NLI-модели не найдены следование и противоречие: {label2id}")
@@ -0,0 +1,16 @@
+from .backend_guard_store import BackendGuardStore
+from .embedding_relevance_classifier import EmbeddingRelevanceClassifier
+from .onnx_relevance_classifier import OnnxRelevanceClassifier
+from .relevance_classifier_registry import ClassifierLoad, RelevanceClassifierRegistry
+from .relevance_score_cache import RelevanceScoreCache
+from .torch_relevance_classifier import TorchRelevanceClassifier
+
+__all__ = [
+    "BackendGuardStore",
+    "ClassifierLoad",
+    "EmbeddingRelevanceClassifier",
+    "OnnxRelevanceClassifier",
+    "RelevanceClassifierRegistry",
+    "RelevanceScoreCache",
+    "TorchRelevanceClassifier",
+]
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.exceptions import ServiceError
+
+
+class BackendGuardStore:
+    """
+    JSON-файл рядом с артефактами ONNX: отчёт сверки с PyTorch для каждого бэкенда (model_id различает
+    и квантование) и фиксированная контрольная выборка пар, на которой сверка выполнялась.
+    Отчёт действителен, пока не изменился файл модели, с которым он получен: после нового экспорта
+    или квантования бэкенд сверяется заново на той же выборке.
+    """
+
+    _VERSION = 1
+
+    def __init__(self, store_path: Path):
+        self._store_path = store_path
+
+    def load_sample(self) -> List[Tuple[str, str]]:
+        """
+        :return: Контрольная выборка (должность, позиция); пустая, если сверка ещё не выполнялась.
+        """
+        return [(title, label) for title, label in self._read_state()["sample"]]
+
+    def get_report(self, model_id: str, artifact_path: Path) -> Optional[Dict[str, float]]:
+        """
+        :return: Отчёт сверки бэкенда, None - сверки не было или файл модели с тех пор изменился.
+        """
+        verdict = self._read_state()["verdicts"].get(model_id)
+        if verdict is None or verdict["artifact"] != self._get_fingerprint(artifact_path):
+            return None
+
+        report: Dict[str, float] = verdict["report"]
+        return report
+
+    def save(
+        self,
+        model_id: str,
+        artifact_path: Path,
+        sample: List[Tuple[str, str]],
+        report: Dict[str, float],
+    ) -> None:
+        state = self._read_state()
+        state["sample"] = [list(pair) for pair in sample]
+        state["verdicts"][model_id] = {
+            "artifact": self._get_fingerprint(artifact_path),
+            "report": report,
+        }
+
+        self._store_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self._store_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as fout:
+                json.dump(state, fout, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self._store_path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def _read_state(self) -> Dict[str, Any]:
+        if not self._store_path.is_file():
+            return {"version": self._VERSION, "sample": [], "verdicts": {}}
+
+        try:
+            state: Dict[str, Any] = json.loads(self._store_path.read_text(encoding="utf-8"))
+        except ValueError as e:
+            raise ServiceError(f"Повреждён файл сверки бэкенда классификатора {self._store_path}: {e}") from e
+
+        if state.get("version") != self._VERSION:
+            raise ServiceError(
+                f"Неизвестная версия файла сверки бэкенда классификатора {self._store_path}: {state.get('version')}"
+            )
+
+        return state
+
+    @staticmethod
+    def _get_fingerprint(artifact_path: Path) -> Dict[str, int]:
+        artifact_stat = artifact_path.stat()
+        return {"size": artifact_stat.st_size, "mtime_ns": artifact_stat.st_mtime_ns}
@@ -0,0 +1,74 @@
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from src.pipeline.data_preprocessing_components.interfaces import IRelevanceClassifier
+from src.utils.exceptions import ServiceError
+
+
+class EmbeddingRelevanceClassifier(IRelevanceClassifier):
+    """
+    Быстрая оценка релевантности: косинусная близость эмбеддингов текста и метки.
+    Эмбеддинг - среднее скрытых состояний sentence-embedding модели по токенам без дополнения, нормированное по L2.
+    Различные тексты и метки кодируются по одному разу, все пары оцениваются одним умножением матриц.
+    """
+
+    BACKEND_NAME = "embedding"
+
+    def __init__(self, model_name: str, model_path: Path, batch_size: int, device: Optional[str] = None):
+        if batch_size < 1:
+            raise ServiceError("Размер пакета кодирования должен быть положительным")
+
+        import torch
+        from transformers import AutoModel, AutoTokenizer
+
+        self._model_name = model_name
+        self._batch_size = batch_size
+        self._torch = torch
+        self._device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self._tokenizer = AutoTokenizer.from_pretrained(model_path)
+        self._model = (
+            AutoModel.from_pretrained(model_path, use_safetensors=True, low_cpu_mem_usage=True).to(self._device).eval()
+        )
+
+    @property
+    def model_id(self) -> str:
+        return f"{self._model_name}|{self.BACKEND_NAME}"
+
+    def score(self, texts: Sequence[str], labels: Sequence[str]) -> npt.NDArray[np.float64]:
+        if len(texts) != len(labels):
+            raise ServiceError("Число текстов и меток для классификации не совпадает")
+
+        unique_texts, text_indices = np.unique(np.array(texts, dtype=object), return_inverse=True)
+        unique_labels, label_indices = np.unique(np.array(labels, dtype=object), return_inverse=True)
+        similarities = self.score_matrix(unique_texts.tolist(), unique_labels.tolist())
+        return similarities[text_indices, label_indices]
+
+    def score_matrix(self, texts: Sequence[str], labels: Sequence[str]) -> npt.NDArray[np.float64]:
+        """
+        :return: Матрица косинусных близостей, строки - texts, столбцы - labels.
+        """
+        similarities: npt.NDArray[np.float64] = (self.encode(texts) @ self.encode(labels).T).astype(np.float64)
+        return similarities
+
+    def encode(self, texts: Sequence[str]) -> npt.NDArray[np.float32]:
+        embeddings = np.empty((len(texts), self._model.config.hidden_size), dtype=np.float32)
+        if not texts:
+            return embeddings
+
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        with self._torch.inference_mode():
+            for start in range(0, len(order), self._batch_size):
+                batch_indices = order[start:start + self._batch_size]
+                batch = self._tokenizer(
+                    [texts[index] for index in batch_indices], padding="longest", truncation=True, return_tensors="pt"
+                ).to(self._device)
+                hidden_states = self._model(**batch).last_hidden_state
+                mask = batch["attention_mask"].unsqueeze(-1).to(hidden_states.dtype)
+                pooled = (hidden_states * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+                pooled = self._torch.nn.functional.normalize(pooled, p=2, dim=1)
+                embeddings[batch_indices] = pooled.float().cpu().numpy()
+
+        return embeddings
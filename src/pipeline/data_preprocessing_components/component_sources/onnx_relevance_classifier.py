@@ -0,0 +1,121 @@
+import os
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import numpy.typing as npt
+
+from src import logger
+from src.pipeline.data_preprocessing_components.abstractions import NliRelevanceClassifier
+from src.utils.exceptions import ServiceError
+
+
+class OnnxRelevanceClassifier(NliRelevanceClassifier):
+    """
+    Бэкенд для CPU: модель один раз экспортируется в ONNX (при необходимости с динамическим квантованием
+    весов в int8) в model_dir и дальше исполняется ONNX Runtime без PyTorch.
+    Экспорт и квантование выполняются, только если в model_dir ещё нет соответствующего файла.
+    onnxruntime и transformers импортируются при создании, torch - только для экспорта;
+    onnxruntime и onnx ставятся дополнительной группой зависимостей onnx.
+    """
+
+    _MODEL_FILE_NAME = "model.onnx"
+    _QUANTIZED_MODEL_FILE_NAME = "model.int8.onnx"
+    _OPSET_VERSION = 17
+
+    def __init__(
+        self,
+        model_name: str,
+        model_path: Path,
+        batch_size: int,
+        model_dir: Path,
+        quantize: bool,
+        intra_op_threads: int = 0,
+        hypothesis_template: str = NliRelevanceClassifier.DEFAULT_HYPOTHESIS_TEMPLATE,
+    ):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ServiceError(
+                "Для бэкенда onnx требуется пакет onnxruntime: установите группу зависимостей onnx "
+                "(poetry install --extras onnx)"
+            ) from e
+        from transformers import AutoConfig, AutoTokenizer
+
+        super().__init__(model_name, self.get_backend_name(quantize), batch_size, hypothesis_template)
+        onnx_model_path = model_dir / self._MODEL_FILE_NAME
+        if not onnx_model_path.is_file():
+            self._export(model_path, model_dir)
+
+        if quantize:
+            quantized_model_path = model_dir / self._QUANTIZED_MODEL_FILE_NAME
+            if not quantized_model_path.is_file():
+                self._quantize(onnx_model_path, quantized_model_path)
+            onnx_model_path = quantized_model_path
+        self._artifact_path = onnx_model_path
+
+        self._tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self._set_label_ids(AutoConfig.from_pretrained(model_dir).label2id)
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads > 0:
+            session_options.intra_op_num_threads = intra_op_threads
+        self._session = onnxruntime.InferenceSession(
+            str(onnx_model_path), session_options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {model_input.name for model_input in self._session.get_inputs()}
+
+    @property
+    def artifact_path(self) -> Path:
+        """
+        :return: Файл модели ONNX, который исполняет сессия.
+        """
+        return self._artifact_path
+
+    @staticmethod
+    def get_backend_name(quantize: bool) -> str:
+        return "onnx-int8" if quantize else "onnx"
+
+    def _get_logits(self, batch: Dict[str, npt.NDArray[np.int64]]) -> npt.NDArray[np.float32]:
+        inputs = {name: values.astype(np.int64) for name, values in batch.items() if name in self._input_names}
+        logits: npt.NDArray[np.float32] = self._session.run(["logits"], inputs)[0]
+        return logits
+
+    def _export(self, model_path: Path, model_dir: Path) -> None:
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        logger.info(f"Экспорт модели {self._model_name} в ONNX: {model_dir}")
+        model_dir.mkdir(parents=True, exist_ok=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_path)
+        model = AutoModelForSequenceClassification.from_pretrained(model_path, use_safetensors=True).eval()
+
+        sample = tokenizer(["пример"], [self._hypothesis_template.format("пример")], return_tensors="pt")
+        input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["logits"] = {0: "batch"}
+
+        temp_path = model_dir / f"{self._MODEL_FILE_NAME}.tmp"
+        # Трассировка экспорта не работает с inference-тензорами, поэтому только отключается подсчёт градиентов
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                tuple(sample[name] for name in input_names),
+                str(temp_path),
+                input_names=input_names,
+                output_names=["logits"],
+                dynamic_axes=dynamic_axes,
+                opset_version=self._OPSET_VERSION,
+            )
+        tokenizer.save_pretrained(model_dir)
+        model.config.save_pretrained(model_dir)
+        os.replace(temp_path, model_dir / self._MODEL_FILE_NAME)
+
+    def _quantize(self, model_path: Path, quantized_model_path: Path) -> None:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        logger.info(f"Динамическое квантование модели в int8: {quantized_model_path}")
+        temp_path = quantized_model_path.with_name(f"{quantized_model_path.name}.tmp")
+        quantize_dynamic(str(model_path), str(temp_path), weight_type=QuantType.QInt8)
+        os.replace(temp_path, quantized_model_path)
@@ -0,0 +1,89 @@
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Hashable
+
+from src import logger
+from src.pipeline.data_preprocessing_components.interfaces import IRelevanceClassifier
+
+
+@dataclass(frozen=True)
+class ClassifierLoad:
+    classifier: IRelevanceClassifier
+    reused: bool
+    load_seconds: float
+    first_inference_seconds: float
+
+    @property
+    def time_to_first_inference_seconds(self) -> float:
+        return self.load_seconds + self.first_inference_seconds
+
+
+class RelevanceClassifierRegistry:
+    """
+    Загруженные классификаторы живут всё время процесса: следующие запуски компонента с теми же параметрами
+    получают уже загруженную модель. При первой загрузке модель прогоняется на одной паре,
+    чтобы время до первого вывода включало ленивую инициализацию бэкенда.
+    """
+
+    _WARM_UP_PAIR = ("warm up", "warm up")
+    _SNAPSHOT_CONFIG_PATTERNS = ["*.json", "*.model", "*.txt"]
+
+    _lock = threading.Lock()
+    _classifiers: Dict[Hashable, IRelevanceClassifier] = {}
+
+    @classmethod
+    def get_or_load(cls, key: Hashable, factory: Callable[[], IRelevanceClassifier]) -> ClassifierLoad:
+        with cls._lock:
+            if key in cls._classifiers:
+                return ClassifierLoad(cls._classifiers[key], reused=True, load_seconds=0.0, first_inference_seconds=0.0)
+
+            started = time.perf_counter()
+            classifier = factory()
+            loaded = time.perf_counter()
+            classifier.score([cls._WARM_UP_PAIR[0]], [cls._WARM_UP_PAIR[1]])
+            cls._classifiers[key] = classifier
+
+            return ClassifierLoad(
+                classifier,
+                reused=False,
+                load_seconds=loaded - started,
+                first_inference_seconds=time.perf_counter() - loaded,
+            )
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._classifiers.clear()
+
+    @classmethod
+    def get_local_snapshot(cls, model_name: str, snapshots_dir: Path) -> Path:
+        """
+        Скачивает снимок модели один раз. Веса хранятся в safetensors: from_pretrained отображает их в память
+        вместо десериализации pickle. Если в репозитории модели есть только pytorch_model.bin,
+        веса один раз пересохраняются в safetensors.
+        :return: Директория снимка.
+        """
+        snapshot_dir = snapshots_dir / model_name.replace("/", "--")
+        if any(snapshot_dir.glob("*.safetensors")):
+            return snapshot_dir
+
+        from huggingface_hub import snapshot_download
+
+        logger.info(f"Загрузка снимка модели {model_name} в {snapshot_dir}")
+        snapshot_download(
+            model_name, local_dir=snapshot_dir, allow_patterns=cls._SNAPSHOT_CONFIG_PATTERNS + ["*.safetensors"]
+        )
+        if any(snapshot_dir.glob("*.safetensors")):
+            return snapshot_dir
+
+        from transformers import AutoModelForSequenceClassification
+
+        logger.info(f"Веса модели {model_name} пересохраняются в safetensors")
+        snapshot_download(model_name, local_dir=snapshot_dir, allow_patterns=["pytorch_model.bin"])
+        model = AutoModelForSequenceClassification.from_pretrained(snapshot_dir)
+        model.save_pretrained(snapshot_dir, safe_serialization=True)
+        (snapshot_dir / "pytorch_model.bin").unlink(missing_ok=True)
+
+        return snapshot_dir
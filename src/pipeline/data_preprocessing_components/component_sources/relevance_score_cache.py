@@ -0,0 +1,112 @@
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from src import logger
+
+ScoreKey = Tuple[str, str]
+
+
+class RelevanceScoreCache:
+    """
+    Персистентный кэш оценок релевантности по ключу (нормализованная должность, метка) для одной модели.
+    Перед SQLite стоит LRU на lru_size ключей в памяти процесса.
+    Кэшируются оценки, а не решения, поэтому смена порога их не затрагивает;
+    при смене model_id (модель, шаблон гипотезы, бэкенд) файл очищается целиком.
+    """
+
+    _SQL_VARIABLES_LIMIT = 500
+
+    def __init__(self, cache_path: Path, model_id: str, lru_size: int):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._model_id = model_id
+        self._lru_size = lru_size
+        self._lru: OrderedDict[ScoreKey, float] = OrderedDict()
+        self._statistics = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        self._connection = sqlite3.connect(cache_path)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS scores ("
+            "model TEXT NOT NULL, title TEXT NOT NULL, label TEXT NOT NULL, score REAL NOT NULL, "
+            "PRIMARY KEY (model, title, label)) WITHOUT ROWID"
+        )
+        self._invalidate_if_model_changed()
+
+    @property
+    def statistics(self) -> Dict[str, float]:
+        lookups = sum(self._statistics.values())
+        hits = self._statistics["memory_hits"] + self._statistics["disk_hits"]
+        return {**self._statistics, "hit_rate": round(hits / lookups, 4) if lookups else 0.0}
+
+    @staticmethod
+    def normalize_title(title: str) -> str:
+        return " ".join(title.lower().split())
+
+    def get_many(self, keys: Iterable[ScoreKey]) -> Dict[ScoreKey, float]:
+        """
+        :return: Оценки найденных ключей; отсутствующих в результате нет.
+        """
+        found: Dict[ScoreKey, float] = {}
+        disk_keys: List[ScoreKey] = []
+        for key in keys:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                found[key] = self._lru[key]
+            else:
+                disk_keys.append(key)
+        self._statistics["memory_hits"] += len(found)
+
+        disk_found = self._select(disk_keys)
+        self._statistics["disk_hits"] += len(disk_found)
+        self._statistics["misses"] += len(disk_keys) - len(disk_found)
+        for key, score in disk_found.items():
+            self._remember(key, score)
+
+        return {**found, **disk_found}
+
+    def put_many(self, scores: Dict[ScoreKey, float]) -> None:
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?)",
+            [(self._model_id, title, label, score) for (title, label), score in scores.items()],
+        )
+        self._connection.commit()
+        for key, score in scores.items():
+            self._remember(key, score)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _select(self, keys: List[ScoreKey]) -> Dict[ScoreKey, float]:
+        requested = set(keys)
+        titles = sorted({title for title, _ in keys})
+        found: Dict[ScoreKey, float] = {}
+        for start in range(0, len(titles), self._SQL_VARIABLES_LIMIT):
+            chunk = titles[start:start + self._SQL_VARIABLES_LIMIT]
+            rows = self._connection.execute(
+                f"SELECT title, label, score FROM scores WHERE model = ? AND title IN ({', '.join('?' * len(chunk))})",
+                (self._model_id, *chunk),
+            )
+            for title, label, score in rows:
+                if (title, label) in requested:
+                    found[(title, label)] = score
+
+        return found
+
+    def _remember(self, key: ScoreKey, score: float) -> None:
+        self._lru[key] = score
+        self._lru.move_to_end(key)
+        if len(self._lru) > self._lru_size:
+            self._lru.popitem(last=False)
+
+    def _invalidate_if_model_changed(self) -> None:
+        row = self._connection.execute("SELECT value FROM metadata WHERE key = 'model_id'").fetchone()
+        if row is not None and row[0] == self._model_id:
+            return
+
+        if row is not None:
+            logger.info(f"Кэш оценок релевантности сброшен: модель {row[0]} сменилась на {self._model_id}")
+        self._connection.execute("DELETE FROM scores")
+        self._connection.execute("INSERT OR REPLACE INTO metadata VALUES ('model_id', ?)", (self._model_id,))
+        self._connection.commit()
@@ -0,0 +1,45 @@
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from src.pipeline.data_preprocessing_components.abstractions import NliRelevanceClassifier
+
+
+class TorchRelevanceClassifier(NliRelevanceClassifier):
+    """
+    Эталонный бэкенд: модель transformers на PyTorch. torch и transformers импортируются при создании,
+    веса читаются из локального снимка safetensors с отображением в память.
+    """
+
+    BACKEND_NAME = "torch"
+
+    def __init__(
+        self,
+        model_name: str,
+        model_path: Path,
+        batch_size: int,
+        device: Optional[str] = None,
+        hypothesis_template: str = NliRelevanceClassifier.DEFAULT_HYPOTHESIS_TEMPLATE,
+    ):
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        super().__init__(model_name, self.BACKEND_NAME, batch_size, hypothesis_template)
+        self._torch = torch
+        self._device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self._tokenizer = AutoTokenizer.from_pretrained(model_path)
+        self._model = (
+            AutoModelForSequenceClassification.from_pretrained(model_path, use_safetensors=True, low_cpu_mem_usage=True)
+            .to(self._device)
+            .eval()
+        )
+        self._set_label_ids(self._model.config.label2id)
+
+    def _get_logits(self, batch: Dict[str, npt.NDArray[np.int64]]) -> npt.NDArray[np.float32]:
+        with self._torch.inference_mode():
+            inputs = {name: self._torch.from_numpy(values).to(self._device) for name, values in batch.items()}
+            logits: npt.NDArray[np.float32] = self._model(**inputs).logits.float().cpu().numpy()
+
+        return logits
@@ -1,12 +1,10 @@
-import re
+import random
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import numpy as np
 import pandas as pd
-import torch
-from pandas._libs.missing import NAType
-from transformers import pipeline
 
 from src import logger
 from src.data_controlling.interfaces import IDataController
@@ -14,12 +12,33 @@ from src.entities.pipeline import PipelineConfiguration
 from src.entities.pipeline.component_properties import PreprocessingStepProperties
 from src.entities.pipeline.component_result import DataExtractingResult, DataPreprocessingResult
 from src.enums import DatasetName
-from src.pipeline.data_preprocessing_components.interfaces import IDataPreprocessingComponent
+from src.pipeline.data_preprocessing_components.component_sources import (
+    BackendGuardStore,
+    ClassifierLoad,
+    EmbeddingRelevanceClassifier,
+    OnnxRelevanceClassifier,
+    RelevanceClassifierRegistry,
+    RelevanceScoreCache,
+    TorchRelevanceClassifier,
+)
+from src.pipeline.data_preprocessing_components.abstractions import NliRelevanceClassifier
+from src.pipeline.data_preprocessing_components.interfaces import IDataPreprocessingComponent, IRelevanceClassifier
 from src.utils.artifact_publication.interfaces import ILogger
 from src.utils.exceptions import ServiceError
+from src.utils.text_normalization import get_representative_salary, normalize_age, normalize_salary
 
 
 class DataPreprocessingComponent(IDataPreprocessingComponent):
+    _SALARY_MIN_COLUMN_NAME = "ЗП от"
+    _SALARY_MAX_COLUMN_NAME = "ЗП до"
+    _SALARY_CURRENCY_COLUMN_NAME = "Валюта ЗП"
+    _CLASSIFIER_MODEL_NAME = "MoritzLaurer/deberta-v3-xsmall-zeroshot-v1.1-all-33"
+    _DATASETS_DIR_NAME = "datasets"
+    _MODEL_SOURCES_DIR_NAME = "model_sources"
+    _GUARD_SAMPLE_SEED = 0
+    _GUARD_FILE_NAME = "backend_guard.json"
+    _AGREEMENT_SAMPLE_SEED = 0
+
     def __init__(
         self,
         config: PipelineConfiguration,
@@ -32,8 +51,6 @@ class DataPreprocessingComponent(IDataPreprocessingComponent):
         self._extracting_result = extracting_result
         self._target_logger = target_logger
 
-        self._jobs_classifier_pipeline: Optional[pipeline] = None
-
     def preprocess_data(self) -> DataPreprocessingResult:
         step_parameters = self._config.components.preprocessing_step_properties
         if step_parameters is None:
@@ -53,14 +70,17 @@ class DataPreprocessingComponent(IDataPreprocessingComponent):
 
         # TODO: Cache ;)
         final_dataset_parameters["apply_preprocessing_only_to_increment"] = True
+        preprocessed_old_data = None
         if final_dataset_parameters["apply_preprocessing_only_to_increment"]:
+            preprocessed_old_data = self._get_preprocessed_old_data()
+        if preprocessed_old_data is not None:
             target_data = self._get_only_increment(target_data)
 
         logger.debug(f"Предобрабатывается текст {target_data.shape[0]} записей")
         preprocessed_data = self._preprocess_data(target_data, step_parameters)
 
-        if final_dataset_parameters["apply_preprocessing_only_to_increment"]:
-            preprocessed_data = self._format_preprocessed_data(preprocessed_data)
+        if preprocessed_old_data is not None:
+            preprocessed_data = pd.concat([preprocessed_old_data, preprocessed_data])
 
         logger.debug(f"Полученный объём предобработанных данных {target_data.shape[0]} записей")
         self._data_controller.save_dataset(preprocessed_data, DatasetName.PREPROCESSED_DATA)
@@ -77,30 +97,36 @@ class DataPreprocessingComponent(IDataPreprocessingComponent):
         if dataset.shape[0] == 0:
             return pd.DataFrame()
 
-        dataset["ЗП"] = dataset["ЗП"].apply(self._extract_salary)
-        dataset["Возраст"] = dataset["Возраст"].apply(self._extract_age)
+        dataset = self._normalize_salary(dataset)
+        dataset["Возраст"] = normalize_age(dataset["Возраст"])
         dataset = self._column_fillna_random(dataset, "Возраст")
 
-        self._init_model()
-        dataset = dataset[
-            dataset.apply(
-                self._clear_unmatching_jobs,
-                axis=1,
-                args=(step_parameters.unmatching_jobs_threshold,),
-            )
-        ]
+        dataset = dataset[self._get_matching_jobs_mask(dataset, step_parameters)]
         dataset.drop(columns=["Желаемая должность"], inplace=True)
 
         return dataset
 
     def _get_only_increment(self, target_data: pd.DataFrame) -> pd.DataFrame:
         extracting_column = self._data_controller.dataset_extracting_date_column_name
-        df: pd.DataFrame = target_data[target_data[extracting_column] == str(datetime.now().date)]
+        df: pd.DataFrame = target_data[target_data[extracting_column].astype(str) == str(datetime.now().date())]
         return df
 
-    def _format_preprocessed_data(self, preprocessed_data: pd.DataFrame) -> pd.DataFrame:
+    def _get_preprocessed_old_data(self) -> Optional[pd.DataFrame]:
+        """
+        :return: Ранее предобработанные данные, None - их нужно пересобрать из исходных целиком:
+            они сохранены до разбора вилки ЗП, где "ЗП" - склейка всех цифр строки, а границ и валюты нет.
+        """
         preprocessed_old_data = self._data_controller.get_dataset(DatasetName.PREPROCESSED_DATA)
-        return pd.concat([preprocessed_old_data, preprocessed_data])
+        salary_columns = [
+            self._SALARY_MIN_COLUMN_NAME,
+            self._SALARY_MAX_COLUMN_NAME,
+            self._SALARY_CURRENCY_COLUMN_NAME,
+        ]
+        if not set(salary_columns).issubset(preprocessed_old_data.columns):
+            logger.warning("Предобработанные данные в старой схеме ЗП, они пересобираются из исходных целиком")
+            return None
+
+        return preprocessed_old_data
 
     def _format_extracted_data(
         self,
@@ -114,37 +140,314 @@ class DataPreprocessingComponent(IDataPreprocessingComponent):
 
         return extracted_data
 
-    def _init_model(self) -> None:
-        self._jobs_classifier_pipeline = pipeline(
-            "zero-shot-classification",
-            model="MoritzLaurer/deberta-v3-xsmall-zeroshot-v1.1-all-33",
-            device="cuda" if torch.cuda.is_available() else "cpu",
+    def _get_matching_jobs_mask(
+        self,
+        dataset: pd.DataFrame,
+        step_parameters: PreprocessingStepProperties,
+    ) -> pd.Series:
+        """
+        Каждая различная пара (нормализованная должность, искомая позиция) оценивается один раз,
+        в модель уходят только пары, которых нет в кэше оценок; если таких нет, модель не загружается.
+        Нормализованная должность - только ключ кэша и дедупликации: модель оценивает первое встреченное
+        исходное написание должности с этим ключом.
+        С предфильтром эмбеддингов NLI-модель оценивает только пары из полосы неопределённости
+        и контрольную выборку решённых предфильтром пар.
+        """
+        representative_titles: Dict[str, str] = {}
+        normalized_titles: List[str] = []
+        for title in dataset["Желаемая должность"]:
+            normalized_title = RelevanceScoreCache.normalize_title(str(title))
+            representative_titles.setdefault(normalized_title, str(title))
+            normalized_titles.append(normalized_title)
+
+        keys = list(zip(normalized_titles, [str(position) for position in dataset["Искомая позиция"]]))
+        unique_keys = list(dict.fromkeys(keys))
+
+        backend_name = self._get_backend_name(step_parameters)
+        model_id = NliRelevanceClassifier.get_model_id(self._CLASSIFIER_MODEL_NAME, backend_name)
+        score_cache = self._open_score_cache(step_parameters, model_id)
+        try:
+            scores = score_cache.get_many(unique_keys) if score_cache is not None else {}
+            missing_keys = [key for key in unique_keys if key not in scores]
+            logger.debug(f"Пар для классификации: {len(unique_keys)}, из них без оценки в кэше: {len(missing_keys)}")
+
+            decisions: Dict[Tuple[str, str], bool] = {}
+            agreement_keys: List[Tuple[str, str]] = []
+            prefiltered_keys_count = stage_two_keys_count = 0
+            if missing_keys and step_parameters.embedding_prefilter.enabled:
+                decisions = self._prefilter_by_embeddings(missing_keys, representative_titles, step_parameters)
+                agreement_keys = random.Random(self._AGREEMENT_SAMPLE_SEED).sample(
+                    sorted(decisions), min(step_parameters.embedding_prefilter.agreement_sample_size, len(decisions))
+                )
+                stage_two_keys = [key for key in missing_keys if key not in decisions]
+                prefiltered_keys_count, stage_two_keys_count = len(missing_keys), len(stage_two_keys)
+                missing_keys = stage_two_keys + agreement_keys
+
+            if missing_keys:
+                classifier = self._get_classifier(step_parameters, missing_keys, representative_titles)
+                computed_scores = classifier.score(
+                    [representative_titles[title] for title, _ in missing_keys],
+                    [position for _, position in missing_keys],
+                )
+                scores.update(zip(missing_keys, computed_scores.tolist()))
+                if score_cache is not None and classifier.model_id == model_id:
+                    score_cache.put_many({key: scores[key] for key in missing_keys})
+
+            if decisions:
+                self._publish_prefilter_report(
+                    decisions, prefiltered_keys_count, stage_two_keys_count, agreement_keys, scores, step_parameters
+                )
+
+            if score_cache is not None:
+                logger.info(f"Кэш оценок релевантности: {score_cache.statistics}")
+                self._target_logger.publish_dictionary_values("Кэш оценок релевантности", score_cache.statistics)
+        finally:
+            if score_cache is not None:
+                score_cache.close()
+
+        threshold = step_parameters.unmatching_jobs_threshold
+        return pd.Series(
+            [scores[key] >= threshold if key in scores else decisions[key] for key in keys], index=dataset.index
         )
 
-    def _clear_unmatching_jobs(self, row: pd.Series, threshold: float) -> bool:  # type: ignore
-        if self._jobs_classifier_pipeline is None:
-            raise ServiceError("Classifier is not initialized!")
+    def _prefilter_by_embeddings(
+        self,
+        keys: List[Tuple[str, str]],
+        representative_titles: Dict[str, str],
+        step_parameters: PreprocessingStepProperties,
+    ) -> Dict[Tuple[str, str], bool]:
+        """
+        Близость всех различных должностей ко всем позициям считается одним умножением матриц эмбеддингов.
+        :return: Решения для пар вне полосы (lower_similarity, upper_similarity); пары внутри полосы не решены.
+        """
+        prefilter_parameters = step_parameters.embedding_prefilter
+        if prefilter_parameters.lower_similarity > prefilter_parameters.upper_similarity:
+            raise ServiceError("Нижняя граница полосы неопределённости предфильтра больше верхней")
+
+        encoder = self._load_embedding_classifier(step_parameters)
+        titles = list(dict.fromkeys(title for title, _ in keys))
+        positions = list(dict.fromkeys(position for _, position in keys))
+        similarities = encoder.score_matrix([representative_titles[title] for title in titles], positions)
+        title_indices = {title: index for index, title in enumerate(titles)}
+        position_indices = {position: index for index, position in enumerate(positions)}
+
+        decisions: Dict[Tuple[str, str], bool] = {}
+        for title, position in keys:
+            similarity = similarities[title_indices[title], position_indices[position]]
+            if similarity >= prefilter_parameters.upper_similarity:
+                decisions[(title, position)] = True
+            elif similarity <= prefilter_parameters.lower_similarity:
+                decisions[(title, position)] = False
+
+        return decisions
+
+    def _publish_prefilter_report(
+        self,
+        decisions: Dict[Tuple[str, str], bool],
+        prefiltered_keys_count: int,
+        stage_two_keys_count: int,
+        agreement_keys: List[Tuple[str, str]],
+        scores: Dict[Tuple[str, str], float],
+        step_parameters: PreprocessingStepProperties,
+    ) -> None:
+        """
+        Согласие с NLI оценивается на контрольной выборке решённых предфильтром пар, которые дополнительно
+        прошли через NLI-модель: доля совпавших решений - оценка того, насколько результат отличается от запуска без
+        предфильтра.
+        """
+        threshold = step_parameters.unmatching_jobs_threshold
+        agreements = [decisions[key] == (scores[key] >= threshold) for key in agreement_keys]
+        report = {
+            "pairs": prefiltered_keys_count,
+            "decided_relevant": sum(decisions.values()),
+            "decided_irrelevant": len(decisions) - sum(decisions.values()),
+            "stage_two_share": round(stage_two_keys_count / prefiltered_keys_count, 4),
+            "agreement_sample_size": len(agreements),
+            "nli_agreement": round(sum(agreements) / len(agreements), 4) if agreements else 0.0,
+        }
+        logger.info(f"Предфильтр эмбеддингов: {report}")
+        self._target_logger.publish_dictionary_values("Предфильтр эмбеддингов", report)
+
+    def _get_classifier(
+        self,
+        step_parameters: PreprocessingStepProperties,
+        keys: List[Tuple[str, str]],
+        representative_titles: Dict[str, str],
+    ) -> IRelevanceClassifier:
+        classifier = self._load_classifier(step_parameters, self._get_backend_name(step_parameters))
+        if not isinstance(classifier, OnnxRelevanceClassifier):
+            return classifier
+
+        return self._guard_classifier_accuracy(classifier, keys, representative_titles, step_parameters)
+
+    def _get_backend_name(self, step_parameters: PreprocessingStepProperties) -> str:
+        backend_parameters = step_parameters.classifier_backend
+        if backend_parameters.backend == TorchRelevanceClassifier.BACKEND_NAME:
+            return TorchRelevanceClassifier.BACKEND_NAME
+
+        if backend_parameters.backend == "onnx":
+            return OnnxRelevanceClassifier.get_backend_name(backend_parameters.quantize_int8)
+
+        raise ServiceError(f"Неизвестный бэкенд классификатора {backend_parameters.backend}")
+
+    def _load_classifier(self, step_parameters: PreprocessingStepProperties, backend_name: str) -> IRelevanceClassifier:
+        """
+        Классификатор берётся из реестра процесса; загружается он, только если запуск с такими параметрами первый.
+        """
+        backend_parameters = step_parameters.classifier_backend
+        batch_size = step_parameters.classification_batch_size
+        model_sources_dir = self._get_model_sources_dir()
+
+        def create_classifier() -> IRelevanceClassifier:
+            model_path = RelevanceClassifierRegistry.get_local_snapshot(
+                self._CLASSIFIER_MODEL_NAME, model_sources_dir / backend_parameters.snapshot_directory
+            )
+            if backend_name == TorchRelevanceClassifier.BACKEND_NAME:
+                return TorchRelevanceClassifier(self._CLASSIFIER_MODEL_NAME, model_path, batch_size)
+
+            return OnnxRelevanceClassifier(
+                self._CLASSIFIER_MODEL_NAME,
+                model_path,
+                batch_size,
+                model_dir=model_sources_dir / backend_parameters.onnx_directory,
+                quantize=backend_parameters.quantize_int8,
+                intra_op_threads=backend_parameters.intra_op_threads,
+            )
 
-        result = self._jobs_classifier_pipeline(
-            row["Желаемая должность"],
-            candidate_labels=[row["Искомая позиция"]],
-            multi_label=False,
-        )
-        score = result["scores"][0]
-        comparison_result: bool = score >= threshold
-        return comparison_result
+        key: Tuple[Any, ...] = (self._CLASSIFIER_MODEL_NAME, backend_name, batch_size, str(model_sources_dir))
+        if backend_name != TorchRelevanceClassifier.BACKEND_NAME:
+            key += (backend_parameters.onnx_directory, backend_parameters.intra_op_threads)
 
-    def _extract_age(self, age: str) -> Union[int, NAType]:
-        try:
-            return int(re.findall(r"\d{2} г", age)[0].split()[0])
-        except Exception:
-            return pd.NA
+        classifier_load = RelevanceClassifierRegistry.get_or_load(key, create_classifier)
+        self._publish_classifier_load(classifier_load, backend_name)
 
-    def _extract_salary(self, salary: str) -> Union[int, NAType]:
-        try:
-            return int(re.sub(r"[^\d]", "", salary))
-        except Exception:
-            return pd.NA
+        return classifier_load.classifier
+
+    def _load_embedding_classifier(self, step_parameters: PreprocessingStepProperties) -> EmbeddingRelevanceClassifier:
+        prefilter_parameters = step_parameters.embedding_prefilter
+        snapshots_dir = self._get_model_sources_dir() / step_parameters.classifier_backend.snapshot_directory
+
+        def create_classifier() -> IRelevanceClassifier:
+            model_path = RelevanceClassifierRegistry.get_local_snapshot(prefilter_parameters.model_name, snapshots_dir)
+            return EmbeddingRelevanceClassifier(
+                prefilter_parameters.model_name, model_path, prefilter_parameters.batch_size
+            )
+
+        backend_name = EmbeddingRelevanceClassifier.BACKEND_NAME
+        key = (prefilter_parameters.model_name, backend_name, prefilter_parameters.batch_size, str(snapshots_dir))
+        classifier_load = RelevanceClassifierRegistry.get_or_load(key, create_classifier)
+        self._publish_classifier_load(classifier_load, backend_name)
+
+        return cast(EmbeddingRelevanceClassifier, classifier_load.classifier)
+
+    def _publish_classifier_load(self, classifier_load: ClassifierLoad, backend_name: str) -> None:
+        report = {
+            "reused": int(classifier_load.reused),
+            "load_seconds": round(classifier_load.load_seconds, 3),
+            "first_inference_seconds": round(classifier_load.first_inference_seconds, 3),
+            "time_to_first_inference_seconds": round(classifier_load.time_to_first_inference_seconds, 3),
+        }
+        logger.info(f"Классификатор {classifier_load.classifier.model_id}: {report}")
+        self._target_logger.publish_dictionary_values(f"Загрузка классификатора {backend_name}", report)
+
+    def _guard_classifier_accuracy(
+        self,
+        classifier: OnnxRelevanceClassifier,
+        keys: List[Tuple[str, str]],
+        representative_titles: Dict[str, str],
+        step_parameters: PreprocessingStepProperties,
+    ) -> IRelevanceClassifier:
+        """
+        Сравнивает оценки бэкенда с эталонным PyTorch один раз на каждый экспорт или квантование модели:
+        отчёт сохраняется рядом с файлом ONNX, и PyTorch загружается снова, только когда этот файл изменился.
+        Контрольная выборка фиксируется при первой сверке (случайные пары того запуска) и дальше не меняется.
+        Если решения по порогу совпадают реже guard_min_agreement или оценки расходятся больше
+        guard_max_score_difference, запуск продолжается на PyTorch.
+        """
+        backend_parameters = step_parameters.classifier_backend
+        guard_store = BackendGuardStore(classifier.artifact_path.parent / self._GUARD_FILE_NAME)
+        report = guard_store.get_report(classifier.model_id, classifier.artifact_path)
+        if report is None:
+            sample = guard_store.load_sample()
+            if not sample:
+                sample_keys = random.Random(self._GUARD_SAMPLE_SEED).sample(
+                    keys, min(backend_parameters.guard_sample_size, len(keys))
+                )
+                sample = [(representative_titles[title], position) for title, position in sample_keys]
+            if not sample:
+                return classifier
+
+            report = self._compare_with_reference(classifier, sample, step_parameters)
+            guard_store.save(classifier.model_id, classifier.artifact_path, sample, report)
+            logger.info(f"Сверка бэкенда {classifier.model_id} с PyTorch: {report}")
+            self._target_logger.publish_dictionary_values("Сверка бэкенда классификатора", report)
+        else:
+            logger.info(f"Сверка бэкенда {classifier.model_id} с PyTorch взята из сохранённого отчёта: {report}")
+
+        if (
+            report["decision_agreement"] < backend_parameters.guard_min_agreement
+            or report["max_score_difference"] > backend_parameters.guard_max_score_difference
+        ):
+            logger.error(f"Бэкенд {classifier.model_id} расходится с PyTorch, запуск продолжается на PyTorch")
+            return self._load_classifier(step_parameters, TorchRelevanceClassifier.BACKEND_NAME)
+
+        return classifier
+
+    def _compare_with_reference(
+        self,
+        classifier: IRelevanceClassifier,
+        sample: List[Tuple[str, str]],
+        step_parameters: PreprocessingStepProperties,
+    ) -> Dict[str, float]:
+        titles, positions = [title for title, _ in sample], [position for _, position in sample]
+        reference_classifier = self._load_classifier(step_parameters, TorchRelevanceClassifier.BACKEND_NAME)
+        reference_scores = reference_classifier.score(titles, positions)
+        scores = classifier.score(titles, positions)
+
+        threshold = step_parameters.unmatching_jobs_threshold
+        return {
+            "sample_size": len(sample),
+            "max_score_difference": round(float(np.max(np.abs(scores - reference_scores))), 5),
+            "mean_score_difference": round(float(np.mean(np.abs(scores - reference_scores))), 5),
+            "decision_agreement": round(float(np.mean((scores >= threshold) == (reference_scores >= threshold))), 4),
+        }
+
+    def _open_score_cache(
+        self,
+        step_parameters: PreprocessingStepProperties,
+        model_id: str,
+    ) -> Optional[RelevanceScoreCache]:
+        cache_parameters = step_parameters.score_cache
+        if not cache_parameters.enabled:
+            return None
+
+        cache_path = self._get_datasets_dir() / cache_parameters.path
+        return RelevanceScoreCache(cache_path, model_id, cache_parameters.lru_size)
+
+    def _get_datasets_dir(self) -> Path:
+        return self._data_controller.project_root.parent / self._DATASETS_DIR_NAME
+
+    def _get_model_sources_dir(self) -> Path:
+        return self._data_controller.project_root.parent / self._MODEL_SOURCES_DIR_NAME
+
+    def _normalize_salary(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        "ЗП" - середина вилки или единственная указанная граница, сами границы и валюта - в отдельных столбцах.
+        """
+        salary_bounds = normalize_salary(dataset["ЗП"])
+        salary_position = list(dataset.columns).index("ЗП")
+        dataset["ЗП"] = get_representative_salary(salary_bounds)
+        for offset, (column, values) in enumerate(
+            [
+                (self._SALARY_MIN_COLUMN_NAME, salary_bounds["min"]),
+                (self._SALARY_MAX_COLUMN_NAME, salary_bounds["max"]),
+                (self._SALARY_CURRENCY_COLUMN_NAME, salary_bounds["currency"]),
+            ],
+            start=1,
+        ):
+            dataset.insert(salary_position + offset, column, values)
+
+        return dataset
 
     def _column_fillna_random(self, dataframe: pd.DataFrame, column: str) -> pd.DataFrame:
         mean = dataframe[column].mean()
@@ -1,3 +1,4 @@
 from .i_data_preprocessing_component import IDataPreprocessingComponent
+from .i_relevance_classifier import IRelevanceClassifier
 
-__all__ = ["IDataPreprocessingComponent"]
+__all__ = ["IDataPreprocessingComponent", "IRelevanceClassifier"]
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+
+class IRelevanceClassifier(ABC):
+    @property
+    @abstractmethod
+    def model_id(self) -> str:
+        """
+        :return: Идентификатор всего, от чего зависят оценки: модели, шаблона гипотезы и бэкенда.
+        """
+
+    @abstractmethod
+    def score(self, texts: Sequence[str], labels: Sequence[str]) -> npt.NDArray[np.float64]:
+        """
+        :return: Оценка релевантности для каждой пары texts[i], labels[i] в порядке входа.
+        """
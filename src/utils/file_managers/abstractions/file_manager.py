@@ -1,9 +1,11 @@
 import os
 from pathlib import Path
+from typing import List
 
 import pandas as pd
 
 from src.entities.pipeline import DataProperties
+from src.utils.exceptions import ServiceError
 from src.utils.file_managers.interfaces import IFileManager
 from src.utils.file_providers import LocalFileProvider
 
@@ -30,6 +32,12 @@ class FileManager(IFileManager):
     def save_dataset(self, dataset: pd.DataFrame, dataset_properties: DataProperties) -> None:
         raise NotImplementedError()
 
+    def append_dataset(self, dataset: pd.DataFrame, dataset_properties: DataProperties) -> None:
+        raise NotImplementedError()
+
+    def publish_appended_dataset(self, dataset_properties: DataProperties) -> None:
+        raise NotImplementedError()
+
     @staticmethod
     def _save_dataset_on_disk(dataset: pd.DataFrame, dataset_path: Path, dataset_properties: DataProperties) -> None:
         save_parameters = {}
@@ -38,6 +46,31 @@ class FileManager(IFileManager):
 
         dataset.to_csv(dataset_path, index=False, **save_parameters)
 
+    @staticmethod
+    def _append_dataset_on_disk(dataset: pd.DataFrame, dataset_path: Path, dataset_properties: DataProperties) -> None:
+        """
+        Дописывает строки в CSV без чтения существующих данных: с диска читается только заголовок,
+        по которому выравнивается порядок колонок.
+        """
+        save_parameters = {}
+        load_parameters = {}
+        if dataset_properties.custom_properties is not None:
+            save_parameters = dataset_properties.custom_properties.get("save_parameters", {})
+            load_parameters = dataset_properties.custom_properties.get("load_parameters", {})
+
+        if not os.path.isfile(dataset_path) or os.path.getsize(dataset_path) == 0:
+            dataset.to_csv(dataset_path, index=False, **save_parameters)
+            return
+
+        header = pd.read_csv(dataset_path, **(load_parameters | {"nrows": 0})).columns  # type: ignore
+        if set(header) != set(dataset.columns):
+            raise ServiceError(
+                f"Схема дописываемых строк {list(dataset.columns)} не совпадает со схемой {dataset_path}: "
+                f"{list(header)}"
+            )
+
+        dataset[list(header)].to_csv(dataset_path, mode="a", header=False, index=False, **save_parameters)
+
     @staticmethod
     def _load_dataset_from_disk(dataset_path: Path, dataset_properties: DataProperties) -> pd.DataFrame:
         load_parameters = {}
@@ -47,6 +80,16 @@ class FileManager(IFileManager):
         if not (os.path.isfile(dataset_path) or os.path.isdir(dataset_path)):
             raise FileNotFoundError(f"Датасет не найден по пути {dataset_path}. Рабочий каталог {os.getcwd()}")
 
+        if os.path.isdir(dataset_path):
+            part_paths = sorted(Path(dataset_path).glob("*.csv"))
+            if not part_paths:
+                raise FileNotFoundError(f"В директории {dataset_path} нет частей датасета")
+
+            parts: List[pd.DataFrame] = [
+                pd.read_csv(part_path, **load_parameters) for part_path in part_paths  # type: ignore
+            ]
+            return pd.concat(parts, ignore_index=True)
+
         df: pd.DataFrame = pd.read_csv(dataset_path, **load_parameters)  # type: ignore
         return df
 
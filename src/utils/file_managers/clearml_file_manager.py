@@ -1,6 +1,9 @@
 import os
+import shutil
 import tempfile
+from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
 import pandas as pd
 from clearml import Dataset
@@ -12,12 +15,35 @@ from src.utils.file_managers import FileManager
 
 
 class ClearMLFileManager(FileManager):
+    """
+    Датасеты хранятся версиями в ClearML. Дописываемые части копятся в локальной директории
+    и публикуются одной дочерней версией на запуск в publish_appended_dataset; до публикации
+    они читаются вместе с опубликованной версией и переживают сбой процесса.
+    """
+
     def __init__(self, project_name: str, provide_artifacts_to_project_dir: bool = False):
         super().__init__()
         self._project_name = project_name
         self._provide_artifacts_to_project_dir = provide_artifacts_to_project_dir
 
     def load_dataset(self, dataset_properties: DataProperties) -> pd.DataFrame:
+        staged_parts_dir = self._get_staged_parts_dir(dataset_properties)
+        has_staged_parts = any(staged_parts_dir.glob("*.csv"))
+        try:
+            dataset = self._load_published_dataset(dataset_properties)
+        except FileNotFoundError:
+            if not has_staged_parts:
+                raise
+            return self._load_dataset_from_disk(staged_parts_dir, dataset_properties)
+
+        if not has_staged_parts:
+            return dataset
+
+        logger.debug(f"К датасету {dataset_properties.name} добавляются неопубликованные части из {staged_parts_dir}")
+        staged_dataset = self._load_dataset_from_disk(staged_parts_dir, dataset_properties)
+        return pd.concat([dataset, staged_dataset], ignore_index=True)
+
+    def _load_published_dataset(self, dataset_properties: DataProperties) -> pd.DataFrame:
         dataset_name = dataset_properties.name
         logger.debug(f"Выполняется загрузка датасета {dataset_name} с сервера ClearML")
         try:
@@ -28,7 +54,11 @@ class ClearMLFileManager(FileManager):
             )
             local_dataset_folder = clearml_dataset.get_local_copy()
 
-            clearml_dataset_path = Path(os.path.join(local_dataset_folder, os.listdir(local_dataset_folder)[0]))
+            dataset_files = os.listdir(local_dataset_folder)
+            if len(dataset_files) > 1:
+                return self._load_appended_dataset(Path(local_dataset_folder).resolve(), dataset_properties)
+
+            clearml_dataset_path = Path(os.path.join(local_dataset_folder, dataset_files[0]))
             clearml_dataset_path = clearml_dataset_path.resolve()
 
             if self._provide_artifacts_to_project_dir:
@@ -68,3 +98,79 @@ class ClearMLFileManager(FileManager):
                 clearml_dataset.publish()
             except Exception as e:
                 raise ServiceError(f"Не удалось сохранить датасет {dataset_name} на сервере ClearML:\n{e}")
+
+        # Новая версия заменяет датасет целиком, неопубликованные части прошлых запусков к ней не относятся
+        shutil.rmtree(self._get_staged_parts_dir(dataset_properties), ignore_errors=True)
+
+    def append_dataset(self, dataset: pd.DataFrame, dataset_properties: DataProperties) -> None:
+        """
+        Сохраняет часть в локальную директорию неопубликованных частей, не обращаясь к серверу ClearML.
+        """
+        dataset_name = dataset_properties.name
+        part_file_name = f"{dataset_name}.part-{datetime.now().strftime('%Y%m%d%H%M%S%f')}.csv"
+        staged_parts_dir = self._get_staged_parts_dir(dataset_properties)
+        logger.debug(f"Часть {part_file_name} датасета {dataset_name} сохраняется в {staged_parts_dir}")
+
+        try:
+            staged_parts_dir.mkdir(parents=True, exist_ok=True)
+            self._save_dataset_on_disk(
+                dataset=dataset,
+                dataset_path=staged_parts_dir / part_file_name,
+                dataset_properties=dataset_properties,
+            )
+        except Exception as e:
+            raise ServiceError(f"Не удалось дописать датасет {dataset_name}:\n{e}")
+
+    def publish_appended_dataset(self, dataset_properties: DataProperties) -> None:
+        """
+        Создаёт одну дочернюю версию датасета в ClearML со всеми неопубликованными частями,
+        так что предыдущие версии не скачиваются и не перезаписываются. Если публикация не удалась,
+        части остаются на диске и публикуются следующим запуском.
+        """
+        dataset_name = dataset_properties.name
+        staged_parts_dir = self._get_staged_parts_dir(dataset_properties)
+        part_paths = sorted(staged_parts_dir.glob("*.csv"))
+        if not part_paths:
+            return
+
+        logger.debug(f"Выполняется публикация {len(part_paths)} частей датасета {dataset_name} на сервере ClearML")
+        try:
+            clearml_dataset = Dataset.create(
+                dataset_name=dataset_name,
+                dataset_project=self._project_name,
+                description=dataset_properties.description,
+                dataset_tags=[str(dataset_properties.tag)],
+                parent_datasets=self._get_parent_dataset_ids(dataset_properties),
+            )
+            clearml_dataset.add_files(path=staged_parts_dir)
+            clearml_dataset.upload()
+            clearml_dataset.finalize()
+            clearml_dataset.publish()
+        except Exception as e:
+            raise ServiceError(f"Не удалось дописать датасет {dataset_name} на сервере ClearML:\n{e}")
+
+        for part_path in part_paths:
+            part_path.unlink()
+
+    def _get_parent_dataset_ids(self, dataset_properties: DataProperties) -> Optional[List[str]]:
+        try:
+            parent_dataset = Dataset.get(
+                dataset_project=self._project_name,
+                dataset_name=dataset_properties.name,
+                dataset_tags=[dataset_properties.tag],
+                only_completed=True,
+            )
+        except ValueError:
+            return None
+
+        return [parent_dataset.id]
+
+    def _get_staged_parts_dir(self, dataset_properties: DataProperties) -> Path:
+        return self._get_local_dataset_path(dataset_properties).with_suffix(".staged")
+
+    def _load_appended_dataset(self, dataset_folder: Path, dataset_properties: DataProperties) -> pd.DataFrame:
+        dataset = self._load_dataset_from_disk(dataset_folder, dataset_properties)
+        if self._provide_artifacts_to_project_dir:
+            self._save_dataset_on_disk(dataset, self._get_local_dataset_path(dataset_properties), dataset_properties)
+
+        return dataset
@@ -29,3 +29,11 @@ class IFileManager(ABC):
     @abstractmethod
     def save_dataset(self, dataset: pd.DataFrame, dataset_properties: DataProperties) -> None:
         """ """
+
+    @abstractmethod
+    def append_dataset(self, dataset: pd.DataFrame, dataset_properties: DataProperties) -> None:
+        """ """
+
+    @abstractmethod
+    def publish_appended_dataset(self, dataset_properties: DataProperties) -> None:
+        """ """
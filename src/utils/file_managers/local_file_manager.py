@@ -38,3 +38,24 @@ class LocalFileManager(FileManager):
             )
         except Exception as e:
             raise ServiceError(f"Не удалось сохранить датасет {dataset_name}:\n{e}")
+
+    def append_dataset(self, dataset: pd.DataFrame, dataset_properties: DataProperties) -> None:
+        dataset_name = dataset_properties.name
+        dataset_path = self._get_local_dataset_path(dataset_properties)
+        if not os.path.isdir(dataset_path.parents[0]):
+            raise ServiceError(f"Директория не найдена в {dataset_path}")
+        try:
+            self._append_dataset_on_disk(
+                dataset=dataset,
+                dataset_path=dataset_path,
+                dataset_properties=dataset_properties,
+            )
+        except ServiceError as se:
+            raise se
+        except Exception as e:
+            raise ServiceError(f"Не удалось дописать датасет {dataset_name}:\n{e}")
+
+    def publish_appended_dataset(self, dataset_properties: DataProperties) -> None:
+        """
+        Строки дописываются прямо в файл датасета, публиковать нечего.
+        """
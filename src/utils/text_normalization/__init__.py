@@ -0,0 +1,21 @@
+from .field_normalization import (
+    MONTHS,
+    UNPARSED_DATE,
+    get_representative_salary,
+    normalize_age,
+    normalize_salary,
+    parse_age,
+    parse_date,
+    parse_salary,
+)
+
+__all__ = [
+    "MONTHS",
+    "UNPARSED_DATE",
+    "get_representative_salary",
+    "normalize_age",
+    "normalize_salary",
+    "parse_age",
+    "parse_date",
+    "parse_salary",
+]
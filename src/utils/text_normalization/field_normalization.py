@@ -0,0 +1,160 @@
+import re
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+MONTHS = {
+    "января": 1,
+    "февраля": 2,
+    "марта": 3,
+    "апреля": 4,
+    "мая": 5,
+    "июня": 6,
+    "июля": 7,
+    "августа": 8,
+    "сентября": 9,
+    "октября": 10,
+    "ноября": 11,
+    "декабря": 12,
+}
+CURRENCIES = {
+    "₽": "RUB",
+    "руб": "RUB",
+    "$": "USD",
+    "usd": "USD",
+    "€": "EUR",
+    "eur": "EUR",
+    "₸": "KZT",
+    "тенге": "KZT",
+    "byn": "BYN",
+}
+UNPARSED_DATE = datetime(year=1970, month=1, day=1)
+
+_SALARY_REGEX = re.compile(
+    r"(?:(?P<prefix>от|до)\s*)?(?P<first>\d+)"
+    r"(?:\s*(?:до|-|–|—)\s*(?P<second>\d+))?"
+    r"(?P<thousands>\s*тыс)?"
+)
+_DIGIT_GROUP_SEPARATOR_REGEX = re.compile(r"(?<=\d)\s+(?=\d{3}\b)")
+_CURRENCY_REGEX = re.compile("(" + "|".join(re.escape(currency) for currency in CURRENCIES) + ")")
+_AGE_REGEX = re.compile(r"(\d{1,3})\s*(?:год|года|лет)\b")
+_ABSOLUTE_DATE_REGEX = re.compile(r"(\d{1,2})\s+(" + "|".join(MONTHS) + r")(?:\s+(\d{4}))?")
+_RELATIVE_DAY_REGEX = re.compile(r"(позавчера|вчера|сегодня)")
+_AGO_REGEX = re.compile(r"(\d+)\s*(минут|час)\w*\s+назад")
+_TIME_REGEX = re.compile(r"\b([01]?\d|2[0-3]):([0-5]\d)\b")
+_RELATIVE_DAY_OFFSETS = {"сегодня": 0, "вчера": 1, "позавчера": 2}
+_AGO_UNIT_MINUTES = {"минут": 1, "час": 60}
+
+
+def normalize_salary(salaries: pd.Series) -> pd.DataFrame:
+    """
+    Разбирает тексты зарплат ("от 100 000 до 150 000 ₽", "до 90 000 руб.", "120 тыс. ₽").
+    :return: Столбцы min, max (float, NaN - граница не указана) и currency (код валюты, NA - не указана).
+        Одно число без "от"/"до" считается и нижней, и верхней границей; у текста без чисел все столбцы пустые.
+    """
+    codes, uniques = _factorize(salaries)
+    parsed = [parse_salary(text) for text in uniques] + [(np.nan, np.nan, None)]
+    salary_min, salary_max, currency = zip(*parsed)
+
+    return pd.DataFrame(
+        {
+            "min": np.array(salary_min, dtype="float64")[codes],
+            "max": np.array(salary_max, dtype="float64")[codes],
+            "currency": pd.array(np.array(currency, dtype=object)[codes], dtype="string"),
+        },
+        index=salaries.index,
+    )
+
+
+def get_representative_salary(salary_bounds: pd.DataFrame) -> pd.Series:
+    """
+    :param salary_bounds: Результат normalize_salary.
+    :return: Середина вилки, а если указана одна граница - она.
+    """
+    return salary_bounds[["min", "max"]].mean(axis=1, skipna=True)
+
+
+def normalize_age(ages: pd.Series) -> pd.Series:
+    """
+    Достаёт возраст из текстов вида "35 лет", "21 год", "42 года, родился 1 мая 1983".
+    :return: Столбец Int64, NA - возраст не указан.
+    """
+    codes, uniques = _factorize(ages)
+    parsed = np.array([parse_age(text) for text in uniques] + [np.nan], dtype="float64")
+    return pd.Series(parsed[codes], index=ages.index).astype("Int64")
+
+
+def parse_salary(salary: str) -> Tuple[float, float, Optional[str]]:
+    """
+    :return: Нижняя и верхняя граница (NaN - не указана) и код валюты одного текста зарплаты.
+    """
+    text = _DIGIT_GROUP_SEPARATOR_REGEX.sub("", salary.lower().replace("\xa0", " "))
+    if (match := _SALARY_REGEX.search(text)) is None:
+        return np.nan, np.nan, None
+
+    multiplier = 1000.0 if match["thousands"] else 1.0
+    first = float(match["first"]) * multiplier
+    currency = _CURRENCY_REGEX.search(text)
+    currency_code = CURRENCIES[currency[1]] if currency is not None else None
+    if match["second"] is not None:
+        return first, float(match["second"]) * multiplier, currency_code
+    if match["prefix"] == "от":
+        return first, np.nan, currency_code
+    if match["prefix"] == "до":
+        return np.nan, first, currency_code
+
+    return first, first, currency_code
+
+
+def parse_age(age: str) -> float:
+    """
+    :return: Возраст, NaN - не указан.
+    """
+    match = _AGE_REGEX.search(age.lower())
+    return float(match[1]) if match is not None else np.nan
+
+
+def parse_date(date: str, now: Optional[datetime] = None) -> datetime:
+    """
+    Дата без года относится к последнему году, в котором она не позже now.
+    Нераспознанный текст, как и раньше в парсере SuperJob, означает now, несуществующая дата - UNPARSED_DATE.
+    """
+    now = now or datetime.now()
+    text = date.lower().replace("\xa0", " ")
+
+    if absolute := _ABSOLUTE_DATE_REGEX.search(text):
+        day, month = int(absolute[1]), MONTHS[absolute[2]]
+        try:
+            if absolute[3]:
+                return datetime(year=int(absolute[3]), month=month, day=day)
+
+            parsed = datetime(year=now.year, month=month, day=day)
+            return parsed if parsed <= now else parsed.replace(year=now.year - 1)
+        except ValueError:
+            return UNPARSED_DATE
+
+    if relative_day := _RELATIVE_DAY_REGEX.search(text):
+        parsed = now - timedelta(days=_RELATIVE_DAY_OFFSETS[relative_day[1]])
+        if time := _TIME_REGEX.search(text):
+            return parsed.replace(hour=int(time[1]), minute=int(time[2]), second=0, microsecond=0)
+        return parsed
+
+    if ago := _AGO_REGEX.search(text):
+        return now - timedelta(minutes=int(ago[1]) * _AGO_UNIT_MINUTES[ago[2]])
+
+    return now
+
+
+def _factorize(values: pd.Series) -> Tuple[npt.NDArray[np.intp], List[str]]:
+    """
+    Тексты полей сильно повторяются, поэтому каждое различное значение разбирается один раз,
+    а результат раскладывается по строкам индексированием NumPy.
+    :return: Коды строк и различные значения; пропуск получает код len(uniques) - индекс значения по умолчанию,
+        которое вызывающий дописывает в конец разобранных значений.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    codes = np.where(codes < 0, len(uniques), codes)
+    return codes, [str(unique) for unique in uniques]
@@ -0,0 +1,81 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+
+from src.entities.pipeline import DataProperties
+from src.utils.file_managers import ClearMLFileManager, clearml_file_manager
+
+DATASET_PROPERTIES = DataProperties(name="source_data", description="Исходные данные", tag="raw")
+
+
+class _FakeDataset:
+    """
+    Версия датасета ClearML без сервера: запоминает созданные версии и их файлы.
+    """
+
+    created: List["_FakeDataset"] = []
+
+    def __init__(self, parameters: Dict[str, Any]):
+        self.parameters = parameters
+        self.files: List[str] = []
+        self.is_published = False
+
+    @classmethod
+    def create(cls, **parameters) -> "_FakeDataset":
+        dataset = cls(parameters)
+        cls.created.append(dataset)
+        return dataset
+
+    @classmethod
+    def get(cls, **parameters) -> "_FakeDataset":
+        raise ValueError("Датасет не найден")
+
+    def add_files(self, path: Path) -> None:
+        self.files = sorted(file_path.name for file_path in Path(path).iterdir())
+
+    def upload(self) -> None:
+        pass
+
+    def finalize(self) -> None:
+        pass
+
+    def publish(self) -> None:
+        self.is_published = True
+
+
+@pytest.fixture
+def file_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(_FakeDataset, "created", [])
+    monkeypatch.setattr(clearml_file_manager, "Dataset", _FakeDataset)
+    file_manager = ClearMLFileManager("project")
+    monkeypatch.setattr(file_manager, "_DATASET_SOURCES_DIR", tmp_path)
+    file_manager.provide_artifacts_to_project_dir = False
+    return file_manager
+
+
+def test_appended_parts_are_published_as_one_version(file_manager):
+    file_manager.append_dataset(pd.DataFrame({"a": [1, 2]}), DATASET_PROPERTIES)
+    file_manager.append_dataset(pd.DataFrame({"a": [3]}), DATASET_PROPERTIES)
+
+    assert _FakeDataset.created == []
+    assert file_manager.load_dataset(DATASET_PROPERTIES)["a"].tolist() == [1, 2, 3]
+
+    file_manager.publish_appended_dataset(DATASET_PROPERTIES)
+    file_manager.publish_appended_dataset(DATASET_PROPERTIES)
+
+    assert len(_FakeDataset.created) == 1
+    assert _FakeDataset.created[0].is_published
+    assert len(_FakeDataset.created[0].files) == 2
+    with pytest.raises(FileNotFoundError):
+        file_manager.load_dataset(DATASET_PROPERTIES)
+
+
+def test_saved_version_discards_unpublished_parts(file_manager):
+    file_manager.append_dataset(pd.DataFrame({"a": [1]}), DATASET_PROPERTIES)
+
+    file_manager.save_dataset(pd.DataFrame({"a": [2]}), DATASET_PROPERTIES)
+    file_manager.publish_appended_dataset(DATASET_PROPERTIES)
+
+    assert [dataset.files for dataset in _FakeDataset.created] == [["source_data.csv"]]
@@ -0,0 +1,131 @@
+from pathlib import Path
+from typing import List, Optional, Set
+
+import pandas as pd
+import pytest
+
+from src.benchmarks.in_memory_data_controller import InMemoryDataController
+from src.benchmarks.superjob_stub_server import SuperjobStubServer
+from src.configuration.config_loaders import PipelineConfigLoader
+from src.entities.pipeline import PipelineConfiguration
+from src.enums import DatasetName
+from src.pipeline.data_extracting_components import DataExtractingComponent
+from src.utils.artifact_publication import LocalLogger
+
+RESUMES_COUNT = 10
+
+
+class _CrashingDataController(InMemoryDataController):
+    """
+    Падает на дописывании части с номером crash_on_append, как процесс, убитый во время записи.
+    """
+
+    def __init__(self, config: PipelineConfiguration, project_root: Path, crash_on_append: int):
+        super().__init__(config, project_root)
+        self._crash_on_append = crash_on_append
+        self._appends_count = 0
+
+    def append_dataset(self, dataset: pd.DataFrame, dataset_name: DatasetName) -> None:
+        self._appends_count += 1
+        if self._appends_count == self._crash_on_append:
+            raise KeyboardInterrupt("Сбой во время записи части")
+
+        super().append_dataset(dataset, dataset_name)
+
+
+class _RequestCountingDataController(InMemoryDataController):
+    """
+    Запоминает, сколько запросов заглушка обработала к моменту записи каждой части.
+    """
+
+    def __init__(self, config: PipelineConfiguration, project_root: Path, server: SuperjobStubServer):
+        super().__init__(config, project_root)
+        self._server = server
+        self.requests_at_writes: List[int] = []
+
+    def save_dataset(self, dataset: pd.DataFrame, dataset_name: DatasetName) -> None:
+        self.requests_at_writes.append(self._server.requests_count)
+        super().save_dataset(dataset, dataset_name)
+
+    def append_dataset(self, dataset: pd.DataFrame, dataset_name: DatasetName) -> None:
+        self.requests_at_writes.append(self._server.requests_count)
+        super().append_dataset(dataset, dataset_name)
+
+
+class _FlakySuperjobServer(SuperjobStubServer):
+    """
+    Не отдаёт страницы резюме из unavailable_resume_ids, пока их не уберут из множества.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.unavailable_resume_ids: Set[int] = set()
+
+    def _render_resume_page(self, resume_id: int) -> Optional[str]:
+        if resume_id in self.unavailable_resume_ids:
+            return None
+
+        return super()._render_resume_page(resume_id)
+
+
+@pytest.fixture
+def superjob_server():
+    with _FlakySuperjobServer(resumes_per_page=RESUMES_COUNT, pages_count=1) as server:
+        yield server
+
+
+def _build_config(server: SuperjobStubServer) -> PipelineConfiguration:
+    config = PipelineConfigLoader().get_config()
+    step_parameters = config.components.extraction_step_properties
+    assert step_parameters is not None
+
+    step_parameters.positions_to_extract = ["Data Engineer"]
+    step_parameters.search_url = server.search_base_url
+    step_parameters.resume_base_url = server.resume_base_url
+    step_parameters.default_pages_count = 1
+    step_parameters.parse_workers = 1
+    step_parameters.write_chunk_rows = 3
+    step_parameters.http_cache.enabled = False
+    step_parameters.rate_limit.enabled = False
+    step_parameters.telemetry.enabled = False
+    step_parameters.checkpoint.enabled = True
+    step_parameters.seen_index.enabled = True
+    step_parameters.seen_index.expected_resumes = 1000
+    return config
+
+
+def test_replay_after_crash_writes_every_row_once(superjob_server, tmp_path):
+    """
+    Резюме, недоступное до сбоя, при повторе загружается и сдвигает остальные строки в другие части.
+    """
+    config = _build_config(superjob_server)
+    superjob_server.unavailable_resume_ids = {1}
+    crashed_controller = _CrashingDataController(config, tmp_path / "src", crash_on_append=2)
+    with pytest.raises(KeyboardInterrupt):
+        DataExtractingComponent(config, crashed_controller, LocalLogger()).get_data()
+
+    rows_before_replay = crashed_controller.datasets[DatasetName.SOURCE_DATA.value].shape[0]
+    assert 0 < rows_before_replay < RESUMES_COUNT
+
+    superjob_server.unavailable_resume_ids = set()
+    replay_controller = InMemoryDataController(config, tmp_path / "src")
+    replay_controller.datasets = crashed_controller.datasets
+    DataExtractingComponent(config, replay_controller, LocalLogger()).get_data()
+
+    source_data = replay_controller.datasets[DatasetName.SOURCE_DATA.value]
+    key_columns = ["Ссылка на резюме", "Искомая позиция", replay_controller.dataset_extracting_date_column_name]
+    assert source_data.shape[0] == RESUMES_COUNT
+    assert not source_data.duplicated(subset=key_columns).any()
+    assert not (tmp_path / "datasets" / config.components.extraction_step_properties.checkpoint.journal_path).exists()
+
+
+def test_rows_are_written_while_resumes_are_fetched(superjob_server, tmp_path):
+    config = _build_config(superjob_server)
+    config.components.extraction_step_properties.checkpoint.resume_batch_size = 3
+    data_controller = _RequestCountingDataController(config, tmp_path / "src", superjob_server)
+
+    DataExtractingComponent(config, data_controller, LocalLogger()).get_data()
+
+    assert data_controller.datasets[DatasetName.SOURCE_DATA.value].shape[0] == RESUMES_COUNT
+    assert len(data_controller.requests_at_writes) > 1
+    assert data_controller.requests_at_writes[0] < superjob_server.requests_count
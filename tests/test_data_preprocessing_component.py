@@ -0,0 +1,186 @@
+from datetime import datetime
+from typing import List, Sequence
+from unittest.mock import MagicMock
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import pytest
+
+from src.benchmarks.in_memory_data_controller import InMemoryDataController
+from src.configuration.config_loaders import PipelineConfigLoader
+from src.entities.pipeline.component_properties import PreprocessingStepProperties
+from src.entities.pipeline.component_result import DataExtractingResult
+from src.enums import DatasetName
+from src.pipeline.data_preprocessing_components import DataPreprocessingComponent
+from src.pipeline.data_preprocessing_components.abstractions import NliRelevanceClassifier
+from src.pipeline.data_preprocessing_components.component_sources import TorchRelevanceClassifier
+from src.pipeline.data_preprocessing_components.interfaces import IRelevanceClassifier
+
+
+class _StubClassifier(IRelevanceClassifier):
+    """
+    Оценивает пару единицей, если должность содержит метку без учёта регистра, и запоминает входы.
+    """
+
+    def __init__(self):
+        self.scored_texts: List[str] = []
+
+    @property
+    def model_id(self) -> str:
+        return NliRelevanceClassifier.get_model_id(
+            DataPreprocessingComponent._CLASSIFIER_MODEL_NAME, TorchRelevanceClassifier.BACKEND_NAME
+        )
+
+    def score(self, texts: Sequence[str], labels: Sequence[str]) -> npt.NDArray[np.float64]:
+        self.scored_texts.extend(texts)
+        return np.array([float(label.lower() in text.lower()) for text, label in zip(texts, labels)])
+
+
+@pytest.fixture
+def classifier(monkeypatch):
+    classifier = _StubClassifier()
+    monkeypatch.setattr(DataPreprocessingComponent, "_get_classifier", lambda *args: classifier)
+    return classifier
+
+
+@pytest.fixture
+def component(tmp_path):
+    config = PipelineConfigLoader().get_config()
+    data_controller = InMemoryDataController(config, tmp_path / "src")
+    return DataPreprocessingComponent(config, data_controller, MagicMock(), MagicMock())
+
+
+@pytest.fixture
+def pipeline_component(tmp_path):
+    config = PipelineConfigLoader().get_config()
+    data_controller = InMemoryDataController(config, tmp_path / "src")
+    extracting_result = DataExtractingResult({"source_data": DatasetName.SOURCE_DATA})
+    return DataPreprocessingComponent(config, data_controller, extracting_result, MagicMock())
+
+
+def _build_dataset(titles: List[str], positions: List[str]) -> pd.DataFrame:
+    return pd.DataFrame({"Желаемая должность": titles, "Искомая позиция": positions})
+
+
+def test_matching_jobs_mask_scores_each_key_once_with_original_title(component, classifier):
+    dataset = _build_dataset(
+        ["Senior  Data Engineer", "senior data engineer", "Повар", "Data Analyst"],
+        ["Data Engineer", "Data Engineer", "Data Engineer", "Data Analyst"],
+    )
+    step_parameters = PreprocessingStepProperties(unmatching_jobs_threshold=0.5)
+    step_parameters.score_cache.enabled = False
+
+    mask = component._get_matching_jobs_mask(dataset, step_parameters)
+
+    assert mask.tolist() == [True, True, False, True]
+    assert classifier.scored_texts == ["Senior  Data Engineer", "Повар", "Data Analyst"]
+
+
+def test_matching_jobs_mask_reuses_cached_scores(component, classifier):
+    dataset = _build_dataset(["Data Engineer", "Повар"], ["Data Engineer", "Data Engineer"])
+    step_parameters = PreprocessingStepProperties(unmatching_jobs_threshold=0.5)
+
+    first_mask = component._get_matching_jobs_mask(dataset, step_parameters)
+    classifier.scored_texts.clear()
+    second_mask = component._get_matching_jobs_mask(dataset, step_parameters)
+
+    assert first_mask.tolist() == second_mask.tolist() == [True, False]
+    assert classifier.scored_texts == []
+
+
+class _StubOnnxClassifier(_StubClassifier):
+    """
+    Бэкенд с файлом модели: сверка с PyTorch привязана к этому файлу.
+    """
+
+    def __init__(self, artifact_path):
+        super().__init__()
+        self.artifact_path = artifact_path
+
+    @property
+    def model_id(self) -> str:
+        return NliRelevanceClassifier.get_model_id(DataPreprocessingComponent._CLASSIFIER_MODEL_NAME, "onnx")
+
+
+def test_backend_guard_runs_once_per_exported_model(component, tmp_path, monkeypatch):
+    artifact_path = tmp_path / "onnx" / "model.onnx"
+    artifact_path.parent.mkdir()
+    artifact_path.write_bytes(b"first export")
+    backend = _StubOnnxClassifier(artifact_path)
+    reference = _StubClassifier()
+    loaded_backends: List[str] = []
+
+    def load_classifier(step_parameters, backend_name):
+        loaded_backends.append(backend_name)
+        return reference
+
+    monkeypatch.setattr(component, "_load_classifier", load_classifier)
+    step_parameters = PreprocessingStepProperties(unmatching_jobs_threshold=0.5)
+    keys = [("data engineer", "Data Engineer"), ("повар", "Data Engineer")]
+    titles = {"data engineer": "Data Engineer", "повар": "Повар"}
+
+    assert component._guard_classifier_accuracy(backend, keys, titles, step_parameters) is backend
+    assert component._guard_classifier_accuracy(backend, [], {}, step_parameters) is backend
+    assert loaded_backends == [TorchRelevanceClassifier.BACKEND_NAME]
+
+    artifact_path.write_bytes(b"second export")
+    reference.scored_texts.clear()
+    assert component._guard_classifier_accuracy(backend, [], {}, step_parameters) is backend
+    assert loaded_backends == [TorchRelevanceClassifier.BACKEND_NAME] * 2
+    assert sorted(reference.scored_texts) == ["Data Engineer", "Повар"]
+
+
+def _build_source_data(salaries: List[str], load_dates: List[str]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Желаемая должность": ["Data Engineer"] * len(salaries),
+            "Искомая позиция": ["Data Engineer"] * len(salaries),
+            "ЗП": salaries,
+            "Возраст": ["31 год"] * len(salaries),
+            "pipeline_load_date": load_dates,
+        }
+    )
+
+
+def test_preprocessing_rebuilds_history_saved_before_salary_ranges(pipeline_component, classifier):
+    today = str(datetime.now().date())
+    data_controller = pipeline_component._data_controller
+    data_controller.save_dataset(
+        _build_source_data(["от 100 000 до 150 000 ₽", "200 000 ₽"], ["2024-01-01", today]),
+        DatasetName.SOURCE_DATA,
+    )
+    data_controller.save_dataset(
+        pd.DataFrame({"Искомая позиция": ["Data Engineer"], "ЗП": [100000150000], "Возраст": [31]}),
+        DatasetName.PREPROCESSED_DATA,
+    )
+
+    pipeline_component.preprocess_data()
+
+    preprocessed_data = data_controller.get_dataset(DatasetName.PREPROCESSED_DATA)
+    assert preprocessed_data["ЗП"].tolist() == [125000, 200000]
+    assert preprocessed_data["ЗП от"].tolist() == [100000, 200000]
+    assert preprocessed_data["Валюта ЗП"].tolist() == ["RUB", "RUB"]
+
+
+def test_preprocessing_appends_increment_to_history_in_current_schema(pipeline_component, classifier):
+    today = str(datetime.now().date())
+    data_controller = pipeline_component._data_controller
+    data_controller.save_dataset(
+        _build_source_data(["от 100 000 до 150 000 ₽", "200 000 ₽"], ["2024-01-01", today]),
+        DatasetName.SOURCE_DATA,
+    )
+    data_controller.save_dataset(pd.DataFrame(), DatasetName.PREPROCESSED_DATA)
+    pipeline_component.preprocess_data()
+    history = data_controller.get_dataset(DatasetName.PREPROCESSED_DATA)
+    data_controller.save_dataset(
+        _build_source_data(["от 100 000 до 150 000 ₽", "до 90 000 ₽", "от 50 000 $"], ["2024-01-01", today, today]),
+        DatasetName.SOURCE_DATA,
+    )
+
+    pipeline_component.preprocess_data()
+
+    preprocessed_data = data_controller.get_dataset(DatasetName.PREPROCESSED_DATA)
+    assert list(preprocessed_data.columns) == list(history.columns)
+    assert preprocessed_data["ЗП"].tolist() == [125000, 200000, 90000, 50000]
+    assert preprocessed_data["Валюта ЗП"].tolist()[-2:] == ["RUB", "USD"]
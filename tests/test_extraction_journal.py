@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from src.pipeline.data_extracting_components.component_sources import ExtractionJournal
+
+EXTRACTION_DATE = datetime(2024, 5, 12, 10, 30)
+WATERMARKS = {"superjob": {"Data Engineer": datetime(2024, 5, 1)}}
+CARD = {"Ссылка на резюме": "https://example.org/resume/1.html", "Дата обновления резюме": datetime(2024, 5, 10)}
+RESUME = {"Желаемая должность": "Data Engineer", "Дата обновления резюме": datetime(2024, 5, 10)}
+
+
+def _write_run(journal: ExtractionJournal) -> None:
+    journal.start_run(EXTRACTION_DATE, WATERMARKS)
+    journal.record_search_pages([("https://example.org/search?page=1", [CARD])])
+    journal.record_position("Data Engineer", [CARD["Ссылка на резюме"]], 1)
+    journal.record_resumes([(CARD["Ссылка на резюме"], RESUME)])
+
+
+def test_restored_journal_replays_recorded_run(tmp_path):
+    journal_path = tmp_path / "journal.jsonl"
+    journal = ExtractionJournal(journal_path)
+    _write_run(journal)
+    committed_chunk = journal.record_chunk_started([("1", "Data Engineer", "2024-05-12")])
+    journal.record_chunk_committed(committed_chunk)
+    journal.record_chunk_started([("2", "Data Engineer", "2024-05-12")])
+    journal.close()
+
+    restored = ExtractionJournal(journal_path)
+
+    assert restored.is_restored
+    assert restored.start_run(datetime(2024, 6, 1), {}) == (EXTRACTION_DATE, WATERMARKS)
+    assert restored.search_pages == {"https://example.org/search?page=1": [CARD]}
+    assert restored.position_resume_urls == {"Data Engineer": [CARD["Ссылка на резюме"]]}
+    assert restored.position_pages == {"Data Engineer": 1}
+    assert restored.resumes == {CARD["Ссылка на резюме"]: RESUME}
+    assert restored.committed_rows == {("1", "Data Engineer", "2024-05-12")}
+    assert restored.uncommitted_rows == {("2", "Data Engineer", "2024-05-12")}
+    assert restored.record_chunk_started([]) == 2
+
+
+def test_torn_last_entry_is_dropped(tmp_path):
+    journal_path = tmp_path / "journal.jsonl"
+    journal = ExtractionJournal(journal_path)
+    _write_run(journal)
+    journal.close()
+    with open(journal_path, "a", encoding="utf-8") as fout:
+        fout.write('{"type": "resume_parsed", "url": "https://example.org/resume/2.ht')
+
+    restored = ExtractionJournal(journal_path)
+    restored.close()
+
+    assert list(restored.resumes) == [CARD["Ссылка на резюме"]]
+    assert journal_path.read_text(encoding="utf-8").endswith("\n")
+
+
+def test_completed_journal_is_removed(tmp_path):
+    journal_path = tmp_path / "journal.jsonl"
+    journal = ExtractionJournal(journal_path)
+    _write_run(journal)
+    journal.complete()
+
+    assert not journal_path.exists()
+    assert not ExtractionJournal(journal_path).is_restored
+
+
+def test_journal_without_path_keeps_state_in_memory():
+    journal = ExtractionJournal()
+    _write_run(journal)
+
+    assert not ExtractionJournal().is_restored
+    assert journal.resumes == {CARD["Ссылка на резюме"]: RESUME}
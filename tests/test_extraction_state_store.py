@@ -0,0 +1,60 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.pipeline.data_extracting_components.component_sources import (
+    ExtractionStateStore,
+    PositionWatermark,
+    PositionYield,
+)
+from src.utils.exceptions import ServiceError
+
+WATERMARKS = {
+    "superjob": {"Data Engineer": PositionWatermark(datetime(2024, 5, 12), "https://example.org/resume/1.html")},
+    "archive": {"ML Engineer": PositionWatermark(datetime(2024, 4, 1, 8, 30), "https://example.org/resume/2.html")},
+}
+YIELDS = {"superjob": {"Data Engineer": PositionYield(3.25, datetime(2024, 5, 12, 9))}}
+
+
+def test_missing_state_file_is_empty(tmp_path):
+    store = ExtractionStateStore(tmp_path / "state.json")
+
+    assert not store.exists
+    assert store.load() == {}
+    assert store.load_yields() == {}
+
+
+def test_state_round_trip(tmp_path):
+    store = ExtractionStateStore(tmp_path / "interim" / "state.json")
+    store.save(WATERMARKS, YIELDS)
+
+    assert store.exists
+    assert store.load() == WATERMARKS
+    assert store.load_yields() == {**YIELDS, "archive": {}}
+
+
+def test_save_without_yields_keeps_saved_yields(tmp_path):
+    store = ExtractionStateStore(tmp_path / "state.json")
+    store.save(WATERMARKS, YIELDS)
+
+    store.save({"superjob": {}})
+
+    assert store.load() == {"superjob": {}, "archive": {}}
+    assert store.load_yields() == {**YIELDS, "archive": {}}
+
+
+def test_unknown_version_is_rejected(tmp_path):
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({"version": 3, "sources": {}}), encoding="utf-8")
+
+    with pytest.raises(ServiceError):
+        ExtractionStateStore(state_path).load()
+
+
+def test_damaged_state_is_rejected(tmp_path):
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({"version": 1, "sources": {"superjob": {"positions": {"x": {}}}}}))
+
+    with pytest.raises(ServiceError):
+        ExtractionStateStore(state_path).load()
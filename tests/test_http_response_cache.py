@@ -0,0 +1,35 @@
+import sqlite3
+
+from src.pipeline.data_extracting_components.component_sources import HttpResponseCache
+
+URL = "https://example.org/resume/1.html"
+
+
+def _count_blobs(cache_dir) -> int:
+    return sum(1 for path in (cache_dir / "blobs").rglob("*") if path.is_file())
+
+
+def test_replaced_and_evicted_bodies_are_removed(tmp_path):
+    cache = HttpResponseCache(tmp_path, max_size_bytes=15, ttl_seconds=60)
+    cache.store(URL, "first", {})
+    cache.store("https://example.org/resume/2.html", "first", {})
+    cache.store(URL, "second", {})
+
+    assert cache.lookup(URL).text == "second"
+    assert _count_blobs(tmp_path) == 2
+
+    cache.store("https://example.org/resume/3.html", "third", {})
+
+    assert cache.lookup("https://example.org/resume/2.html") is None
+    assert _count_blobs(tmp_path) == 2
+    cache.close()
+
+
+def test_body_references_are_looked_up_by_index(tmp_path):
+    HttpResponseCache(tmp_path, max_size_bytes=1024, ttl_seconds=60).close()
+
+    with sqlite3.connect(tmp_path / "index.sqlite") as connection:
+        plan = connection.execute("EXPLAIN QUERY PLAN SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", ("x",))
+        details = " ".join(row[-1] for row in plan)
+
+    assert "entries_body_hash" in details
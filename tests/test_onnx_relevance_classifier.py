@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.pipeline.data_preprocessing_components.component_sources import (
+    OnnxRelevanceClassifier,
+    TorchRelevanceClassifier,
+)
+from src.utils.exceptions import ServiceError
+
+MODEL_NAME = "tiny-nli"
+VOCABULARY = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "this", "example", "is", "data", "engineer", "analyst", "."]
+TEXTS = ["Data Engineer", "Senior data engineer", "Analyst", "Повар"]
+LABELS = ["Data Engineer", "Data Engineer", "Data Analyst", "Data Engineer"]
+
+
+@pytest.fixture
+def model_path(tmp_path) -> Path:
+    """
+    Маленькая NLI-модель со случайными весами: сверяются бэкенды, а не качество классификации.
+    """
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+    model_path = tmp_path / "snapshot"
+    model_path.mkdir()
+    vocabulary_path = tmp_path / "vocab.txt"
+    vocabulary_path.write_text("\n".join(VOCABULARY), encoding="utf-8")
+
+    id2label = {0: "entailment", 1: "neutral", 2: "contradiction"}
+    config = transformers.BertConfig(
+        vocab_size=len(VOCABULARY),
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=64,
+        id2label=id2label,
+        label2id={label: index for index, label in id2label.items()},
+    )
+    torch.manual_seed(0)
+    transformers.BertForSequenceClassification(config).save_pretrained(model_path, safe_serialization=True)
+    transformers.BertTokenizerFast(str(vocabulary_path)).save_pretrained(model_path)
+    return model_path
+
+
+def test_missing_onnxruntime_names_the_extra(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "onnxruntime", None)
+
+    with pytest.raises(ServiceError, match="extras onnx"):
+        OnnxRelevanceClassifier(MODEL_NAME, tmp_path, batch_size=2, model_dir=tmp_path / "onnx", quantize=False)
+
+
+def test_onnx_scores_match_torch(model_path, tmp_path):
+    pytest.importorskip("onnxruntime")
+    torch_classifier = TorchRelevanceClassifier(MODEL_NAME, model_path, batch_size=2, device="cpu")
+    onnx_classifier = OnnxRelevanceClassifier(
+        MODEL_NAME, model_path, batch_size=2, model_dir=tmp_path / "onnx", quantize=False
+    )
+
+    np.testing.assert_allclose(onnx_classifier.score(TEXTS, LABELS), torch_classifier.score(TEXTS, LABELS), atol=1e-4)
@@ -0,0 +1,41 @@
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from src.pipeline.data_extracting_components.component_sources import RawHtmlArchive, raw_html_archive
+from src.utils.exceptions import ServiceError
+
+PAGES = {f"https://example.org/resume/{index}.html": f"<html>резюме {index}</html>" * 50 for index in range(5)}
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = RawHtmlArchive(tmp_path, segment_max_bytes=1, compression_level=3)
+    for url, text in PAGES.items():
+        archive.append(url, datetime(2024, 5, 12), text)
+    yield archive
+    archive.close()
+
+
+def test_pages_are_read_back_from_segments(archive, tmp_path):
+    pages = archive.list_pages()
+
+    assert {page.url: RawHtmlArchive.read_page(tmp_path, page) for page in pages} == PAGES
+    assert len({page.segment for page in pages}) == len(PAGES)
+    assert archive.list_pages(datetime(2024, 5, 13)) == []
+
+
+def test_page_with_missing_codec_package_is_rejected(archive, tmp_path, monkeypatch):
+    monkeypatch.setattr(raw_html_archive, "zstandard", None)
+    page = replace(archive.list_pages()[0], codec="zstd")
+
+    with pytest.raises(ServiceError, match="zstandard"):
+        RawHtmlArchive.read_page(tmp_path, page)
+
+
+def test_page_with_unknown_codec_is_rejected(archive, tmp_path):
+    page = replace(archive.list_pages()[0], codec="brotli")
+
+    with pytest.raises(ServiceError):
+        RawHtmlArchive.read_page(tmp_path, page)
@@ -0,0 +1,53 @@
+import pytest
+
+from src.pipeline.data_preprocessing_components.component_sources import RelevanceScoreCache
+
+MODEL_ID = "model|This example is {}.|torch"
+SCORES = {("data engineer", "Data Engineer"): 0.97, ("повар", "Data Engineer"): 0.02}
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "interim" / "relevance_scores.sqlite"
+
+
+def test_normalize_title_ignores_case_and_whitespace():
+    assert RelevanceScoreCache.normalize_title("  Senior\tData  ENGINEER ") == "senior data engineer"
+
+
+def test_scores_are_served_from_memory_then_from_disk(cache_path):
+    cache = RelevanceScoreCache(cache_path, MODEL_ID, lru_size=10)
+    cache.put_many(SCORES)
+
+    assert cache.get_many([*SCORES, ("аналитик", "Data Engineer")]) == SCORES
+    assert cache.statistics == {"memory_hits": 2, "disk_hits": 0, "misses": 1, "hit_rate": 0.6667}
+    cache.close()
+
+    reopened = RelevanceScoreCache(cache_path, MODEL_ID, lru_size=10)
+    assert reopened.get_many(SCORES) == SCORES
+    assert reopened.statistics["disk_hits"] == 2
+    reopened.close()
+
+
+def test_lru_keeps_only_recent_keys_in_memory(cache_path):
+    cache = RelevanceScoreCache(cache_path, MODEL_ID, lru_size=1)
+    cache.put_many(SCORES)
+
+    assert cache.get_many(SCORES) == SCORES
+    assert cache.statistics["memory_hits"] == 1
+    assert cache.statistics["disk_hits"] == 1
+    cache.close()
+
+
+def test_changing_model_clears_the_cache(cache_path):
+    cache = RelevanceScoreCache(cache_path, MODEL_ID, lru_size=10)
+    cache.put_many(SCORES)
+    cache.close()
+
+    other_model_cache = RelevanceScoreCache(cache_path, "model|This example is {}.|onnx", lru_size=10)
+    assert other_model_cache.get_many(SCORES) == {}
+    other_model_cache.close()
+
+    reopened = RelevanceScoreCache(cache_path, MODEL_ID, lru_size=10)
+    assert reopened.get_many(SCORES) == {}
+    reopened.close()
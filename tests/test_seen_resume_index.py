@@ -0,0 +1,106 @@
+from datetime import date
+
+from src.pipeline.data_extracting_components.component_sources import BloomFilter, SeenResumeIndex
+
+URLS = [f"https://example.org/resume/{index}.html" for index in range(200)]
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom_filter = BloomFilter.for_capacity(len(URLS), 0.01)
+    for url in URLS:
+        bloom_filter.add(url)
+
+    assert all(url in bloom_filter for url in URLS)
+    assert bloom_filter.items_count == len(URLS)
+
+
+def test_bloom_filter_counts_each_key_once():
+    bloom_filter = BloomFilter.for_capacity(len(URLS), 0.01)
+
+    assert bloom_filter.add(URLS[0])
+    assert not bloom_filter.add(URLS[0])
+    assert bloom_filter.items_count == 1
+
+
+def test_bloom_filter_false_positive_rate_stays_near_target():
+    bloom_filter = BloomFilter.for_capacity(1000, 0.01)
+    for index in range(1000):
+        bloom_filter.add(f"seen-{index}")
+
+    false_positives = sum(f"unseen-{index}" in bloom_filter for index in range(10_000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_save_and_load_round_trip(tmp_path):
+    bloom_filter = BloomFilter.for_capacity(len(URLS), 0.01)
+    for url in URLS[:50]:
+        bloom_filter.add(url)
+    bloom_filter.save(tmp_path / "urls.bloom")
+
+    loaded = BloomFilter.load(tmp_path / "urls.bloom")
+
+    assert (loaded.size_bits, loaded.hash_count, loaded.items_count) == (
+        bloom_filter.size_bits,
+        bloom_filter.hash_count,
+        50,
+    )
+    assert [url in loaded for url in URLS] == [url in bloom_filter for url in URLS]
+
+
+def test_seen_index_matches_url_and_update_date(tmp_path):
+    index = SeenResumeIndex(tmp_path, expected_resumes=100, false_positive_rate=0.01)
+    index.add_many([(URLS[0], date(2024, 5, 1))], run="first")
+
+    assert index.contains(URLS[0], date(2024, 5, 1), ignored_run="second")
+    assert not index.contains(URLS[0], date(2024, 5, 2), ignored_run="second")
+    assert not index.contains(URLS[1], date(2024, 5, 1), ignored_run="second")
+    index.close()
+
+
+def test_seen_index_ignores_keys_of_the_current_run(tmp_path):
+    index = SeenResumeIndex(tmp_path, expected_resumes=100, false_positive_rate=0.01)
+    index.add_many([(URLS[0], date(2024, 5, 1))], run="first")
+
+    assert not index.contains(URLS[0], date(2024, 5, 1), ignored_run="first")
+    index.close()
+
+
+def test_seen_index_survives_reopen_and_bloom_filter_growth(tmp_path):
+    index = SeenResumeIndex(tmp_path, expected_resumes=10, false_positive_rate=0.01)
+    index.add_many([(url, date(2024, 5, 1)) for url in URLS], run="first")
+    index.close()
+
+    reopened = SeenResumeIndex(tmp_path, expected_resumes=10, false_positive_rate=0.01)
+
+    assert not reopened.is_empty
+    assert all(reopened.contains(url, date(2024, 5, 1), ignored_run="second") for url in URLS)
+    reopened.clear()
+    assert reopened.is_empty
+    assert not reopened.contains(URLS[0], date(2024, 5, 1), ignored_run="second")
+    reopened.close()
+
+
+def test_seen_index_rebuilds_damaged_bloom_filter(tmp_path):
+    index = SeenResumeIndex(tmp_path, expected_resumes=100, false_positive_rate=0.01)
+    index.add_many([(URLS[0], date(2024, 5, 1))], run="first")
+    index.close()
+    (tmp_path / "urls.bloom").write_bytes(b"broken")
+
+    reopened = SeenResumeIndex(tmp_path, expected_resumes=100, false_positive_rate=0.01)
+
+    assert reopened.contains(URLS[0], date(2024, 5, 1), ignored_run="second")
+    reopened.close()
+
+
+def test_adding_the_same_keys_again_does_not_rebuild_the_bloom_filter(tmp_path):
+    keys = [(url, date(2024, 5, 1)) for url in URLS[:10]]
+    index = SeenResumeIndex(tmp_path, expected_resumes=10, false_positive_rate=0.01)
+    index.add_many(keys, run="first")
+    bloom_filter_size = (tmp_path / "urls.bloom").stat().st_size
+
+    index.add_many(keys, run="first")
+    index.add_many(keys, run="second")
+
+    assert (tmp_path / "urls.bloom").stat().st_size == bloom_filter_size
+    assert BloomFilter.load(tmp_path / "urls.bloom").items_count == len(keys)
+    index.close()
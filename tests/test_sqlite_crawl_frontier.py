@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from src.pipeline.data_extracting_components.component_sources import SqliteCrawlFrontier
+
+SOURCE, RUN, KIND = "superjob", "run-1", "resume"
+LEASE_SECONDS = 0.05
+
+
+@pytest.fixture
+def frontier(tmp_path):
+    frontier = SqliteCrawlFrontier(tmp_path / "frontier.sqlite", lease_seconds=LEASE_SECONDS, max_attempts=2)
+    frontier.open_run(SOURCE, RUN, {"positions": ["Data Engineer"]})
+    frontier.add_tasks(SOURCE, RUN, KIND, [("b", {"page": 2}, 1), ("a", {"page": 1}, 0)])
+    yield frontier
+    frontier.close()
+
+
+def _wait_for_lease_expiry() -> None:
+    time.sleep(LEASE_SECONDS * 2)
+
+
+def test_tasks_are_leased_by_priority_and_only_once(frontier):
+    first_lease = frontier.lease(SOURCE, RUN, "worker-1", limit=1)
+    second_lease = frontier.lease(SOURCE, RUN, "worker-2", limit=10)
+
+    assert [(task.key, task.payload, task.attempts) for task in first_lease] == [("a", {"page": 1}, 1)]
+    assert [task.key for task in second_lease] == ["b"]
+    assert frontier.lease(SOURCE, RUN, "worker-3", limit=10) == []
+
+
+def test_expired_lease_is_given_to_another_worker(frontier):
+    (task,) = frontier.lease(SOURCE, RUN, "worker-1", limit=1)
+    _wait_for_lease_expiry()
+
+    released = frontier.lease(SOURCE, RUN, "worker-2", limit=10)
+
+    assert [(released_task.key, released_task.attempts) for released_task in released] == [("a", 2), ("b", 1)]
+
+
+def test_complete_accepts_only_the_first_result(frontier):
+    (stale_task,) = frontier.lease(SOURCE, RUN, "worker-1", limit=1)
+    _wait_for_lease_expiry()
+    (task,) = frontier.lease(SOURCE, RUN, "worker-2", limit=1)
+
+    assert frontier.complete(task, {"cards": 10}, cancelled_keys=["b"])
+    assert not frontier.complete(stale_task, {"cards": 0})
+    assert frontier.is_drained(SOURCE, RUN, KIND)
+    assert list(frontier.get_results(SOURCE, RUN, KIND)) == [("a", {"page": 1}, {"cards": 10}, True)]
+
+
+def test_failed_task_is_retried_until_max_attempts(frontier):
+    (task,) = frontier.lease(SOURCE, RUN, "worker-1", limit=1)
+    frontier.fail(task, "worker-1", "timeout")
+    (retried_task,) = frontier.lease(SOURCE, RUN, "worker-1", limit=1)
+    frontier.fail(retried_task, "worker-1", "timeout")
+
+    assert retried_task.key == "a"
+    assert [task.key for task in frontier.lease(SOURCE, RUN, "worker-1", limit=10)] == ["b"]
+    assert list(frontier.get_results(SOURCE, RUN, KIND)) == [("a", {"page": 1}, "timeout", False)]
+
+
+def test_expired_lease_after_max_attempts_fails_the_task(frontier):
+    frontier.lease(SOURCE, RUN, "worker-1", limit=1)
+    _wait_for_lease_expiry()
+    frontier.lease(SOURCE, RUN, "worker-2", limit=1)
+    _wait_for_lease_expiry()
+
+    assert [task.key for task in frontier.lease(SOURCE, RUN, "worker-3", limit=10)] == ["b"]
+    assert frontier.get_statistics(SOURCE, RUN) == {f"{KIND}_failed": 1, f"{KIND}_leased": 1}
+
+
+def test_fail_from_worker_without_lease_is_ignored(frontier):
+    (stale_task,) = frontier.lease(SOURCE, RUN, "worker-1", limit=1)
+    _wait_for_lease_expiry()
+    frontier.lease(SOURCE, RUN, "worker-2", limit=1)
+
+    frontier.fail(stale_task, "worker-1", "timeout")
+
+    assert frontier.get_statistics(SOURCE, RUN) == {f"{KIND}_leased": 1, f"{KIND}_pending": 1}
+
+
+def test_closed_run_is_not_open_and_has_no_tasks(frontier):
+    assert frontier.get_open_run(SOURCE) == (RUN, {"positions": ["Data Engineer"]})
+
+    frontier.close_run(SOURCE, RUN)
+
+    assert frontier.get_open_run(SOURCE) is None
+    assert frontier.lease(SOURCE, RUN, "worker-1", limit=10) == []
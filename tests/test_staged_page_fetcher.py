@@ -0,0 +1,62 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import pytest
+
+from src.pipeline.data_extracting_components.component_sources import StagedPageFetcher
+
+URLS = [f"http://host-{index % 2}/resume/{index}.html" for index in range(12)]
+
+
+def _fetch(url: str) -> Optional[str]:
+    if url.endswith("/3.html"):
+        raise ConnectionError(url)
+
+    if url.endswith("/5.html"):
+        return None
+
+    return url
+
+
+def _parse(html: str) -> str:
+    if html.endswith("/7.html"):
+        raise ValueError(html)
+
+    return html.upper()
+
+
+def _crash_worker(html: str) -> str:
+    os._exit(1)
+
+
+def _create_fetcher(parse_function, parse_executor) -> StagedPageFetcher:
+    return StagedPageFetcher(
+        _fetch,
+        parse_function,
+        parse_executor,
+        parse_workers=2,
+        max_in_flight_requests=4,
+        max_requests_per_host=2,
+        parse_queue_size=2,
+    )
+
+
+def test_results_keep_input_order_and_page_errors():
+    with ThreadPoolExecutor(max_workers=2) as parse_executor:
+        results = _create_fetcher(_parse, parse_executor).process_all(URLS)
+
+    assert isinstance(results[3], ConnectionError)
+    assert results[5] is None
+    assert isinstance(results[7], ValueError)
+    assert results[0] == URLS[0].upper()
+    assert [result for index, result in enumerate(results) if index not in (3, 5, 7)] == [
+        url.upper() for index, url in enumerate(URLS) if index not in (3, 5, 7)
+    ]
+
+
+def test_broken_process_pool_is_raised():
+    with ProcessPoolExecutor(max_workers=1) as parse_executor:
+        with pytest.raises(BrokenProcessPool):
+            _create_fetcher(_crash_worker, parse_executor).process_all(URLS)
@@ -0,0 +1,128 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.pipeline.data_extracting_components.component_sources import (
+    ContainerSelector,
+    FieldSelector,
+    SelectorTableParser,
+)
+from src.pipeline.data_extracting_components.get_data_from_superjob import (
+    RESUME_PAGE_CONTAINERS,
+    RESUME_PAGE_FIELDS,
+    SEARCH_PAGE_CONTAINERS,
+    SEARCH_PAGE_FIELDS,
+    parse_resume_cards,
+    parse_resume_page,
+)
+from src.utils.exceptions import ServiceError
+
+PAGES_DIR = Path(__file__).parent / "fixtures" / "superjob"
+BACKENDS = ["selectolax", "lxml", "html.parser"]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    try:
+        SelectorTableParser({}, {}, request.param)
+    except ServiceError:
+        pytest.skip(f"HTML-парсер {request.param} не установлен")
+
+    return request.param
+
+
+def _read_page(name: str) -> str:
+    return (PAGES_DIR / name).read_text(encoding="utf-8")
+
+
+def test_selector_table_parser_scopes_fields_to_containers(backend):
+    html = """
+    <div class="item"><a class="link" href="/1">first</a><a class="link" href="/2">second</a></div>
+    <div class="item"><span class="note">no link</span></div>
+    <div class="item"><a class="link" href="/3">third</a></div>
+    <a class="link" href="/outside">outside</a>
+    """
+    parser = SelectorTableParser(
+        {"item": ContainerSelector("div", "item", each=True)},
+        {
+            "link": FieldSelector("a", "link", container="item"),
+            "all_links": FieldSelector("a", "link", many=True),
+        },
+        backend,
+    )
+
+    elements = parser.parse(html)
+
+    assert [(element.text, element.container_index) for element in elements["link"]] == [("first", 0), ("third", 2)]
+    assert elements["link"][0].attributes["href"] == "/1"
+    assert [element.text for element in elements["all_links"]] == ["first", "second", "third", "outside"]
+
+
+def test_selector_table_parser_matches_multi_class_selectors_exactly(backend):
+    html = '<span class="a  b">exact</span><span class="a b c">wider</span><span class="b">token</span>'
+    parser = SelectorTableParser(
+        {},
+        {"pair": FieldSelector("span", "a b", many=True), "token": FieldSelector("span", "b", many=True)},
+        backend,
+    )
+
+    elements = parser.parse(html)
+
+    assert [element.text for element in elements["pair"]] == ["exact"]
+    assert [element.text for element in elements["token"]] == ["exact", "wider", "token"]
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ServiceError):
+        SelectorTableParser({}, {}, "regex")
+
+
+def test_parse_resume_cards_from_saved_search_page(backend):
+    parser = SelectorTableParser(SEARCH_PAGE_CONTAINERS, SEARCH_PAGE_FIELDS, backend)
+
+    cards = parse_resume_cards(_read_page("search_page.html"), parser, base_url="https://example.org")
+
+    assert cards == [
+        {
+            "Ссылка на резюме": "https://example.org/resume/data-engineer-101.html",
+            "Желаемая должность": "Data Engineer",
+            "ЗП": "150 000 ₽",
+            "Возраст": "31 год",
+            "Город": "Москва",
+            "Дата обновления резюме": datetime(2024, 5, 12),
+        },
+        {
+            "Ссылка на резюме": "https://example.org/resume/analitik-dannyh-102.html",
+            "Желаемая должность": "Аналитик данных",
+            "Город": "Казань",
+        },
+    ]
+
+
+def test_parse_resume_page_from_saved_page(backend):
+    parser = SelectorTableParser(RESUME_PAGE_CONTAINERS, RESUME_PAGE_FIELDS, backend)
+
+    record = parse_resume_page(_read_page("resume_page.html"), parser)
+
+    assert record == {
+        "Дата обновления резюме": datetime(2024, 1, 3),
+        "Возраст": "31 год",
+        "ЗП": "от 150 000 ₽",
+        "Желаемая должность": "Data Engineer",
+        "Город": "Москва",
+        "Условия работы": "не готов к переезду, готов к командировкам",
+        "Занятость": "Полный рабочий день",
+        "Навыки": "Python, SQL",
+        "Последнее/текущее место работы": "ООО Ромашка",
+        "Последняя/текущая должность": "Инженер данных",
+        "Образование и ВУЗ": "МФТИ",
+    }
+
+
+def test_parse_resume_page_without_updating_date_fails(backend):
+    parser = SelectorTableParser(RESUME_PAGE_CONTAINERS, RESUME_PAGE_FIELDS, backend)
+    html = _read_page("resume_page.html").replace('<span class="_1vAof _38Lv- _3fAzh _3L1uo">3 января 2024</span>', "")
+
+    with pytest.raises(ValueError):
+        parse_resume_page(html, parser)
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.text_normalization import (
+    UNPARSED_DATE,
+    get_representative_salary,
+    normalize_age,
+    normalize_salary,
+    parse_age,
+    parse_date,
+    parse_salary,
+)
+
+NOW = datetime(2024, 5, 12, 15, 40)
+
+
+@pytest.mark.parametrize(
+    "salary, expected",
+    [
+        ("от 100 000 до 150 000 ₽", (100_000.0, 150_000.0, "RUB")),
+        ("до 90\xa0000 руб.", (np.nan, 90_000.0, "RUB")),
+        ("от 50 000 $", (50_000.0, np.nan, "USD")),
+        ("120 тыс. ₽", (120_000.0, 120_000.0, "RUB")),
+        ("200 000 — 250 000 ₸", (200_000.0, 250_000.0, "KZT")),
+        ("По договорённости", (np.nan, np.nan, None)),
+    ],
+)
+def test_parse_salary(salary, expected):
+    salary_min, salary_max, currency = parse_salary(salary)
+
+    np.testing.assert_equal((salary_min, salary_max), expected[:2])
+    assert currency == expected[2]
+
+
+def test_normalize_salary_matches_scalar_parser_and_keeps_index():
+    salaries = pd.Series(
+        ["от 100 000 до 150 000 ₽", None, "до 90 000 руб.", "от 100 000 до 150 000 ₽"], index=[5, 6, 7, 8]
+    )
+
+    salary_bounds = normalize_salary(salaries)
+
+    assert list(salary_bounds.index) == [5, 6, 7, 8]
+    np.testing.assert_equal(salary_bounds["min"].to_numpy(), [100_000.0, np.nan, np.nan, 100_000.0])
+    np.testing.assert_equal(salary_bounds["max"].to_numpy(), [150_000.0, np.nan, 90_000.0, 150_000.0])
+    assert salary_bounds["currency"].tolist() == ["RUB", pd.NA, "RUB", "RUB"]
+    representative_salary = get_representative_salary(salary_bounds)
+    np.testing.assert_equal(representative_salary.to_numpy(), [125_000.0, np.nan, 90_000.0, 125_000.0])
+
+
+@pytest.mark.parametrize(
+    "age, expected",
+    [("35\xa0лет", 35.0), ("21 год", 21.0), ("42 года, родился 1 мая 1983", 42.0), ("", np.nan)],
+)
+def test_parse_age(age, expected):
+    np.testing.assert_equal(parse_age(age), expected)
+
+
+def test_normalize_age_returns_nullable_integers():
+    ages = normalize_age(pd.Series(["35 лет", None, "21 год", "не указан"]))
+
+    assert str(ages.dtype) == "Int64"
+    assert ages.tolist() == [35, pd.NA, 21, pd.NA]
+
+
+@pytest.mark.parametrize(
+    "date, expected",
+    [
+        ("3 января 2023", datetime(2023, 1, 3)),
+        ("12 мая", datetime(2024, 5, 12)),
+        ("20 декабря", datetime(2023, 12, 20)),
+        ("сегодня", NOW),
+        ("вчера в 14:05", datetime(2024, 5, 11, 14, 5)),
+        ("позавчера", datetime(2024, 5, 10, 15, 40)),
+        ("5 минут назад", datetime(2024, 5, 12, 15, 35)),
+        ("2 часа назад", datetime(2024, 5, 12, 13, 40)),
+        ("31 февраля", UNPARSED_DATE),
+        ("недавно", NOW),
+    ],
+)
+def test_parse_date(date, expected):
+    assert parse_date(date, NOW) == expected